@@ -0,0 +1,107 @@
+"""Attribute definitions (KDMA names and descriptions) read from decider configs.
+
+Decider configs keep `${ref:...}` interpolations that only align-system's ADM
+initialization understands. They are escaped before resolving instead of
+registering a global OmegaConf `ref` resolver, so lookups never touch
+process-wide OmegaConf state and are safe from any thread.
+
+Definitions whose only interpolations are whole-string `${adm...}` references
+are resolved here without importing OmegaConf, which keeps it out of startup
+for the default run; anything else is left to OmegaConf.
+"""
+
+import re
+from typing import Any, Dict, cast
+from align_app.utils.utils import BoundedCache
+from .config import decider_config_fingerprint, get_decider_config, _get_dataset_name
+
+# Resolved attribute_definitions per decider config
+ATTRIBUTE_DEFINITIONS_CACHE_SIZE = 64
+
+_REF = "${ref:"
+_ADM_REFERENCE = re.compile(r"\$\{adm\.([\w.]+)\}")
+# Reference chains longer than this are left to OmegaConf
+MAX_REFERENCE_DEPTH = 8
+
+_resolved = BoundedCache(ATTRIBUTE_DEFINITIONS_CACHE_SIZE)
+
+
+def _escape_refs(value: Any) -> Any:
+    if isinstance(value, str):
+        return value.replace(_REF, "\\" + _REF) if _REF in value else value
+    if isinstance(value, dict):
+        return {key: _escape_refs(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_escape_refs(item) for item in value]
+    return value
+
+
+class _NeedsOmegaConf(Exception):
+    """An interpolation the plain resolver does not handle."""
+
+
+def _resolve_plain(value: Any, config: Dict[str, Any], depth: int = 0) -> Any:
+    if depth > MAX_REFERENCE_DEPTH:
+        raise _NeedsOmegaConf
+    if isinstance(value, dict):
+        return {key: _resolve_plain(item, config, depth) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_resolve_plain(item, config, depth) for item in value]
+    if not isinstance(value, str) or "${" not in value:
+        return value
+    if value.startswith(_REF) and value.endswith("}") and value.count("${") == 1:
+        return value
+    match = _ADM_REFERENCE.fullmatch(value)
+    if not match:
+        raise _NeedsOmegaConf
+    target: Any = config
+    for key in match.group(1).split("."):
+        if not isinstance(target, dict) or key not in target:
+            raise _NeedsOmegaConf
+        target = target[key]
+    return _resolve_plain(target, config, depth + 1)
+
+
+def resolve_attribute_definitions(config: Dict[str, Any] | None) -> Dict[str, Any]:
+    """attribute_definitions of an ADM config with `${adm...}` references resolved.
+
+    Only that subtree is resolved, so unrelated unresolvable interpolations
+    elsewhere in the config do not matter. `${ref:...}` strings are kept as is.
+    """
+    if not config or "attribute_definitions" not in config:
+        return {}
+    try:
+        resolved = _resolve_plain(config["attribute_definitions"], config)
+        return resolved if isinstance(resolved, dict) else {}
+    except _NeedsOmegaConf:
+        pass
+    from omegaconf import OmegaConf
+
+    try:
+        root = OmegaConf.create({"adm": _escape_refs(config)})
+        resolved = OmegaConf.to_container(root.adm.attribute_definitions, resolve=True)
+    except Exception:
+        return {}
+    return cast(Dict[str, Any], resolved) if isinstance(resolved, dict) else {}
+
+
+def get_attribute_definitions(
+    probe_id: str,
+    decider: str,
+    all_deciders: Dict[str, Any],
+    datasets: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Resolved attribute_definitions for a decider, cached per decider config.
+
+    The returned dict is shared between callers and must not be modified.
+    """
+    decider_cfg = all_deciders.get(decider)
+    if not decider_cfg:
+        return {}
+    dataset_name = _get_dataset_name(probe_id, datasets)
+    return _resolved.get_or_compute(
+        decider_config_fingerprint(decider_cfg, dataset_name),
+        lambda: resolve_attribute_definitions(
+            get_decider_config(probe_id, all_deciders, datasets, decider)
+        ),
+    )
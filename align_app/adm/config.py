@@ -1,13 +1,15 @@
 from typing import Dict, Any
 import copy
+import hashlib
+import json
 from pathlib import Path
-import align_system
 from align_app.adm.hydra_config_loader import load_adm_config
 from align_app.adm.experiment_config_loader import load_experiment_adm_config
-from align_app.utils.utils import merge_dicts
+from align_app.utils.frozen import freeze
+from align_app.utils.utils import BoundedCache, merge_dicts, package_dir
 
 
-base_align_system_config_dir = Path(align_system.__file__).parent / "configs"
+base_align_system_config_dir = package_dir("align_system") / "configs"
 
 
 def _get_dataset_name(probe_id: str, datasets: Dict[str, Any]) -> str:
@@ -18,6 +20,28 @@ def _get_dataset_name(probe_id: str, datasets: Dict[str, Any]) -> str:
     raise ValueError(f"Dataset name for probe ID {probe_id} not found.")
 
 
+# Merged configs per (decider, entry and dataset fingerprint, llm_backbone)
+DECIDER_CONFIG_CACHE_SIZE = 128
+
+_merged_configs = BoundedCache(DECIDER_CONFIG_CACHE_SIZE)
+
+
+def config_fingerprint(value: Any) -> str:
+    """Stable hash of a JSON-like config value."""
+    encoded = json.dumps(value, sort_keys=True, default=str).encode()
+    return hashlib.sha1(encoded).hexdigest()
+
+
+def decider_config_fingerprint(decider_cfg: Dict[str, Any], dataset_name: str) -> str:
+    """Identify the config get_decider_config builds, without building it.
+
+    Registry entries are never changed once added (edits become new
+    deciders), so the entry's settings plus the dataset pin the config.
+    """
+    settings = {k: v for k, v in decider_cfg.items() if not callable(v)}
+    return config_fingerprint([settings, dataset_name])
+
+
 def get_decider_config(
     probe_id: str,
     all_deciders: Dict[str, Any],
@@ -32,6 +56,9 @@ def get_decider_config(
     For experiment configs (experiment_config: True), loads pre-resolved YAML directly.
     For edited configs (edited_config: True), returns the stored resolved_config directly.
 
+    Merged configs are memoized and returned as shared read-only views
+    (FrozenDict); copy.deepcopy() one before changing it.
+
     Args:
         probe_id: The probe ID to get config for
         all_deciders: Dict of all available deciders
@@ -45,6 +72,16 @@ def get_decider_config(
     if not decider_cfg:
         return None
 
+    key = (decider, decider_config_fingerprint(decider_cfg, dataset_name), llm_backbone)
+    return _merged_configs.get_or_compute(
+        key,
+        lambda: freeze(_build_decider_config(decider_cfg, dataset_name, llm_backbone)),
+    )
+
+
+def _build_decider_config(
+    decider_cfg: Dict[str, Any], dataset_name: str, llm_backbone: str | None
+) -> Dict[str, Any]:
     is_edited_config = decider_cfg.get("edited_config", False)
     is_experiment_config = decider_cfg.get("experiment_config", False)
 
@@ -71,10 +108,8 @@ def get_decider_config(
     config_overrides = decider_cfg.get("config_overrides", {})
     dataset_overrides = decider_cfg.get("dataset_overrides", {}).get(dataset_name, {})
 
-    # Deep merge: base + config_overrides + dataset_overrides
-    merged_config = copy.deepcopy(decider_base)
-    merged_config = merge_dicts(merged_config, config_overrides)
-    merged_config = merge_dicts(merged_config, dataset_overrides)
+    # Deep merge: base + config_overrides + dataset_overrides (one copy of base)
+    merged_config = merge_dicts(decider_base, config_overrides, dataset_overrides)
 
     if llm_backbone and "structured_inference_engine" in merged_config:
         merged_config["structured_inference_engine"]["model_name"] = llm_backbone
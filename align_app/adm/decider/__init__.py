@@ -1,12 +1,37 @@
 from align_utils.models import ADMResult, Decision, ChoiceInfo
-from .decider import MultiprocessDecider
-from .client import get_decision, get_model_cache_status
-from .types import DeciderParams
+from .decider import MultiprocessDecider, DecisionCancelled
+from .client import (
+    cancel_decision,
+    configure_decider,
+    get_decision,
+    get_decisions,
+    get_metrics,
+    render_metrics,
+    get_model_cache_status,
+    get_resident_models,
+    warm_up,
+)
+from .model_cache import ModelCacheLimits, ModelCacheStatus
+from .progress import ProgressEvent, ProgressKind
+from .types import DeciderParams, RequestPriority
 
 __all__ = [
     "MultiprocessDecider",
     "get_decision",
+    "get_decisions",
+    "get_metrics",
+    "render_metrics",
+    "cancel_decision",
+    "DecisionCancelled",
+    "RequestPriority",
     "get_model_cache_status",
+    "get_resident_models",
+    "warm_up",
+    "configure_decider",
+    "ModelCacheLimits",
+    "ModelCacheStatus",
+    "ProgressEvent",
+    "ProgressKind",
     "DeciderParams",
     "ADMResult",
     "Decision",
@@ -4,34 +4,128 @@ Provides a convenient get_decision() function that manages a singleton Multiproc
 """
 
 import atexit
-from typing import Dict, Any
+from typing import Callable, Dict, Any, Iterable, List, Optional, Union
 from align_utils.models import ADMResult
 from .decider import MultiprocessDecider
+from .metrics import MetricsRegistry
+from .model_cache import ModelCacheLimits, ModelCacheStatus
 from .worker import CacheQueryResult
-from .types import DeciderParams
+from .progress import ProgressEvent
+from .types import DeciderParams, RequestPriority
 
 _decider = None
+_cache_limits: Optional[ModelCacheLimits] = None
+_num_workers = 1
+
+
+def configure_decider(
+    cache_limits: Optional[ModelCacheLimits] = None, num_workers: int = 1
+):
+    """Set options for the singleton decider.
+
+    Restarts the workers if they are already running, dropping loaded models.
+    """
+    global _cache_limits, _num_workers
+    _cache_limits = cache_limits
+    _num_workers = max(1, num_workers)
+    cleanup()
 
 
 def _get_process_manager():
     """Get or create the process manager singleton"""
     global _decider
     if _decider is None:
-        _decider = MultiprocessDecider()
+        _decider = MultiprocessDecider(
+            cache_limits=_cache_limits, num_workers=_num_workers
+        )
     return _decider
 
 
-async def get_decision(params: DeciderParams) -> ADMResult:
+async def get_decision(
+    params: DeciderParams,
+    priority: int = RequestPriority.INTERACTIVE,
+    request_id: Optional[str] = None,
+    on_progress: Optional[Callable[[ProgressEvent], None]] = None,
+) -> ADMResult:
     """Get a decision using DeciderParams.
 
     Args:
         params: DeciderParams with scenario_input, alignment_target, resolved_config
+        priority: Worker queue priority, lower values run first
+        request_id: Optional ID to cancel_decision() with while still queued
+        on_progress: Called with ProgressEvents (model load, pipeline steps,
+            generated text) while the decision runs
 
     Returns:
         ADMResult with decision and choice_info
+
+    Raises:
+        DecisionCancelled: If the request was cancelled before it started
+    """
+    process_manager = _get_process_manager()
+    return await process_manager.get_decision(params, priority, request_id, on_progress)
+
+
+async def get_decisions(
+    params_list: List[DeciderParams],
+    return_exceptions: bool = False,
+    priority: int = RequestPriority.BACKGROUND,
+    request_id: Optional[str] = None,
+) -> List[Union[ADMResult, RuntimeError]]:
+    """Get decisions for many DeciderParams in as few worker round-trips as possible.
+
+    Args:
+        params_list: DeciderParams to decide, possibly with different configs
+        return_exceptions: Return failures in place instead of raising the first
+        priority: Worker queue priority, defaults behind interactive requests
+        request_id: Optional ID to cancel_decision() with while still queued
+
+    Returns:
+        ADMResults (or RuntimeErrors) in the same order as params_list
+    """
+    process_manager = _get_process_manager()
+    return await process_manager.get_decisions(
+        params_list, return_exceptions, priority, request_id
+    )
+
+
+async def warm_up(
+    resolved_config: Dict[str, Any],
+    owner: Optional[str] = None,
+    needed: Iterable[Dict[str, Any]] = (),
+) -> bool:
+    """Start loading the model for resolved_config at the lowest priority.
+
+    Args:
+        resolved_config: Config of the model to load
+        owner: Warm-ups sharing an owner replace each other (e.g. one UI session)
+        needed: Configs of other runs whose models must not be evicted
+
+    Returns:
+        True once the model is resident, False if skipped, cancelled or failed
     """
     process_manager = _get_process_manager()
-    return await process_manager.get_decision(params)
+    return await process_manager.warm_up(resolved_config, owner, needed)
+
+
+def get_metrics() -> Optional[MetricsRegistry]:
+    """Decider metrics, or None before the first request started the workers."""
+    if _decider is None:
+        return None
+    return _decider.collect_metrics()
+
+
+def render_metrics() -> str:
+    """Decider metrics in the Prometheus text exposition format."""
+    metrics = get_metrics() or MetricsRegistry()
+    return metrics.render_prometheus()
+
+
+def cancel_decision(request_id: str) -> bool:
+    """Cancel a queued decision request; running ones are not interrupted."""
+    if _decider is None:
+        return False
+    return _decider.cancel(request_id)
 
 
 async def get_model_cache_status(
@@ -42,10 +136,18 @@ async def get_model_cache_status(
     return await process_manager.get_model_cache_status(resolved_config)
 
 
+async def get_resident_models() -> List[ModelCacheStatus | None]:
+    """List models loaded in each worker, most recently used first."""
+    process_manager = _get_process_manager()
+    return await process_manager.get_resident_models()
+
+
 def cleanup():
     """Clean up resources when the module is unloaded"""
+    global _decider
     if _decider is not None:
         _decider.shutdown()
+        _decider = None
 
 
 atexit.register(cleanup)
@@ -1,39 +1,398 @@
-from typing import Dict, Any
+import asyncio
+import threading
+import time
+import uuid
+from functools import partial
+from typing import Callable, Dict, Any, Iterable, List, Optional, Tuple, Union
 from align_utils.models import ADMResult
-from .types import DeciderParams
-from .worker import decider_worker_func, CacheQuery, CacheQueryResult
+from .load_timing import TOTAL
+from .metrics import MetricsRegistry
+from .progress import ProgressEvent, ProgressKind
+from .types import DeciderParams, RequestPriority
+from .model_cache import ModelCacheLimits, ModelCacheStatus
+from .router import ModelAffinityRouter
+from .worker import (
+    decider_worker_func,
+    extract_cache_key,
+    extract_cache_keys,
+    CacheQuery,
+    CacheQueryResult,
+    CacheStatusQuery,
+    DecisionBatch,
+    WarmUp,
+    pack_task,
+)
+from .shared_payloads import SharedPayloadStore
 from .multiprocess_worker import (
+    Cancelled,
     WorkerHandle,
+    cancel_request,
     create_worker,
     send,
     close_worker,
 )
 
 
+class DecisionCancelled(RuntimeError):
+    """Raised when a queued decision was cancelled before it started."""
+
+
+_TASK_KINDS = {
+    DeciderParams: "decision",
+    DecisionBatch: "batch",
+    WarmUp: "warm_up",
+    CacheQuery: "cache_query",
+    CacheStatusQuery: "cache_status",
+}
+
+
 class MultiprocessDecider:
-    def __init__(self):
-        self.worker: WorkerHandle = create_worker(decider_worker_func)
+    """Pool of decider worker processes with model-affinity routing.
+
+    Each worker keeps its own model cache; requests are routed to a worker
+    that already holds the model for their resolved config.
+    """
+
+    def __init__(
+        self,
+        cache_limits: Optional[ModelCacheLimits] = None,
+        num_workers: int = 1,
+    ):
+        limits = cache_limits or ModelCacheLimits()
+        self.router = ModelAffinityRouter(num_workers, limits.max_models)
+        self.workers: List[WorkerHandle] = [
+            create_worker(partial(decider_worker_func, cache_limits=limits))
+            for _ in range(num_workers)
+        ]
+        # Serialize replacing a dead worker so concurrent requests start one
+        self._restart_locks = [threading.Lock() for _ in range(num_workers)]
+        # Caller request ID -> (worker index, worker request ID) still in flight
+        self._requests: Dict[str, List[Tuple[int, str]]] = {}
+        # Warm-up owner (e.g. a UI session) -> its pending warm-up request ID
+        self._warm_up_requests: Dict[Optional[str], str] = {}
+        self.payloads = SharedPayloadStore()
+        self.metrics = MetricsRegistry()
+
+    async def _send(
+        self,
+        index: int,
+        task: Any,
+        cache_key: Optional[str] = None,
+        priority: int = RequestPriority.QUERY,
+        request_id: Optional[str] = None,
+        worker_request_id: Optional[str] = None,
+        on_progress: Optional[Callable[[ProgressEvent], None]] = None,
+    ):
+        sent_to = self._live_worker(index)
+        self.router.acquire(index, cache_key)
+        if request_id is not None:
+            worker_request_id = worker_request_id or request_id
+            self._requests.setdefault(request_id, []).append((index, worker_request_id))
+        kind = _TASK_KINDS.get(type(task), "other")
+        self.metrics.inc(
+            "align_decider_requests_total", kind=kind, priority=_priority_name(priority)
+        )
+        wire_task, payload_keys = pack_task(self.payloads, task)
+        start = time.perf_counter()
+        try:
+            worker, result = await send(
+                sent_to,
+                wire_task,
+                priority=priority,
+                request_id=worker_request_id,
+                on_progress=partial(self._observe_progress, on_progress),
+            )
+            if worker.process is not sent_to.process:
+                self._adopt_worker(index, sent_to, worker, cache_key)
+            self.metrics.observe(
+                "align_decider_request_seconds", time.perf_counter() - start, kind=kind
+            )
+            self._count_failures(result)
+            return result
+        finally:
+            self.payloads.release(payload_keys)
+            self.router.release(index)
+            if request_id is not None:
+                self._forget_request(request_id, (index, worker_request_id))
+
+    def _live_worker(self, index: int) -> WorkerHandle:
+        """Worker index, replaced first if its process died.
+
+        Several requests may find the same dead worker; only the first starts
+        a replacement and the others send to it.
+        """
+        with self._restart_locks[index]:
+            worker = self.workers[index]
+            if not worker.process.is_alive():
+                close_worker(worker)
+                self._replace_worker(index, create_worker(worker.worker_func))
+            return self.workers[index]
+
+    def _adopt_worker(
+        self,
+        index: int,
+        sent_to: WorkerHandle,
+        replacement: WorkerHandle,
+        cache_key: Optional[str],
+    ):
+        """Keep a worker send() restarted, unless another one already replaced it."""
+        with self._restart_locks[index]:
+            if self.workers[index] is not sent_to:
+                close_worker(replacement)
+                return
+            self._replace_worker(index, replacement)
+            if cache_key is not None:
+                self.router.touch(index, cache_key)
+
+    def _replace_worker(self, index: int, worker: WorkerHandle):
+        self.workers[index] = worker
+        self.metrics.inc("align_decider_worker_restarts_total")
+        # A new process starts with an empty model cache
+        self.router.forget(index)
+
+    def _observe_progress(
+        self,
+        on_progress: Optional[Callable[[ProgressEvent], None]],
+        event: ProgressEvent,
+    ):
+        if event.kind == ProgressKind.CACHE_HIT:
+            self.metrics.inc("align_decider_model_cache_hits_total")
+        elif event.kind == ProgressKind.LOAD_START:
+            self.metrics.inc("align_decider_model_cache_misses_total")
+        elif event.kind == ProgressKind.LOAD_DONE and event.elapsed is not None:
+            self.metrics.observe("align_decider_model_load_seconds", event.elapsed)
+            for phase, seconds in (event.phases or {}).items():
+                if phase != TOTAL:
+                    self.metrics.observe(
+                        "align_decider_model_load_phase_seconds", seconds, phase=phase
+                    )
+        elif event.kind == ProgressKind.DECIDE_DONE and event.elapsed is not None:
+            self.metrics.observe("align_decider_choose_action_seconds", event.elapsed)
+        if on_progress is not None:
+            on_progress(event)
+
+    def _count_failures(self, result: Any):
+        results = result if isinstance(result, list) else [result]
+        for item in results:
+            reason = _failure_reason(item)
+            if reason:
+                self.metrics.inc("align_decider_request_failures_total", reason=reason)
+
+    def collect_metrics(self) -> MetricsRegistry:
+        """Refresh queue and residency gauges and return the metrics."""
+        for index in range(len(self.workers)):
+            self.metrics.set(
+                "align_decider_queue_depth", self.router.in_flight(index), worker=index
+            )
+            self.metrics.set(
+                "align_decider_resident_models",
+                len(self.router.resident_keys(index)),
+                worker=index,
+            )
+        return self.metrics
+
+    def _forget_request(self, request_id: str, entry: Tuple[int, Any]):
+        entries = self._requests.get(request_id, [])
+        if entry in entries:
+            entries.remove(entry)
+        if not entries:
+            self._requests.pop(request_id, None)
+
+    def cancel(self, request_id: str) -> bool:
+        """Cancel a decision request that has not started yet.
+
+        The awaiting call raises DecisionCancelled. Requests the worker is
+        already running are not interrupted. Returns whether the request was
+        still in flight.
+        """
+        entries = self._requests.get(request_id)
+        if not entries:
+            return False
+        for index, worker_request_id in entries:
+            cancel_request(self.workers[index], worker_request_id)
+        return True
 
     async def get_model_cache_status(
         self, resolved_config: Dict[str, Any]
     ) -> CacheQueryResult | None:
-        self.worker, result = await send(self.worker, CacheQuery(resolved_config))
+        index = self.router.choose(extract_cache_key(resolved_config))
+        result = await self._send(index, CacheQuery(resolved_config))
         if isinstance(result, CacheQueryResult):
             return result
         return None
 
-    async def get_decision(self, params: DeciderParams) -> ADMResult:
-        self.worker, result = await send(self.worker, params)
+    async def get_resident_models(self) -> List[ModelCacheStatus | None]:
+        """Resident models per worker, also used to resync the router."""
+        results = await asyncio.gather(
+            *(
+                self._send(index, CacheStatusQuery())
+                for index in range(len(self.workers))
+            )
+        )
+        statuses: List[ModelCacheStatus | None] = []
+        for index, result in enumerate(results):
+            if isinstance(result, ModelCacheStatus):
+                self.router.sync(
+                    index, [entry.cache_key for entry in reversed(result.entries)]
+                )
+                statuses.append(result)
+            else:
+                statuses.append(None)
+        return statuses
+
+    async def warm_up(
+        self,
+        resolved_config: Dict[str, Any],
+        owner: Optional[str] = None,
+        needed: Iterable[Dict[str, Any]] = (),
+    ) -> bool:
+        """Load a model in the background ahead of its first decision.
+
+        Runs behind every other request. A newer warm-up from the same owner
+        cancels its older one that has not started, so browsing through
+        deciders only loads the last selection; other owners are unaffected.
+        An idle resident model may be evicted, but the warm-up is skipped
+        while the worker has requests in flight or when it would evict a
+        model of a config in needed. Returns whether the model ended up
+        resident.
+        """
+        cache_key = extract_cache_key(resolved_config)
+        index = self.router.choose(cache_key)
+        resident = self.router.resident_keys(index)
+        if cache_key in resident:
+            return True
+        evicted = resident[: max(0, len(resident) - self.router.slots_per_worker + 1)]
+        if evicted and (
+            self.router.in_flight(index) > 0
+            or set(evicted) & {extract_cache_key(config) for config in needed}
+        ):
+            return False
+
+        previous = self._warm_up_requests.get(owner)
+        if previous is not None:
+            self.cancel(previous)
+        request_id = str(uuid.uuid4())
+        self._warm_up_requests[owner] = request_id
+        try:
+            result = await self._send(
+                index,
+                WarmUp(resolved_config),
+                cache_key,
+                RequestPriority.WARM,
+                request_id,
+            )
+        finally:
+            if self._warm_up_requests.get(owner) == request_id:
+                del self._warm_up_requests[owner]
+        if result != cache_key:
+            self.router.discard(index, cache_key)
+            return False
+        return True
+
+    async def get_decision(
+        self,
+        params: DeciderParams,
+        priority: int = RequestPriority.INTERACTIVE,
+        request_id: Optional[str] = None,
+        on_progress: Optional[Callable[[ProgressEvent], None]] = None,
+    ) -> ADMResult:
+        cache_key = extract_cache_key(params.resolved_config)
+        index = self.router.choose(cache_key)
+        result = await self._send(
+            index, params, cache_key, priority, request_id, on_progress=on_progress
+        )
+        return _check_result(result)
 
-        if result is None:
-            raise RuntimeError("Worker process died unexpectedly")
+    async def get_decisions(
+        self,
+        params_list: List[DeciderParams],
+        return_exceptions: bool = False,
+        priority: int = RequestPriority.BACKGROUND,
+        request_id: Optional[str] = None,
+    ) -> List[Union[ADMResult, RuntimeError]]:
+        """Decide many params with one message per worker, results in order.
 
-        if isinstance(result, Exception):
-            raise RuntimeError(f"Worker error: {result}")
+        Params are grouped by model; each group goes to the worker holding
+        that model (or the least-loaded one), which runs it back-to-back.
+        Like asyncio.gather, the first failure is raised unless
+        return_exceptions is True, in which case errors are returned in place.
+        """
+        groups: Dict[str, List[int]] = {}
+        for index, cache_key in enumerate(extract_cache_keys(params_list)):
+            groups.setdefault(cache_key, []).append(index)
 
-        return result
+        assignments: Dict[int, List[int]] = {}
+        # Groups placed per worker, so the next group spreads out
+        planned: Dict[int, int] = {}
+        for cache_key, indices in groups.items():
+            worker_index = self.router.choose(cache_key, planned)
+            planned[worker_index] = planned.get(worker_index, 0) + 1
+            # _send counts the request in flight; only residency is marked here
+            self.router.touch(worker_index, cache_key)
+            assignments.setdefault(worker_index, []).extend(indices)
+
+        batch_results = await asyncio.gather(
+            *(
+                self._send(
+                    worker_index,
+                    DecisionBatch([params_list[i] for i in indices]),
+                    priority=priority,
+                    request_id=request_id,
+                    worker_request_id=request_id and f"{request_id}:{worker_index}",
+                )
+                for worker_index, indices in assignments.items()
+            )
+        )
+
+        results: List[Any] = [None] * len(params_list)
+        for indices, batch in zip(assignments.values(), batch_results):
+            if not isinstance(batch, list):
+                batch = [batch] * len(indices)
+            for index, result in zip(indices, batch):
+                results[index] = result
+
+        checked: List[Union[ADMResult, RuntimeError]] = []
+        for result in results:
+            try:
+                checked.append(_check_result(result))
+            except RuntimeError as e:
+                if not return_exceptions:
+                    raise
+                checked.append(e)
+        return checked
 
     def shutdown(self):
-        if self.worker is not None:
-            close_worker(self.worker)
-            self.worker = None
+        for worker in self.workers:
+            close_worker(worker)
+        self.workers = []
+        self.payloads.close()
+
+
+def _priority_name(priority: int) -> str:
+    try:
+        return RequestPriority(priority).name.lower()
+    except ValueError:
+        return str(priority)
+
+
+def _failure_reason(result: Any) -> Optional[str]:
+    if result is None:
+        return "no_result"
+    if isinstance(result, Cancelled):
+        return "cancelled"
+    if isinstance(result, Exception):
+        return "error"
+    return None
+
+
+def _check_result(result: Any) -> ADMResult:
+    if result is None:
+        raise RuntimeError("Worker process died unexpectedly")
+
+    if isinstance(result, Cancelled):
+        raise DecisionCancelled("Decision was cancelled before it started")
+
+    if isinstance(result, Exception):
+        raise RuntimeError(f"Worker error: {result}")
+
+    return result
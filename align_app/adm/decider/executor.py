@@ -1,9 +1,9 @@
-from typing import Any, Tuple
-from functools import partial
-from omegaconf import OmegaConf
-from align_system.utils.hydra_utils import initialize_with_custom_references
-from align_system.utils.hydrate_state import p2triage_hydrate_scenario_state
+import time
+from typing import Any, Optional, Tuple
+from functools import partial, wraps
 from align_utils.models import InputData, ADMResult, Decision, ChoiceInfo
+from .load_timing import PhaseTimer, measure_load_phases, uses_pretrained_model
+from .progress import ProgressKind, report_progress
 from .types import DeciderParams
 
 
@@ -16,6 +16,8 @@ def hydrate_scenario_input(scenario_input: InputData) -> Tuple[Any, Any]:
     Returns:
         Tuple of (state, actions) ready for ADM execution
     """
+    from align_system.utils.hydrate_state import p2triage_hydrate_scenario_state
+
     full_state = scenario_input.full_state or {}
     full_state_with_defaults = {
         **full_state,
@@ -78,13 +80,85 @@ def choose_action(model: Any, params: DeciderParams) -> ADMResult:
     )
 
 
-def instantiate_adm(decider_config):
+def _generated_text(output: Any) -> str:
+    """Readable text from one inference engine output (dict, str or other)."""
+    if isinstance(output, str):
+        return output
+    if isinstance(output, dict):
+        return "\n".join(str(v) for v in output.values() if isinstance(v, str))
+    return ""
+
+
+def _instrument_engine(engine: Any):
+    """Report text generated by each run_inference call of an inference engine."""
+    run_inference = getattr(engine, "run_inference", None)
+    if run_inference is None or getattr(run_inference, "_reports_progress", False):
+        return
+
+    @wraps(run_inference)
+    def reporting_run_inference(*args, **kwargs):
+        outputs = run_inference(*args, **kwargs)
+        items = outputs if isinstance(outputs, list) else [outputs]
+        text = "\n".join(t for t in map(_generated_text, items) if t)
+        if text:
+            report_progress(ProgressKind.TEXT, text=text)
+        return outputs
+
+    reporting_run_inference._reports_progress = True  # type: ignore[attr-defined]
+    engine.run_inference = reporting_run_inference
+
+
+def _instrument_step(step: Any, index: int, total: int):
+    """Report start and finish of a pipeline step's run()."""
+    run = getattr(step, "run", None)
+    if run is None:
+        return
+    name = type(step).__name__
+
+    @wraps(run)
+    def reporting_run(*args, **kwargs):
+        report_progress(
+            ProgressKind.STEP_START,
+            f"Step {index + 1}/{total}: {name}",
+            step=name,
+            index=index,
+            total=total,
+        )
+        start = time.perf_counter()
+        result = run(*args, **kwargs)
+        report_progress(
+            ProgressKind.STEP_DONE,
+            f"Step {index + 1}/{total}: {name} done",
+            step=name,
+            index=index,
+            total=total,
+            elapsed=time.perf_counter() - start,
+        )
+        return result
+
+    step.run = reporting_run
+
+
+def _instrument_adm(adm: Any):
+    """Wrap pipeline steps and inference engines so they report progress."""
+    instance = getattr(adm, "instance", None)
+    steps = list(getattr(instance, "steps", None) or [])
+    for index, step in enumerate(steps):
+        _instrument_step(step, index, len(steps))
+        engine = getattr(step, "structured_inference_engine", None)
+        if engine is not None:
+            _instrument_engine(engine)
+
+
+def instantiate_adm(decider_config, timer: Optional[PhaseTimer] = None):
     """Instantiate an ADM from a resolved config.
 
     The config should already have llm_backbone merged into it by the app layer.
 
     Args:
         decider_config: Fully resolved configuration dict
+        timer: Optional PhaseTimer receiving the download / load_weights /
+            initialize breakdown
 
     Returns: (choose_action_func, cleanup_func)
         Tuple of curried functions - choose_action with model baked in, and cleanup
@@ -92,9 +166,16 @@ def instantiate_adm(decider_config):
     if decider_config is None:
         raise ValueError("decider_config is required")
 
-    if OmegaConf.has_resolver("ref"):
-        OmegaConf.clear_resolver("ref")
-    adm = initialize_with_custom_references({"adm": decider_config})["adm"]
+    # Only worker processes need these; keep them out of the app's startup
+    from omegaconf import OmegaConf
+    from align_system.utils.hydra_utils import initialize_with_custom_references
+
+    timer = timer or PhaseTimer()
+    with measure_load_phases(timer, uses_pretrained_model(decider_config)):
+        if OmegaConf.has_resolver("ref"):
+            OmegaConf.clear_resolver("ref")
+        adm = initialize_with_custom_references({"adm": decider_config})["adm"]
+    _instrument_adm(adm)
 
     def cleanup(model):
         if hasattr(model, "instance"):
@@ -0,0 +1,129 @@
+"""Phase breakdown of ADM instantiation.
+
+instantiate_adm resolves Hydra references, downloads weights, loads them and
+builds pipeline components (ICL datasets, engines) in one opaque call. While
+it runs, the Hugging Face download and transformers weight-loading entry
+points are temporarily wrapped so their time can be split out:
+
+- download: time inside hf_hub_download (cache checks included)
+- load_weights: time inside PreTrainedModel.from_pretrained, minus downloads
+- initialize: everything else (reference resolution, ICL setup, engines)
+
+Wrapping is best-effort: when transformers or huggingface_hub is not
+installed the corresponding phase is simply absent.
+"""
+
+import importlib
+import logging
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List
+
+logger = logging.getLogger(__name__)
+
+DOWNLOAD = "download"
+LOAD_WEIGHTS = "load_weights"
+INITIALIZE = "initialize"
+TOTAL = "total"
+
+
+class PhaseTimer:
+    """Accumulates exclusive seconds per phase; nested phases are subtracted."""
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+        self._nested: List[float] = []
+
+    def add(self, phase: str, seconds: float):
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def wrap(self, phase: str, func: Callable) -> Callable:
+        @wraps(func)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            self._nested.append(0.0)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                nested = self._nested.pop()
+                self.add(phase, elapsed - nested)
+                if self._nested:
+                    self._nested[-1] += elapsed
+
+        return timed
+
+    def reset(self):
+        self.phases.clear()
+        self._nested.clear()
+
+    def as_dict(self) -> Dict[str, float]:
+        return {phase: round(seconds, 3) for phase, seconds in self.phases.items()}
+
+
+def _patch_function(module_name: str, attr: str, timer: PhaseTimer, phase: str):
+    module = importlib.import_module(module_name)
+    original = getattr(module, attr)
+    setattr(module, attr, timer.wrap(phase, original))
+    return lambda: setattr(module, attr, original)
+
+
+def _patch_classmethod(
+    module_name: str, class_name: str, attr: str, timer: PhaseTimer, phase: str
+):
+    cls = getattr(importlib.import_module(module_name), class_name)
+    original = cls.__dict__[attr]
+    setattr(cls, attr, classmethod(timer.wrap(phase, original.__func__)))
+    return lambda: setattr(cls, attr, original)
+
+
+_HOOKS: List[Callable[[PhaseTimer], Callable[[], None]]] = [
+    lambda timer: _patch_function(
+        "huggingface_hub.file_download", "hf_hub_download", timer, DOWNLOAD
+    ),
+    lambda timer: _patch_function(
+        "transformers.utils.hub", "hf_hub_download", timer, DOWNLOAD
+    ),
+    lambda timer: _patch_classmethod(
+        "transformers", "PreTrainedModel", "from_pretrained", timer, LOAD_WEIGHTS
+    ),
+]
+
+
+def uses_pretrained_model(config: Any) -> bool:
+    """Whether a resolved config names a model to load (any model_name key)."""
+    if isinstance(config, dict):
+        return "model_name" in config or any(
+            uses_pretrained_model(value) for value in config.values()
+        )
+    if isinstance(config, list):
+        return any(uses_pretrained_model(item) for item in config)
+    return False
+
+
+@contextmanager
+def measure_load_phases(timer: PhaseTimer, hook_libraries: bool = True) -> Iterator:
+    """Time the block into timer, splitting out download and weight loading.
+
+    hook_libraries=False skips wrapping (and importing) transformers and
+    huggingface_hub, for configs that load no pretrained model.
+    """
+    restores = []
+    if hook_libraries:
+        for hook in _HOOKS:
+            try:
+                restores.append(hook(timer))
+            except Exception:
+                logger.debug("Load timing hook unavailable", exc_info=True)
+
+    start = time.perf_counter()
+    try:
+        yield timer
+    finally:
+        total = time.perf_counter() - start
+        for restore in reversed(restores):
+            restore()
+        hooked = timer.phases.get(DOWNLOAD, 0.0) + timer.phases.get(LOAD_WEIGHTS, 0.0)
+        timer.add(INITIALIZE, max(0.0, total - hooked))
+        timer.add(TOTAL, total)
@@ -0,0 +1,180 @@
+"""Counters, gauges and histograms for the decider subsystem.
+
+Everything is recorded in the main process: MultiprocessDecider times each
+request and observes the ProgressEvents workers already send (cache hits,
+model loads, choose_action timings). Reading metrics therefore never waits
+behind a running decision. render_prometheus() produces the Prometheus text
+exposition format.
+"""
+
+import bisect
+from dataclasses import dataclass, field
+from typing import Dict, List, Literal, Tuple
+
+MetricType = Literal["counter", "gauge", "histogram"]
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+@dataclass(frozen=True)
+class MetricDefinition:
+    type: MetricType
+    help: str
+    buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+
+
+DECIDER_METRICS: Dict[str, MetricDefinition] = {
+    "align_decider_requests_total": MetricDefinition(
+        "counter", "Requests sent to decider workers by kind and priority."
+    ),
+    "align_decider_request_failures_total": MetricDefinition(
+        "counter", "Requests that did not return a result, by reason."
+    ),
+    "align_decider_request_seconds": MetricDefinition(
+        "histogram", "Time from sending a request to its result, queueing included."
+    ),
+    "align_decider_queue_depth": MetricDefinition(
+        "gauge", "Requests queued or running per worker."
+    ),
+    "align_decider_resident_models": MetricDefinition(
+        "gauge", "Models the router believes are loaded per worker."
+    ),
+    "align_decider_worker_restarts_total": MetricDefinition(
+        "counter", "Worker processes restarted after dying."
+    ),
+    "align_decider_model_cache_hits_total": MetricDefinition(
+        "counter", "Decisions and warm-ups that found their model already loaded."
+    ),
+    "align_decider_model_cache_misses_total": MetricDefinition(
+        "counter", "Model loads triggered by a decision or warm-up."
+    ),
+    "align_decider_model_load_seconds": MetricDefinition(
+        "histogram", "Time to instantiate an ADM."
+    ),
+    "align_decider_model_load_phase_seconds": MetricDefinition(
+        "histogram", "Time per ADM instantiation phase (download, weights, init)."
+    ),
+    "align_decider_choose_action_seconds": MetricDefinition(
+        "histogram", "Time spent in choose_action per decision."
+    ),
+}
+
+
+@dataclass
+class Histogram:
+    buckets: Tuple[float, ...]
+    counts: List[int] = field(default_factory=list)
+    sum: float = 0.0
+    count: int = 0
+
+    def __post_init__(self):
+        if not self.counts:
+            self.counts = [0] * len(self.buckets)
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    def __init__(self, definitions: Dict[str, MetricDefinition] = DECIDER_METRICS):
+        self.definitions = definitions
+        self._values: Dict[str, Dict[Labels, float]] = {}
+        self._histograms: Dict[str, Dict[Labels, Histogram]] = {}
+
+    def inc(self, name: str, amount: float = 1.0, **labels: object):
+        series = self._values.setdefault(name, {})
+        key = _labels(labels)
+        series[key] = series.get(key, 0.0) + amount
+
+    def set(self, name: str, value: float, **labels: object):
+        self._values.setdefault(name, {})[_labels(labels)] = value
+
+    def observe(self, name: str, value: float, **labels: object):
+        series = self._histograms.setdefault(name, {})
+        key = _labels(labels)
+        if key not in series:
+            series[key] = Histogram(self.definitions[name].buckets)
+        series[key].observe(value)
+
+    def value(self, name: str, **labels: object) -> float:
+        return self._values.get(name, {}).get(_labels(labels), 0.0)
+
+    def histogram(self, name: str, **labels: object) -> Histogram | None:
+        return self._histograms.get(name, {}).get(_labels(labels))
+
+    def render_prometheus(self) -> str:
+        lines: List[str] = []
+        for name, definition in self.definitions.items():
+            lines.append(f"# HELP {name} {definition.help}")
+            lines.append(f"# TYPE {name} {definition.type}")
+            if definition.type == "histogram":
+                for labels, hist in sorted(self._histograms.get(name, {}).items()):
+                    cumulative = 0
+                    for bound, count in zip(hist.buckets, hist.counts):
+                        cumulative += count
+                        bucket_labels = (*labels, ("le", _format_number(bound)))
+                        lines.append(
+                            f"{name}_bucket{_render(bucket_labels)} {cumulative}"
+                        )
+                    inf_labels = (*labels, ("le", "+Inf"))
+                    lines.append(f"{name}_bucket{_render(inf_labels)} {hist.count}")
+                    lines.append(f"{name}_sum{_render(labels)} {hist.sum}")
+                    lines.append(f"{name}_count{_render(labels)} {hist.count}")
+            else:
+                for labels, value in sorted(self._values.get(name, {}).items()):
+                    lines.append(f"{name}{_render(labels)} {_format_number(value)}")
+        return "\n".join(lines) + "\n"
+
+    def rows(self) -> List[Dict[str, str]]:
+        """Flat rows for display: one per series, histograms as count and mean."""
+        rows = []
+        for name, definition in self.definitions.items():
+            if definition.type == "histogram":
+                for labels, hist in sorted(self._histograms.get(name, {}).items()):
+                    mean = hist.sum / hist.count if hist.count else 0.0
+                    rows.append(
+                        {
+                            "name": name,
+                            "labels": _describe(labels),
+                            "value": f"{hist.count} × {mean:.2f}s avg",
+                        }
+                    )
+            else:
+                for labels, value in sorted(self._values.get(name, {}).items()):
+                    rows.append(
+                        {
+                            "name": name,
+                            "labels": _describe(labels),
+                            "value": _format_number(value),
+                        }
+                    )
+        return rows
+
+
+def _labels(labels: Dict[str, object]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _render(labels: Labels) -> str:
+    if not labels:
+        return ""
+    pairs = (f'{key}="{_escape(value)}"' for key, value in labels)
+    return "{" + ",".join(pairs) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _describe(labels: Labels) -> str:
+    return ", ".join(f"{key}={value}" for key, value in labels)
+
+
+def _format_number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
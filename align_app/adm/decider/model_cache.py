@@ -0,0 +1,294 @@
+"""Bounded LRU cache of instantiated ADMs for the decider worker.
+
+Keeps several (choose_action, cleanup) pairs resident, keyed by
+extract_cache_key, so switching back to a recently used decider/LLM does not
+pay for a full model load. The cache is bounded by a slot count and optional
+RAM/VRAM budgets; least recently used entries are cleaned up first.
+"""
+
+import gc
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+GIB = 1024**3
+
+
+@dataclass(frozen=True)
+class ModelCacheLimits:
+    """Bounds for the worker's model cache. A budget of None is unbounded."""
+
+    max_models: int = 1
+    max_ram_bytes: Optional[int] = None
+    max_vram_bytes: Optional[int] = None
+
+    @classmethod
+    def from_gib(
+        cls,
+        max_models: int = 1,
+        max_ram_gib: Optional[float] = None,
+        max_vram_gib: Optional[float] = None,
+    ) -> "ModelCacheLimits":
+        return cls(
+            max_models=max(1, max_models),
+            max_ram_bytes=int(max_ram_gib * GIB) if max_ram_gib else None,
+            max_vram_bytes=int(max_vram_gib * GIB) if max_vram_gib else None,
+        )
+
+
+@dataclass(frozen=True)
+class MemoryUsage:
+    ram_bytes: int = 0
+    vram_bytes: int = 0
+
+
+@dataclass
+class _CacheEntry:
+    choose_action: Callable
+    cleanup: Callable
+    model_name: Optional[str]
+    usage: MemoryUsage
+    load_seconds: float
+    last_used: float = field(default_factory=time.time)
+    hits: int = 0
+
+
+@dataclass
+class ResidentModel:
+    """Picklable summary of one cached model, sent back to the main process."""
+
+    cache_key: str
+    model_name: Optional[str]
+    ram_bytes: int
+    vram_bytes: int
+    load_seconds: float
+    last_used: float
+    hits: int
+
+
+@dataclass
+class ModelCacheStatus:
+    limits: ModelCacheLimits
+    entries: List[ResidentModel]  # most recently used first
+
+
+def measure_memory_usage() -> MemoryUsage:
+    """Best-effort process RSS and CUDA allocated bytes."""
+    ram = 0
+    try:
+        import psutil
+
+        ram = psutil.Process().memory_info().rss
+    except Exception:
+        pass
+
+    vram = 0
+    try:
+        import torch
+
+        if torch.cuda.is_available():
+            vram = sum(
+                torch.cuda.memory_allocated(device)
+                for device in range(torch.cuda.device_count())
+            )
+    except Exception:
+        pass
+
+    return MemoryUsage(ram_bytes=ram, vram_bytes=vram)
+
+
+def release_memory():
+    """Return freed host and device memory after models are cleaned up."""
+    import torch
+
+    gc.collect()
+    if torch.cuda.is_available():
+        torch.cuda.synchronize()
+        torch.cuda.empty_cache()
+
+
+def _is_out_of_memory(error: Exception) -> bool:
+    return isinstance(error, MemoryError) or "out of memory" in str(error).lower()
+
+
+class ModelCache:
+    """LRU cache of loaded ADMs bounded by slot count and RAM/VRAM budgets."""
+
+    def __init__(
+        self,
+        limits: Optional[ModelCacheLimits] = None,
+        measure: Callable[[], MemoryUsage] = measure_memory_usage,
+        release: Callable[[], None] = release_memory,
+    ):
+        self.limits = limits or ModelCacheLimits()
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._known_usage: Dict[str, MemoryUsage] = {}
+        self._measure = measure
+        self._release = release
+
+    def __contains__(self, cache_key: str) -> bool:
+        return cache_key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def keys(self) -> List[str]:
+        """Resident cache keys, least recently used first."""
+        return list(self._entries.keys())
+
+    def get(self, cache_key: str) -> Optional[Callable]:
+        entry = self._entries.get(cache_key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(cache_key)
+        entry.last_used = time.time()
+        entry.hits += 1
+        return entry.choose_action
+
+    def load(
+        self,
+        cache_key: str,
+        loader: Callable[[], Tuple[Callable, Callable]],
+        model_name: Optional[str] = None,
+    ) -> Callable:
+        """Instantiate a model with loader() and insert it, evicting LRU entries.
+
+        Room is made before loading using the last measured size of this key
+        (or the largest resident model), then the budget is enforced again
+        with the real measurement.
+        """
+        cached = self.get(cache_key)
+        if cached is not None:
+            return cached
+
+        expected = self._known_usage.get(cache_key) or self._largest_usage()
+        self._evict_while(lambda: not self._fits(expected))
+
+        before = self._measure()
+        start = time.perf_counter()
+        try:
+            choose_action, cleanup = loader()
+        except Exception as e:
+            if not self._entries or not _is_out_of_memory(e):
+                raise
+            logger.warning("Out of memory loading %s, evicting all models", cache_key)
+            self.clear()
+            before = self._measure()
+            start = time.perf_counter()
+            choose_action, cleanup = loader()
+        load_seconds = time.perf_counter() - start
+        after = self._measure()
+
+        usage = MemoryUsage(
+            ram_bytes=max(0, after.ram_bytes - before.ram_bytes),
+            vram_bytes=max(0, after.vram_bytes - before.vram_bytes),
+        )
+        self._known_usage[cache_key] = usage
+        self._entries[cache_key] = _CacheEntry(
+            choose_action=choose_action,
+            cleanup=cleanup,
+            model_name=model_name,
+            usage=usage,
+            load_seconds=load_seconds,
+        )
+
+        self._evict_while(lambda: not self._within_budget(), keep=cache_key)
+        if not self._within_budget():
+            logger.warning(
+                "Model %s alone exceeds the model cache budget %s",
+                cache_key,
+                self.limits,
+            )
+        return choose_action
+
+    def evict(self, cache_key: str) -> bool:
+        entry = self._entries.pop(cache_key, None)
+        if entry is None:
+            return False
+        self._cleanup(cache_key, entry)
+        self._release()
+        return True
+
+    def clear(self):
+        entries = list(self._entries.items())
+        self._entries.clear()
+        for cache_key, entry in entries:
+            self._cleanup(cache_key, entry)
+        if entries:
+            self._release()
+
+    def status(self) -> ModelCacheStatus:
+        return ModelCacheStatus(
+            limits=self.limits,
+            entries=[
+                ResidentModel(
+                    cache_key=cache_key,
+                    model_name=entry.model_name,
+                    ram_bytes=entry.usage.ram_bytes,
+                    vram_bytes=entry.usage.vram_bytes,
+                    load_seconds=entry.load_seconds,
+                    last_used=entry.last_used,
+                    hits=entry.hits,
+                )
+                for cache_key, entry in reversed(self._entries.items())
+            ],
+        )
+
+    def _cleanup(self, cache_key: str, entry: _CacheEntry):
+        try:
+            entry.cleanup()
+        except Exception:
+            logger.exception("Cleanup failed for cached model %s", cache_key)
+
+    def _total_usage(self) -> MemoryUsage:
+        return MemoryUsage(
+            ram_bytes=sum(e.usage.ram_bytes for e in self._entries.values()),
+            vram_bytes=sum(e.usage.vram_bytes for e in self._entries.values()),
+        )
+
+    def _largest_usage(self) -> MemoryUsage:
+        usages = [e.usage for e in self._entries.values()]
+        return MemoryUsage(
+            ram_bytes=max((u.ram_bytes for u in usages), default=0),
+            vram_bytes=max((u.vram_bytes for u in usages), default=0),
+        )
+
+    def _fits(self, incoming: MemoryUsage) -> bool:
+        """Whether one more model of the given size fits next to resident ones."""
+        total = self._total_usage()
+        return (
+            len(self._entries) + 1 <= self.limits.max_models
+            and _under(total.ram_bytes + incoming.ram_bytes, self.limits.max_ram_bytes)
+            and _under(
+                total.vram_bytes + incoming.vram_bytes, self.limits.max_vram_bytes
+            )
+        )
+
+    def _within_budget(self) -> bool:
+        total = self._total_usage()
+        return (
+            len(self._entries) <= self.limits.max_models
+            and _under(total.ram_bytes, self.limits.max_ram_bytes)
+            and _under(total.vram_bytes, self.limits.max_vram_bytes)
+        )
+
+    def _evict_while(self, condition: Callable[[], bool], keep: Optional[str] = None):
+        evicted = False
+        while condition():
+            victim = next((k for k in self._entries if k != keep), None)
+            if victim is None:
+                break
+            entry = self._entries.pop(victim)
+            logger.info("Evicting cached model %s", victim)
+            self._cleanup(victim, entry)
+            evicted = True
+        if evicted:
+            self._release()
+
+
+def _under(value: int, budget: Optional[int]) -> bool:
+    return budget is None or value <= budget
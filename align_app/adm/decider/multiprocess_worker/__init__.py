@@ -6,16 +6,36 @@ Concurrent Request Handling:
 - Automatically wraps tasks with unique request IDs
 - Filters results by request ID to prevent cross-talk between concurrent requests
 - Transparent to both worker functions and calling code
+
+Result Delivery:
+- One reader thread per worker drains the result queue
+- Each request awaits its own asyncio.Future, resolved by request ID
+- Results for requests that already timed out are dropped, not buffered
+
+Scheduling:
+- Queued requests run by priority (lower value first), FIFO within a priority
+- Queued requests can be cancelled by ID before the worker starts them
+- Timed-out or cancelled awaits cancel their request if it is still queued
+
+Progress:
+- Workers may put Progress(payload) on the result queue before the result
+- Progress is routed to the on_progress callback of the request in progress
 """
 
 import asyncio
 import atexit
+import heapq
+import itertools
+import logging
+import queue
 import signal
+import threading
 import uuid
-from collections import deque
 from dataclasses import dataclass
 from multiprocessing import Process, Queue
-from typing import Any, Callable, Dict, NamedTuple, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -24,6 +44,28 @@ class _InternalRequest:
 
     request_id: str
     task: Any
+    priority: int = 0
+
+
+@dataclass
+class _CancelRequest:
+    """Ask the worker to drop a queued request."""
+
+    request_id: str
+
+
+@dataclass
+class Progress:
+    """Intermediate update a worker puts on the result queue before its result."""
+
+    payload: Any
+
+
+@dataclass
+class Cancelled:
+    """Result of a request cancelled before the worker started it."""
+
+    request_id: str
 
 
 @dataclass
@@ -36,8 +78,9 @@ class _InternalResponse:
 
 _active_workers: Set[Process] = set()
 _signal_handler_registered = False
-_result_buffer: Dict[str, Any] = {}
-_buffer_lock = asyncio.Lock()
+
+# How often the reader thread checks whether an idle worker is still alive.
+_LIVENESS_INTERVAL = 0.5
 
 
 def _cleanup_all_workers():
@@ -69,51 +112,97 @@ def _ensure_signal_handler_registered():
 
 
 def _worker_wrapper(
-    worker_func: Callable[[Queue, Queue], None], task_queue: Queue, result_queue: Queue
+    worker_func: Callable[[Any, Any], None], task_queue: Queue, result_queue: Queue
 ):
-    """Wrapper that handles request ID wrapping/unwrapping transparently.
+    """Wrapper that handles request IDs, priorities and cancellation transparently.
 
-    Tasks are processed serially by the worker, so we use a FIFO queue of request IDs
-    to match results back to requests.
+    Requests wait in a priority heap and the worker is handed one task at a
+    time, so results pair with the single request in progress and queued
+    requests can still be reordered or cancelled.
     """
-    unwrapped_task_queue: Queue[Any] = Queue()
-    unwrapped_result_queue: Queue[Any] = Queue()
-    request_id_queue: deque[str] = deque()
+    # Thread queues: tasks reach worker_func without a second pickle round-trip
+    unwrapped_task_queue: queue.Queue[Any] = queue.Queue()
+    unwrapped_result_queue: queue.Queue[Any] = queue.Queue()
+    pending: List[Tuple[int, int, Optional[str], Any]] = []
+    queued_ids: Set[str] = set()
+    cancelled_ids: Set[str] = set()
+    condition = threading.Condition()
+    status: Dict[str, Any] = {"busy": False, "current": None, "closing": False}
+
+    def receive():
+        """Queue incoming requests by priority and handle cancellations."""
+        order = itertools.count()
+        for item in iter(task_queue.get, None):
+            with condition:
+                if isinstance(item, _CancelRequest):
+                    if item.request_id in queued_ids:
+                        queued_ids.discard(item.request_id)
+                        cancelled_ids.add(item.request_id)
+                        result_queue.put(
+                            _InternalResponse(
+                                request_id=item.request_id,
+                                result=Cancelled(item.request_id),
+                            )
+                        )
+                    continue
 
-    import threading
+                if isinstance(item, _InternalRequest):
+                    entry = (item.priority, next(order), item.request_id, item.task)
+                    queued_ids.add(item.request_id)
+                else:
+                    entry = (0, next(order), None, item)
+                heapq.heappush(pending, entry)
+                condition.notify_all()
 
-    def unwrap_and_forward():
-        """Unwrap incoming requests and track their IDs in FIFO order."""
-        for item in iter(task_queue.get, None):
-            if isinstance(item, _InternalRequest):
-                request_id_queue.append(item.request_id)
-                unwrapped_task_queue.put(item.task)
-            else:
-                unwrapped_task_queue.put(item)
+        with condition:
+            status["closing"] = True
+            condition.notify_all()
 
-        unwrapped_task_queue.put(None)
+    def feed():
+        """Hand the next queued task to the worker whenever it is idle."""
+        while True:
+            with condition:
+                while True:
+                    while pending and pending[0][2] in cancelled_ids:
+                        cancelled_ids.discard(heapq.heappop(pending)[2])
+                    if not status["busy"] and pending:
+                        break
+                    if not status["busy"] and status["closing"]:
+                        unwrapped_task_queue.put(None)
+                        return
+                    condition.wait()
+
+                _, _, request_id, task = heapq.heappop(pending)
+                if request_id is not None:
+                    queued_ids.discard(request_id)
+                status["busy"] = True
+                status["current"] = request_id
+            unwrapped_task_queue.put(task)
 
     def wrap_and_return():
-        """Wrap outgoing results with their request IDs (FIFO order)."""
+        """Wrap outgoing results with the ID of the request in progress."""
         while True:
             result = unwrapped_result_queue.get()
             if result is None:
                 result_queue.put(None)
                 break
 
-            if request_id_queue:
-                request_id = request_id_queue.popleft()
+            with condition:
+                request_id = status["current"]
+                if not isinstance(result, Progress):
+                    status["busy"] = False
+                    status["current"] = None
+                    condition.notify_all()
+
+            if request_id is not None:
                 result_queue.put(
                     _InternalResponse(request_id=request_id, result=result)
                 )
             else:
                 result_queue.put(result)
 
-    unwrap_thread = threading.Thread(target=unwrap_and_forward, daemon=True)
-    wrap_thread = threading.Thread(target=wrap_and_return, daemon=True)
-
-    unwrap_thread.start()
-    wrap_thread.start()
+    for target in (receive, feed, wrap_and_return):
+        threading.Thread(target=target, daemon=True).start()
 
     try:
         worker_func(unwrapped_task_queue, unwrapped_result_queue)
@@ -121,6 +210,118 @@ def _worker_wrapper(
         unwrapped_result_queue.put(None)
 
 
+class _PendingRequest(NamedTuple):
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future
+    on_progress: Optional[Callable[[Any], None]]
+
+
+class _ResultDispatcher:
+    """Routes results from one worker's result queue to per-request futures.
+
+    A single daemon thread blocks on the result queue and resolves the
+    asyncio.Future registered for each request ID on its own event loop.
+    When the worker exits, every pending request resolves to None.
+    """
+
+    def __init__(self, result_queue: Queue, process: Process):
+        self._result_queue = result_queue
+        self._process = process
+        self._pending: Dict[str, _PendingRequest] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def register(
+        self,
+        request_id: str,
+        on_progress: Optional[Callable[[Any], None]] = None,
+    ) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            if self._closed:
+                future.set_result(None)
+            else:
+                self._pending[request_id] = _PendingRequest(loop, future, on_progress)
+        return future
+
+    def discard(self, request_id: str) -> None:
+        with self._lock:
+            self._pending.pop(request_id, None)
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def _progress(self, request_id: Optional[str], progress: Progress) -> None:
+        with self._lock:
+            entry = self._pending.get(request_id) if request_id else None
+        if entry is None or entry.on_progress is None:
+            return
+        entry.loop.call_soon_threadsafe(
+            _call_progress, entry.on_progress, progress.payload
+        )
+
+    def _resolve(self, request_id: Optional[str], result: Any) -> None:
+        with self._lock:
+            if request_id is None:
+                # Unwrapped result: hand it to the oldest waiter
+                request_id = next(iter(self._pending), None)
+            entry = self._pending.pop(request_id, None) if request_id else None
+        if entry is None:
+            logger.debug("Dropping result for abandoned request %s", request_id)
+            return
+        entry.loop.call_soon_threadsafe(_set_future_result, entry.future, result)
+
+    def _close(self) -> None:
+        with self._lock:
+            self._closed = True
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for entry in pending:
+            entry.loop.call_soon_threadsafe(_set_future_result, entry.future, None)
+
+    def _run(self) -> None:
+        try:
+            while True:
+                try:
+                    item = self._result_queue.get(timeout=_LIVENESS_INTERVAL)
+                except queue.Empty:
+                    if not self._process.is_alive():
+                        break
+                    continue
+                except (EOFError, OSError, ValueError):
+                    break
+
+                if item is None:
+                    break
+                if isinstance(item, _InternalResponse):
+                    if isinstance(item.result, Progress):
+                        self._progress(item.request_id, item.result)
+                    else:
+                        self._resolve(item.request_id, item.result)
+                elif isinstance(item, Progress):
+                    continue
+                else:
+                    self._resolve(None, item)
+        finally:
+            self._close()
+
+
+def _set_future_result(future: asyncio.Future, result: Any) -> None:
+    if not future.done():
+        future.set_result(result)
+
+
+def _call_progress(on_progress: Callable[[Any], None], payload: Any) -> None:
+    try:
+        on_progress(payload)
+    except Exception:
+        logger.exception("Progress callback failed")
+
+
 class WorkerHandle(NamedTuple):
     """Immutable worker process handle."""
 
@@ -128,6 +329,7 @@ class WorkerHandle(NamedTuple):
     task_queue: Queue
     result_queue: Queue
     process: Process
+    results: _ResultDispatcher
 
 
 def create_worker(worker_func: Callable[[Queue, Queue], None]) -> WorkerHandle:
@@ -153,56 +355,17 @@ def create_worker(worker_func: Callable[[Queue, Queue], None]) -> WorkerHandle:
 
     _active_workers.add(process)
 
-    return WorkerHandle(worker_func, task_queue, result_queue, process)
-
-
-async def _await_result_with_id(
-    worker: WorkerHandle, request_id: str, timeout: Optional[float] = None
-) -> Tuple[WorkerHandle, Optional[Any]]:
-    """Wait for result matching a specific request ID.
-
-    Buffers non-matching results for other awaiters.
-    """
-    loop = asyncio.get_event_loop()
-    start_time = loop.time() if timeout is not None else None
-
-    while worker.process.is_alive():
-        async with _buffer_lock:
-            if request_id in _result_buffer:
-                result = _result_buffer.pop(request_id)
-                return worker, result
-
-        try:
-            wrapped_result = await loop.run_in_executor(
-                None,
-                worker.result_queue.get,
-                True,
-                0.1,
-            )
-
-            if isinstance(wrapped_result, _InternalResponse):
-                if wrapped_result.request_id == request_id:
-                    return worker, wrapped_result.result
-                else:
-                    async with _buffer_lock:
-                        _result_buffer[wrapped_result.request_id] = (
-                            wrapped_result.result
-                        )
-                    continue
-            else:
-                return worker, wrapped_result
-
-        except Exception:
-            if timeout is not None and start_time is not None:
-                if loop.time() - start_time > timeout:
-                    return worker, None
-            continue
-
-    return worker, None
+    results = _ResultDispatcher(result_queue, process)
+    return WorkerHandle(worker_func, task_queue, result_queue, process, results)
 
 
 async def send(
-    worker: WorkerHandle, task: Any, timeout: Optional[float] = None
+    worker: WorkerHandle,
+    task: Any,
+    timeout: Optional[float] = None,
+    priority: int = 0,
+    request_id: Optional[str] = None,
+    on_progress: Optional[Callable[[Any], None]] = None,
 ) -> Tuple[WorkerHandle, Optional[Any]]:
     """Send task to worker and await result.
 
@@ -213,18 +376,45 @@ async def send(
         worker: Worker handle
         task: Task to send
         timeout: Optional timeout in seconds (default: wait forever)
+        priority: Queue priority, lower values run first (default: 0)
+        request_id: Optional ID to later cancel_request() with (default: random)
+        on_progress: Called on the event loop with each Progress payload
 
     Returns:
-        Tuple of (worker_handle, result)
+        Tuple of (worker_handle, result). The result is None on timeout or
+        worker death, and a Cancelled instance if the request was cancelled.
     """
-    request_id = str(uuid.uuid4())
-    wrapped_task = _InternalRequest(request_id=request_id, task=task)
+    request_id = request_id or str(uuid.uuid4())
+    wrapped_task = _InternalRequest(request_id=request_id, task=task, priority=priority)
 
     if not worker.process.is_alive():
         worker = create_worker(worker.worker_func)
 
+    future = worker.results.register(request_id, on_progress)
     worker.task_queue.put(wrapped_task)
-    return await _await_result_with_id(worker, request_id, timeout)
+    try:
+        return worker, await asyncio.wait_for(future, timeout)
+    except asyncio.TimeoutError:
+        cancel_request(worker, request_id)
+        return worker, None
+    except asyncio.CancelledError:
+        cancel_request(worker, request_id)
+        raise
+    finally:
+        worker.results.discard(request_id)
+
+
+def cancel_request(worker: WorkerHandle, request_id: str) -> None:
+    """Cancel a queued request; no effect once the worker has started it.
+
+    The awaiting send() receives a Cancelled result.
+
+    Args:
+        worker: Worker handle the request was sent to
+        request_id: ID passed to (or generated by) send()
+    """
+    if worker.process.is_alive():
+        worker.task_queue.put(_CancelRequest(request_id=request_id))
 
 
 def close_worker(worker: WorkerHandle) -> None:
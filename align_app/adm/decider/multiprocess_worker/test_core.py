@@ -11,7 +11,14 @@ import time
 from multiprocessing import Queue
 from typing import Any
 
-from . import create_worker, send, close_worker
+from . import (
+    Cancelled,
+    Progress,
+    cancel_request,
+    create_worker,
+    send,
+    close_worker,
+)
 
 
 # Test worker functions
@@ -37,6 +44,14 @@ def slow_worker(task_queue: Queue, result_queue: Queue):
             break
 
 
+def counting_worker(task_queue: Queue, result_queue: Queue):
+    """Worker that reports progress for each step before its result."""
+    for task in iter(task_queue.get, None):
+        for step in range(task):
+            result_queue.put(Progress(step))
+        result_queue.put(f"counted: {task}")
+
+
 def error_prone_worker(task_queue: Queue, result_queue: Queue):
     """Worker that might throw errors."""
     for task in iter(task_queue.get, None):
@@ -323,6 +338,92 @@ class TestWorker:
         finally:
             close_worker(worker)
 
+    @pytest.mark.anyio
+    async def test_timed_out_result_is_not_delivered_later(self):
+        """A late result for a timed-out request must not reach the next send."""
+        worker = create_worker(slow_worker)
+
+        try:
+            worker, result = await send(worker, {"duration": 1.0}, timeout=0.2)
+            assert result is None
+
+            worker, result = await send(worker, {"duration": 0.0, "id": 2})
+            assert result == "completed: {'duration': 0.0, 'id': 2}"
+            assert worker.results.pending_count() == 0
+        finally:
+            close_worker(worker)
+
+    @pytest.mark.anyio
+    async def test_priority_orders_queued_requests(self):
+        """Lower priority values run first once the worker is free."""
+        worker = create_worker(slow_worker)
+        order = []
+
+        async def run(name, priority):
+            _, result = await send(
+                worker, {"duration": 0.0, "name": name}, priority=priority
+            )
+            order.append(name)
+            return result
+
+        try:
+            busy = asyncio.create_task(send(worker, {"duration": 0.5}))
+            await asyncio.sleep(0.2)
+            await asyncio.gather(run("background", 10), run("interactive", 0))
+            await busy
+
+            assert order == ["interactive", "background"]
+        finally:
+            close_worker(worker)
+
+    @pytest.mark.anyio
+    async def test_cancel_queued_request(self):
+        """A queued request can be cancelled before the worker starts it."""
+        worker = create_worker(slow_worker)
+
+        try:
+            busy = asyncio.create_task(send(worker, {"duration": 0.5}))
+            await asyncio.sleep(0.2)
+            queued = asyncio.create_task(
+                send(worker, {"duration": 0.0}, request_id="queued")
+            )
+            await asyncio.sleep(0.05)
+            cancel_request(worker, "queued")
+
+            _, result = await queued
+            assert result == Cancelled("queued")
+            _, result = await busy
+            assert result == "completed: {'duration': 0.5}"
+
+            worker, result = await send(worker, {"duration": 0.0})
+            assert result == "completed: {'duration': 0.0}"
+        finally:
+            close_worker(worker)
+
+    @pytest.mark.anyio
+    async def test_progress_reaches_its_request(self):
+        """Progress goes to the sender's callback and does not end the request."""
+        worker = create_worker(counting_worker)
+        first: list = []
+        second: list = []
+
+        try:
+            results = await asyncio.gather(
+                send(worker, 3, on_progress=first.append),
+                send(worker, 2, on_progress=second.append),
+                send(worker, 1),
+            )
+
+            assert [result for _, result in results] == [
+                "counted: 3",
+                "counted: 2",
+                "counted: 1",
+            ]
+            assert first == [0, 1, 2]
+            assert second == [0, 1]
+        finally:
+            close_worker(worker)
+
     def test_daemon_process_property(self):
         """Test that worker processes are daemon processes."""
         worker = create_worker(simple_echo_worker)
@@ -390,6 +491,22 @@ class TestWorkerPerformance:
         finally:
             close_worker(worker)
 
+    @pytest.mark.anyio
+    async def test_hundreds_of_outstanding_requests(self):
+        """Waiting requests should not each need an executor thread."""
+        worker = create_worker(simple_echo_worker)
+
+        try:
+            num_tasks = 300
+            results_with_workers = await asyncio.gather(
+                *(send(worker, f"task_{i}") for i in range(num_tasks))
+            )
+
+            results = [result for _, result in results_with_workers]
+            assert results == [f"echo: task_{i}" for i in range(num_tasks)]
+        finally:
+            close_worker(worker)
+
     @pytest.mark.anyio
     async def test_memory_cleanup(self):
         """Test that resources are properly cleaned up."""
@@ -0,0 +1,66 @@
+"""Progress events emitted by the decider worker while a decision runs.
+
+The worker installs a sink for the duration of each task. Code further down
+the stack (model loading, pipeline steps, inference engines) calls
+report_progress() and the events reach the caller ahead of the final result.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Callable, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ProgressKind(str, Enum):
+    CACHE_HIT = "cache_hit"
+    LOAD_START = "load_start"
+    LOAD_DONE = "load_done"
+    STEP_START = "step_start"
+    STEP_DONE = "step_done"
+    TEXT = "text"
+    DECIDE_DONE = "decide_done"
+
+
+@dataclass
+class ProgressEvent:
+    kind: ProgressKind
+    message: str = ""
+    step: Optional[str] = None
+    index: Optional[int] = None
+    total: Optional[int] = None
+    text: str = ""
+    elapsed: Optional[float] = None
+    # LOAD_DONE: seconds per load phase (see load_timing)
+    phases: Optional[Dict[str, float]] = None
+    timestamp: float = field(default_factory=time.time)
+
+
+ProgressSink = Callable[[ProgressEvent], None]
+
+_sink: Optional[ProgressSink] = None
+
+
+@contextmanager
+def progress_sink(sink: Optional[ProgressSink]) -> Iterator[None]:
+    """Send events reported inside the block to sink."""
+    global _sink
+    previous = _sink
+    _sink = sink
+    try:
+        yield
+    finally:
+        _sink = previous
+
+
+def report_progress(kind: ProgressKind, message: str = "", **fields) -> None:
+    """Report an event to the active sink, if any. Never raises."""
+    if _sink is None:
+        return
+    try:
+        _sink(ProgressEvent(kind=kind, message=message, **fields))
+    except Exception:
+        logger.debug("Dropping progress event %s", kind, exc_info=True)
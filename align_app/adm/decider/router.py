@@ -0,0 +1,83 @@
+"""Model-affinity routing of decider requests across a pool of workers.
+
+The router mirrors, on the main process side, which cache keys each worker
+most likely holds. Requests go to a worker that already has their model and
+otherwise to the least-loaded worker. The mirror is only a routing hint; the
+worker's own ModelCache stays authoritative.
+"""
+
+from collections import OrderedDict
+from typing import Iterable, List, Mapping, Optional
+
+
+class ModelAffinityRouter:
+    def __init__(self, num_workers: int, slots_per_worker: int = 1):
+        if num_workers < 1:
+            raise ValueError("num_workers must be at least 1")
+        self.num_workers = num_workers
+        self.slots_per_worker = max(1, slots_per_worker)
+        self._resident: List["OrderedDict[str, None]"] = [
+            OrderedDict() for _ in range(num_workers)
+        ]
+        self._in_flight: List[int] = [0] * num_workers
+
+    def choose(
+        self,
+        cache_key: Optional[str] = None,
+        planned: Optional[Mapping[int, int]] = None,
+    ) -> int:
+        """Pick a worker index for a request needing cache_key.
+
+        planned counts requests per worker that the caller is about to send,
+        on top of those in flight.
+        """
+        planned = planned or {}
+
+        def load(i: int) -> int:
+            return self._in_flight[i] + planned.get(i, 0)
+
+        workers = range(self.num_workers)
+        if cache_key is not None:
+            holders = [i for i in workers if cache_key in self._resident[i]]
+            if holders:
+                return min(holders, key=load)
+        return min(workers, key=lambda i: (load(i), len(self._resident[i])))
+
+    def acquire(self, index: int, cache_key: Optional[str] = None):
+        """Record that a request was sent to worker index.
+
+        The key is marked resident immediately so concurrent requests for a
+        model that is still loading follow it to the same worker.
+        """
+        self._in_flight[index] += 1
+        if cache_key is not None:
+            self.touch(index, cache_key)
+
+    def touch(self, index: int, cache_key: str):
+        """Mark cache_key as the most recently used model of worker index."""
+        resident = self._resident[index]
+        resident[cache_key] = None
+        resident.move_to_end(cache_key)
+        while len(resident) > self.slots_per_worker:
+            resident.popitem(last=False)
+
+    def release(self, index: int):
+        self._in_flight[index] = max(0, self._in_flight[index] - 1)
+
+    def sync(self, index: int, cache_keys: Iterable[str]):
+        """Replace the mirror for one worker with keys it reported, LRU first."""
+        self._resident[index] = OrderedDict((key, None) for key in cache_keys)
+
+    def discard(self, index: int, cache_key: str):
+        """Drop one key, e.g. when a load sent to worker index did not happen."""
+        self._resident[index].pop(cache_key, None)
+
+    def forget(self, index: int):
+        """Drop everything known about a worker, e.g. after it restarted."""
+        self._resident[index] = OrderedDict()
+
+    def resident_keys(self, index: int) -> List[str]:
+        return list(self._resident[index].keys())
+
+    def in_flight(self, index: int) -> int:
+        return self._in_flight[index]
@@ -0,0 +1,202 @@
+"""Shared-memory transport for large, rarely changing decider payloads.
+
+Resolved configs and scenario inputs are identical across most requests of a
+batch, yet pickling them through the task queue copies them for every probe.
+The main process writes each such payload once into a shared memory segment
+named after its content hash and sends a small SharedPayload handle instead.
+Workers read a segment once and keep its bytes in a local LRU, so repeat
+requests for the same content skip shared memory. Every request unpickles its
+own copy, so an ADM changing its config or scenario in place cannot leak into
+later decisions.
+"""
+
+import hashlib
+import logging
+import pickle
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Iterable, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Payloads smaller than this travel inline; a segment is not worth it.
+INLINE_THRESHOLD_BYTES = 16 * 1024
+DEFAULT_STORE_BYTES = 512 * 1024**2
+DEFAULT_WORKER_CACHE_ITEMS = 256
+
+# Segment names created (and so tracked) by stores in this process
+_owned_segments: Set[str] = set()
+
+
+@dataclass(frozen=True)
+class SharedPayload:
+    """Handle to a pickled object in shared memory."""
+
+    key: str
+    segment: str
+    size: int
+
+
+@dataclass
+class _Segment:
+    memory: shared_memory.SharedMemory
+    payload: SharedPayload
+    pins: int = 0
+
+
+class SharedPayloadStore:
+    """Main-process owner of shared payload segments.
+
+    Objects are remembered by identity (holding a reference keeps the id
+    valid) so an unchanged config is pickled and hashed only once; shared
+    objects must therefore not be mutated in place afterwards. Segments
+    pinned by in-flight requests are never unlinked; the rest are evicted
+    least recently used first once max_bytes is exceeded.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_STORE_BYTES,
+        inline_threshold: int = INLINE_THRESHOLD_BYTES,
+    ):
+        self.max_bytes = max_bytes
+        self.inline_threshold = inline_threshold
+        self._prefix = uuid.uuid4().hex[:6]
+        self._segments: "OrderedDict[str, _Segment]" = OrderedDict()
+        # id(obj) -> (obj, key or None when the object travels inline)
+        self._known: "OrderedDict[int, Tuple[Any, Optional[str]]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._segments)
+
+    def total_bytes(self) -> int:
+        return sum(segment.payload.size for segment in self._segments.values())
+
+    def share(self, obj: Any) -> Tuple[Any, Optional[str]]:
+        """Return (obj or its SharedPayload handle, pinned key or None).
+
+        Callers must release() every returned key once the request is done.
+        """
+        known = self._known.get(id(obj))
+        if known is not None and known[0] is obj:
+            self._known.move_to_end(id(obj))
+            key = known[1]
+            if key is None:
+                return obj, None
+            if key in self._segments:
+                return self._pin(key), key
+
+        data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) < self.inline_threshold:
+            self._remember(obj, None)
+            return obj, None
+
+        key = hashlib.blake2b(data, digest_size=16).hexdigest()
+        self._remember(obj, key)
+        if key not in self._segments:
+            self._create(key, data)
+        return self._pin(key), key
+
+    def release(self, keys: Iterable[Optional[str]]) -> None:
+        for key in keys:
+            segment = self._segments.get(key) if key else None
+            if segment is not None:
+                segment.pins = max(0, segment.pins - 1)
+        self._evict()
+
+    def close(self) -> None:
+        """Unlink every segment, e.g. when the workers shut down."""
+        for segment in self._segments.values():
+            _unlink(segment.memory)
+        self._segments.clear()
+        self._known.clear()
+
+    def _pin(self, key: str) -> SharedPayload:
+        segment = self._segments[key]
+        segment.pins += 1
+        self._segments.move_to_end(key)
+        return segment.payload
+
+    def _remember(self, obj: Any, key: Optional[str]) -> None:
+        self._known[id(obj)] = (obj, key)
+        self._known.move_to_end(id(obj))
+        while len(self._known) > 4 * DEFAULT_WORKER_CACHE_ITEMS:
+            self._known.popitem(last=False)
+
+    def _create(self, key: str, data: bytes) -> None:
+        name = f"aa{self._prefix}_{key[:20]}"
+        memory = shared_memory.SharedMemory(name=name, create=True, size=len(data))
+        memory.buf[: len(data)] = data  # type: ignore[index]
+        _owned_segments.add(name)
+        self._segments[key] = _Segment(
+            memory=memory, payload=SharedPayload(key, name, len(data))
+        )
+
+    def _evict(self) -> None:
+        total = self.total_bytes()
+        for key in list(self._segments):
+            if total <= self.max_bytes:
+                break
+            segment = self._segments[key]
+            if segment.pins:
+                continue
+            del self._segments[key]
+            total -= segment.payload.size
+            _unlink(segment.memory)
+
+
+class SharedPayloadCache:
+    """Worker-side LRU of payloads already read from shared memory."""
+
+    def __init__(self, max_items: int = DEFAULT_WORKER_CACHE_ITEMS):
+        self.max_items = max_items
+        self._payloads: "OrderedDict[str, bytes]" = OrderedDict()
+
+    def resolve(self, value: Any) -> Any:
+        """A new copy of the object behind a SharedPayload handle.
+
+        Other values pass through.
+        """
+        if not isinstance(value, SharedPayload):
+            return value
+        data = self._payloads.get(value.key)
+        if data is not None:
+            self._payloads.move_to_end(value.key)
+            return pickle.loads(data)
+
+        memory = _attach(value.segment)
+        try:
+            data = bytes(memory.buf[: value.size])  # type: ignore[index]
+        finally:
+            memory.close()
+
+        self._payloads[value.key] = data
+        while len(self._payloads) > self.max_items:
+            self._payloads.popitem(last=False)
+        return pickle.loads(data)
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Open an existing segment without taking ownership of its lifetime."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+    except TypeError:
+        # Before Python 3.13 attaching registers the segment with the resource
+        # tracker, which would then report it leaked (or unlink it) on exit.
+        memory = shared_memory.SharedMemory(name=name)
+        if name not in _owned_segments:
+            resource_tracker.unregister(memory._name, "shared_memory")  # type: ignore[attr-defined]
+        return memory
+
+
+def _unlink(memory: shared_memory.SharedMemory) -> None:
+    _owned_segments.discard(memory.name)
+    try:
+        memory.close()
+        memory.unlink()
+    except FileNotFoundError:
+        pass
+    except Exception:
+        logger.debug("Failed to unlink shared payload %s", memory.name, exc_info=True)
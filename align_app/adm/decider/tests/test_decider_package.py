@@ -1,5 +1,17 @@
+import asyncio
+
 import pytest
+from align_utils.models import (
+    ADMResult,
+    AlignmentTarget,
+    ChoiceInfo,
+    Decision,
+    InputData,
+)
+
 from align_app.adm.decider import MultiprocessDecider, DeciderParams
+from align_app.adm.decider import decider as decider_module
+from align_app.adm.decider.worker import WarmUp, extract_cache_key
 
 
 @pytest.fixture
@@ -11,6 +23,23 @@ def decider_params(scenario_input, alignment_target_baseline, resolved_random_co
     )
 
 
+def make_params(resolved_config):
+    return DeciderParams(
+        scenario_input=InputData(
+            scenario_id="scenario", state="text", choices=[{"unstructured": "A"}]
+        ),
+        alignment_target=AlignmentTarget(id="baseline", kdma_values=[]),
+        resolved_config=resolved_config,
+    )
+
+
+def make_result():
+    return ADMResult(
+        decision=Decision(unstructured="A", justification="because"),
+        choice_info=ChoiceInfo(),
+    )
+
+
 class TestMultiprocessDecider:
     @pytest.mark.anyio
     async def test_can_import_from_package(self):
@@ -46,9 +75,130 @@ class TestMultiprocessDecider:
         finally:
             decider.shutdown()
 
-    def test_shutdown_is_idempotent(self, decider_params):
-        import asyncio
+    @pytest.mark.anyio
+    async def test_get_decisions_returns_results_in_order(self, decider_params):
+        decider = MultiprocessDecider()
+
+        try:
+            results = await decider.get_decisions([decider_params] * 3)
+
+            assert len(results) == 3
+            for result in results:
+                assert hasattr(result, "decision")
+        finally:
+            decider.shutdown()
+
+    @pytest.mark.anyio
+    async def test_batch_counts_one_request_per_worker_message(self, monkeypatch):
+        decider = MultiprocessDecider(num_workers=2)
+        in_flight = []
+
+        async def fake_send(worker, task, **kwargs):
+            await asyncio.sleep(0)
+            in_flight.append([decider.router.in_flight(i) for i in range(2)])
+            return worker, [make_result() for _ in task.params]
+
+        monkeypatch.setattr(decider_module, "send", fake_send)
+        params = [make_params({"model": name}) for name in ["a", "b", "a"]]
+
+        try:
+            results = await decider.get_decisions(params)
+
+            assert len(results) == 3
+            assert in_flight[0] == [1, 1]
+            assert [decider.router.in_flight(i) for i in range(2)] == [0, 0]
+            assert decider.router.choose(extract_cache_key({"model": "b"})) == 1
+        finally:
+            decider.shutdown()
+
+    @pytest.mark.anyio
+    async def test_dead_worker_is_replaced_once(self):
+        decider = MultiprocessDecider()
+        dead = decider.workers[0].process
+        decider.router.touch(0, "model-before-crash")
+        dead.kill()
+        dead.join()
+
+        try:
+            statuses = await asyncio.gather(
+                *(decider.get_model_cache_status({"seed": seed}) for seed in range(3))
+            )
 
+            assert all(status is not None for status in statuses)
+            assert decider.workers[0].process is not dead
+            assert decider.metrics.value("align_decider_worker_restarts_total") == 1
+            assert decider.router.resident_keys(0) == []
+        finally:
+            decider.shutdown()
+
+    @pytest.mark.anyio
+    async def test_warm_up_loads_a_new_model_after_a_decision(self, monkeypatch):
+        decider = MultiprocessDecider()
+        params = make_params({"model": "decided"})
+        warm_config = {"model": "warmed"}
+
+        async def fake_send(worker, task, **kwargs):
+            if isinstance(task, WarmUp):
+                return worker, extract_cache_key(warm_config)
+            return worker, make_result()
+
+        monkeypatch.setattr(decider_module, "send", fake_send)
+
+        try:
+            await decider.get_decision(params)
+
+            assert await decider.warm_up(warm_config) is True
+            assert decider.router.resident_keys(0) == [extract_cache_key(warm_config)]
+        finally:
+            decider.shutdown()
+
+    @pytest.mark.anyio
+    async def test_warm_up_skips_busy_or_needed_models(self):
+        decider = MultiprocessDecider()
+        needed = {"model": "needed"}
+        decider.router.touch(0, extract_cache_key(needed))
+
+        try:
+            assert await decider.warm_up({"model": "other"}, needed=[needed]) is False
+            decider.router.acquire(0)
+            assert await decider.warm_up({"model": "other"}) is False
+            assert (
+                decider.metrics.value(
+                    "align_decider_requests_total", kind="warm_up", priority="warm"
+                )
+                == 0
+            )
+        finally:
+            decider.shutdown()
+
+    @pytest.mark.anyio
+    async def test_warm_ups_only_replace_their_owners_pending_one(self, monkeypatch):
+        decider = MultiprocessDecider()
+        cancelled = []
+        monkeypatch.setattr(decider, "cancel", cancelled.append)
+
+        async def slow_send(index, task, cache_key, priority, request_id):
+            await asyncio.sleep(0.05)
+            return cache_key
+
+        monkeypatch.setattr(decider, "_send", slow_send)
+
+        try:
+            first = asyncio.ensure_future(decider.warm_up({"seed": 1}, owner="a"))
+            await asyncio.sleep(0)
+            other = asyncio.ensure_future(decider.warm_up({"seed": 2}, owner="b"))
+            await asyncio.sleep(0)
+            assert cancelled == []
+
+            replacement = asyncio.ensure_future(decider.warm_up({"seed": 3}, owner="a"))
+            await asyncio.gather(first, other, replacement)
+
+            assert len(cancelled) == 1
+            assert decider._warm_up_requests == {}
+        finally:
+            decider.shutdown()
+
+    def test_shutdown_is_idempotent(self, decider_params):
         decider = MultiprocessDecider()
 
         asyncio.run(decider.get_decision(decider_params))
@@ -48,3 +48,37 @@ class TestExecuteAdmDecision:
         result = instantiated_baseline_model(params)
 
         assert result.choice_info is not None
+
+
+class TestProgressInstrumentation:
+    def test_pipeline_steps_and_engine_output_are_reported(self):
+        from types import SimpleNamespace
+        from align_app.adm.decider.executor import _instrument_adm
+        from align_app.adm.decider.progress import ProgressKind, progress_sink
+
+        class Engine:
+            def run_inference(self, prompts, schema):
+                return [{"reasoning": "because", "choice": "A"}]
+
+        class ReasoningStep:
+            def __init__(self):
+                self.structured_inference_engine = Engine()
+
+            def run(self):
+                return self.structured_inference_engine.run_inference([], None)
+
+        step = ReasoningStep()
+        adm = SimpleNamespace(instance=SimpleNamespace(steps=[step]))
+        _instrument_adm(adm)
+
+        events = []
+        with progress_sink(events.append):
+            step.run()
+
+        assert [event.kind for event in events] == [
+            ProgressKind.STEP_START,
+            ProgressKind.TEXT,
+            ProgressKind.STEP_DONE,
+        ]
+        assert events[0].step == "ReasoningStep"
+        assert events[1].text == "because\nA"
@@ -0,0 +1,133 @@
+import sys
+import time
+import types
+
+import pytest
+from align_utils.models import ADMResult, ChoiceInfo, Decision
+from align_app.adm.decider import load_timing
+from align_app.adm.decider.load_timing import (
+    DOWNLOAD,
+    INITIALIZE,
+    LOAD_WEIGHTS,
+    TOTAL,
+    PhaseTimer,
+    measure_load_phases,
+    uses_pretrained_model,
+)
+from align_app.adm.decider.worker import _with_load_timing
+
+
+@pytest.fixture
+def fake_hub(monkeypatch):
+    """A stand-in download module hooked in place of huggingface_hub."""
+    module = types.ModuleType("fake_hub")
+    module.hf_hub_download = lambda: time.sleep(0.02)  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "fake_hub", module)
+    monkeypatch.setattr(
+        load_timing,
+        "_HOOKS",
+        [
+            lambda timer: load_timing._patch_function(
+                "fake_hub", "hf_hub_download", timer, DOWNLOAD
+            ),
+            lambda timer: load_timing._patch_function(
+                "missing_module", "anything", timer, LOAD_WEIGHTS
+            ),
+        ],
+    )
+    return module
+
+
+class TestPhaseTimer:
+    def test_nested_phase_is_excluded_from_outer(self):
+        timer = PhaseTimer()
+        inner = timer.wrap("inner", lambda: time.sleep(0.02))
+
+        def outer_body():
+            inner()
+            time.sleep(0.01)
+
+        timer.wrap("outer", outer_body)()
+
+        assert timer.phases["inner"] >= 0.02
+        assert 0.01 <= timer.phases["outer"] < 0.02
+
+
+class TestMeasureLoadPhases:
+    def test_splits_hooked_time_from_initialize(self, fake_hub):
+        original = fake_hub.hf_hub_download
+        timer = PhaseTimer()
+
+        with measure_load_phases(timer):
+            fake_hub.hf_hub_download()
+            time.sleep(0.01)
+
+        assert fake_hub.hf_hub_download is original
+        assert timer.phases[DOWNLOAD] >= 0.02
+        assert timer.phases[INITIALIZE] >= 0.01
+        assert LOAD_WEIGHTS not in timer.phases
+        assert timer.phases[TOTAL] == pytest.approx(
+            timer.phases[DOWNLOAD] + timer.phases[INITIALIZE]
+        )
+
+    def test_without_hooks_everything_is_initialize(self, fake_hub):
+        timer = PhaseTimer()
+
+        with measure_load_phases(timer, hook_libraries=False):
+            fake_hub.hf_hub_download()
+
+        assert DOWNLOAD not in timer.phases
+        assert timer.phases[INITIALIZE] == timer.phases[TOTAL]
+
+    def test_uses_pretrained_model_finds_nested_model_name(self):
+        assert uses_pretrained_model({"steps": [{"engine": {"model_name": "m"}}]})
+        assert not uses_pretrained_model({"steps": [{"engine": {}}]})
+
+
+class TestWithLoadTiming:
+    def make_result(self):
+        return ADMResult(
+            decision=Decision(unstructured="A", justification="because"),
+            choice_info=ChoiceInfo(choice_id="A"),
+        )
+
+    def test_timing_is_reported_with_first_decision_only(self):
+        load_timings = {"key": {TOTAL: 1.5}}
+
+        first = _with_load_timing(self.make_result(), load_timings, "key")
+        second = _with_load_timing(self.make_result(), load_timings, "key")
+
+        assert first.choice_info.model_dump()["model_load_timing"] == {TOTAL: 1.5}
+        assert "model_load_timing" not in second.choice_info.model_dump()
+
+
+def test_out_of_memory_retry_reports_only_the_successful_load(monkeypatch):
+    from align_app.adm.decider import worker
+    from align_app.adm.decider.model_cache import (
+        MemoryUsage,
+        ModelCache,
+        ModelCacheLimits,
+    )
+
+    attempts = []
+
+    def instantiate_adm(config, timer):
+        attempts.append(config)
+        timer.add(DOWNLOAD, 1.0)
+        if len(attempts) == 1:
+            raise MemoryError("CUDA out of memory")
+        return (lambda params: None), (lambda: None)
+
+    monkeypatch.setattr(worker, "instantiate_adm", instantiate_adm)
+    cache = ModelCache(
+        ModelCacheLimits(max_models=2),
+        measure=lambda: MemoryUsage(0, 0),
+        release=lambda: None,
+    )
+    cache.load("resident", lambda: ((lambda params: None), (lambda: None)))
+    load_timings = {}
+
+    worker._get_choose_action(cache, "new", {"model": "m"}, load_timings)
+
+    assert len(attempts) == 2
+    assert load_timings["new"][DOWNLOAD] == 1.0
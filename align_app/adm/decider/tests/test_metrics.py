@@ -0,0 +1,53 @@
+from align_app.adm.decider.metrics import MetricDefinition, MetricsRegistry
+
+
+def make_registry():
+    return MetricsRegistry(
+        {
+            "requests_total": MetricDefinition("counter", "Requests."),
+            "depth": MetricDefinition("gauge", "Queue depth."),
+            "seconds": MetricDefinition("histogram", "Latency.", buckets=(1.0, 5.0)),
+        }
+    )
+
+
+class TestMetricsRegistry:
+    def test_counters_accumulate_per_label_set(self):
+        metrics = make_registry()
+        metrics.inc("requests_total", kind="decision")
+        metrics.inc("requests_total", kind="decision")
+        metrics.inc("requests_total", kind="batch")
+
+        assert metrics.value("requests_total", kind="decision") == 2
+        assert metrics.value("requests_total", kind="batch") == 1
+
+    def test_prometheus_text_includes_cumulative_buckets(self):
+        metrics = make_registry()
+        metrics.set("depth", 3, worker=0)
+        for value in (0.5, 2.0, 10.0):
+            metrics.observe("seconds", value)
+
+        text = metrics.render_prometheus()
+
+        assert "# TYPE depth gauge" in text
+        assert 'depth{worker="0"} 3' in text
+        assert 'seconds_bucket{le="1"} 1' in text
+        assert 'seconds_bucket{le="5"} 2' in text
+        assert 'seconds_bucket{le="+Inf"} 3' in text
+        assert "seconds_count 3" in text
+        assert "seconds_sum 12.5" in text
+
+    def test_label_values_are_escaped(self):
+        metrics = make_registry()
+        metrics.inc("requests_total", kind='a"b')
+
+        assert 'requests_total{kind="a\\"b"} 1' in metrics.render_prometheus()
+
+    def test_rows_summarize_histograms(self):
+        metrics = make_registry()
+        metrics.observe("seconds", 1.0)
+        metrics.observe("seconds", 3.0)
+
+        assert metrics.rows() == [
+            {"name": "seconds", "labels": "", "value": "2 × 2.00s avg"}
+        ]
@@ -0,0 +1,141 @@
+from align_app.adm.decider.model_cache import (
+    ModelCache,
+    ModelCacheLimits,
+    MemoryUsage,
+)
+
+
+class FakeMemory:
+    """Tracks simulated memory so loads and cleanups change measured usage."""
+
+    def __init__(self):
+        self.vram = 0
+
+    def measure(self):
+        return MemoryUsage(ram_bytes=0, vram_bytes=self.vram)
+
+
+def make_loader(events, memory, key, vram=0):
+    def loader():
+        events.append(("load", key))
+        memory.vram += vram
+
+        def cleanup():
+            events.append(("cleanup", key))
+            memory.vram -= vram
+
+        return (lambda params: f"{key}:{params}"), cleanup
+
+    return loader
+
+
+def make_cache(limits, memory=None):
+    memory = memory or FakeMemory()
+    return ModelCache(limits, measure=memory.measure, release=lambda: None), memory
+
+
+class TestModelCache:
+    def test_hit_reuses_loaded_model(self):
+        events = []
+        cache, memory = make_cache(ModelCacheLimits(max_models=2))
+
+        cache.load("a", make_loader(events, memory, "a"))
+        choose_action = cache.get("a")
+
+        assert choose_action("p") == "a:p"
+        assert events == [("load", "a")]
+
+    def test_evicts_least_recently_used_before_loading(self):
+        events = []
+        cache, memory = make_cache(ModelCacheLimits(max_models=2))
+
+        cache.load("a", make_loader(events, memory, "a"))
+        cache.load("b", make_loader(events, memory, "b"))
+        cache.get("a")
+        cache.load("c", make_loader(events, memory, "c"))
+
+        assert cache.keys() == ["a", "c"]
+        assert events.index(("cleanup", "b")) < events.index(("load", "c"))
+
+    def test_single_slot_cleans_up_before_switching(self):
+        events = []
+        cache, memory = make_cache(ModelCacheLimits(max_models=1))
+
+        cache.load("a", make_loader(events, memory, "a"))
+        cache.load("b", make_loader(events, memory, "b"))
+
+        assert events == [("load", "a"), ("cleanup", "a"), ("load", "b")]
+
+    def test_vram_budget_evicts_to_fit(self):
+        events = []
+        cache, memory = make_cache(ModelCacheLimits(max_models=5, max_vram_bytes=100))
+
+        cache.load("a", make_loader(events, memory, "a", vram=40))
+        cache.load("b", make_loader(events, memory, "b", vram=40))
+        cache.load("c", make_loader(events, memory, "c", vram=40))
+
+        assert cache.keys() == ["b", "c"]
+        assert memory.vram == 80
+
+    def test_oversized_model_is_kept_alone(self):
+        events = []
+        cache, memory = make_cache(ModelCacheLimits(max_models=3, max_vram_bytes=50))
+
+        cache.load("a", make_loader(events, memory, "a", vram=20))
+        cache.load("big", make_loader(events, memory, "big", vram=80))
+
+        assert cache.keys() == ["big"]
+
+    def test_out_of_memory_evicts_and_retries(self):
+        events = []
+        cache, memory = make_cache(ModelCacheLimits(max_models=3))
+        cache.load("a", make_loader(events, memory, "a"))
+
+        attempts = []
+
+        def flaky_loader():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("CUDA out of memory")
+            return make_loader(events, memory, "b")()
+
+        cache.load("b", flaky_loader)
+
+        assert cache.keys() == ["b"]
+        assert ("cleanup", "a") in events
+
+    def test_status_lists_resident_models_most_recent_first(self):
+        events = []
+        cache, memory = make_cache(ModelCacheLimits(max_models=3))
+
+        cache.load("a", make_loader(events, memory, "a", vram=10), model_name="m-a")
+        cache.load("b", make_loader(events, memory, "b", vram=20), model_name="m-b")
+        cache.get("a")
+
+        status = cache.status()
+
+        assert [e.cache_key for e in status.entries] == ["a", "b"]
+        assert status.entries[0].model_name == "m-a"
+        assert status.entries[0].hits == 1
+        assert status.entries[1].vram_bytes == 20
+
+    def test_clear_cleans_up_everything(self):
+        events = []
+        cache, memory = make_cache(ModelCacheLimits(max_models=3))
+
+        cache.load("a", make_loader(events, memory, "a"))
+        cache.load("b", make_loader(events, memory, "b"))
+        cache.clear()
+
+        assert len(cache) == 0
+        assert {e for e in events if e[0] == "cleanup"} == {
+            ("cleanup", "a"),
+            ("cleanup", "b"),
+        }
+
+    def test_from_gib_converts_budgets(self):
+        limits = ModelCacheLimits.from_gib(max_models=0, max_vram_gib=1.5)
+
+        assert limits.max_models == 1
+        assert limits.max_vram_bytes == int(1.5 * 1024**3)
+        assert limits.max_ram_bytes is None
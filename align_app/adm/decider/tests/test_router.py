@@ -0,0 +1,67 @@
+import pytest
+from align_app.adm.decider.router import ModelAffinityRouter
+
+
+class TestModelAffinityRouter:
+    def test_routes_to_worker_holding_model(self):
+        router = ModelAffinityRouter(num_workers=3)
+        router.acquire(2, "model_a")
+        router.release(2)
+
+        assert router.choose("model_a") == 2
+
+    def test_falls_back_to_least_loaded_worker(self):
+        router = ModelAffinityRouter(num_workers=3)
+        router.acquire(0, "model_a")
+        router.acquire(1, "model_b")
+
+        assert router.choose("model_c") == 2
+
+    def test_prefers_affinity_over_idle_worker(self):
+        router = ModelAffinityRouter(num_workers=2)
+        router.acquire(1, "model_a")
+
+        assert router.choose("model_a") == 1
+
+    def test_planned_requests_count_as_load(self):
+        router = ModelAffinityRouter(num_workers=2)
+
+        assert router.choose("model_a", {0: 1}) == 1
+        assert router.in_flight(0) == router.in_flight(1) == 0
+
+    def test_concurrent_requests_follow_loading_model(self):
+        router = ModelAffinityRouter(num_workers=2)
+        first = router.choose("model_a")
+        router.acquire(first, "model_a")
+
+        assert router.choose("model_a") == first
+
+    def test_slots_bound_tracked_models(self):
+        router = ModelAffinityRouter(num_workers=1, slots_per_worker=2)
+        for key in ["a", "b", "c"]:
+            router.acquire(0, key)
+            router.release(0)
+
+        assert router.resident_keys(0) == ["b", "c"]
+
+    def test_forget_and_sync_replace_mirror(self):
+        router = ModelAffinityRouter(num_workers=2, slots_per_worker=3)
+        router.acquire(0, "a")
+        router.release(0)
+        router.forget(0)
+        router.sync(1, ["a", "b"])
+
+        assert router.resident_keys(0) == []
+        assert router.choose("a") == 1
+
+    def test_discard_drops_one_key(self):
+        router = ModelAffinityRouter(num_workers=1, slots_per_worker=3)
+        router.acquire(0, "a")
+        router.acquire(0, "b")
+        router.discard(0, "a")
+
+        assert router.resident_keys(0) == ["b"]
+
+    def test_requires_a_worker(self):
+        with pytest.raises(ValueError):
+            ModelAffinityRouter(num_workers=0)
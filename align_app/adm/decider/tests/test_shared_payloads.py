@@ -0,0 +1,117 @@
+import pytest
+from align_utils.models import AlignmentTarget, InputData
+from align_app.adm.decider.shared_payloads import (
+    SharedPayload,
+    SharedPayloadCache,
+    SharedPayloadStore,
+)
+from align_app.adm.decider.types import DeciderParams
+from align_app.adm.decider.worker import (
+    DecisionBatch,
+    SharedDeciderParams,
+    pack_task,
+    unpack_task,
+)
+
+
+@pytest.fixture
+def store():
+    store = SharedPayloadStore(inline_threshold=64)
+    yield store
+    store.close()
+
+
+def big_config(name):
+    return {
+        "name": name,
+        "steps": [{"prompt": "x" * 200, "index": i} for i in range(5)],
+    }
+
+
+class TestSharedPayloadStore:
+    def test_large_payload_round_trips_through_shared_memory(self, store):
+        config = big_config("a")
+
+        handle, key = store.share(config)
+
+        assert isinstance(handle, SharedPayload)
+        assert SharedPayloadCache().resolve(handle) == config
+        store.release([key])
+
+    def test_small_payload_travels_inline(self, store):
+        value, key = store.share({"a": 1})
+
+        assert value == {"a": 1}
+        assert key is None
+        assert len(store) == 0
+
+    def test_equal_content_shares_one_segment(self, store):
+        first, first_key = store.share(big_config("a"))
+        second, second_key = store.share(big_config("a"))
+
+        assert first == second
+        assert len(store) == 1
+        store.release([first_key, second_key])
+
+    def test_pinned_segments_survive_eviction(self, store):
+        store.max_bytes = 0
+        pinned, pinned_key = store.share(big_config("a"))
+        _, other_key = store.share(big_config("b"))
+
+        store.release([other_key])
+
+        assert len(store) == 1
+        assert SharedPayloadCache().resolve(pinned) == big_config("a")
+        store.release([pinned_key])
+        assert len(store) == 0
+
+    def test_worker_cache_reads_segment_once(self, store):
+        handle, key = store.share(big_config("a"))
+        cache = SharedPayloadCache()
+        first = cache.resolve(handle)
+        store.release([key])
+        store.close()
+
+        second = cache.resolve(handle)
+        assert second == first
+        assert second is not first
+
+
+class TestPackTask:
+    def make_params(self, config, probe):
+        return DeciderParams(
+            scenario_input=InputData(
+                scenario_id="scenario",
+                state=probe,
+                choices=[{"unstructured": "A"}, {"unstructured": "B"}],
+            ),
+            alignment_target=AlignmentTarget(id="baseline", kdma_values=[]),
+            resolved_config=config,
+        )
+
+    def test_batch_round_trips_with_shared_config(self, store):
+        config = big_config("a")
+        batch = DecisionBatch([self.make_params(config, f"p{i}") for i in range(3)])
+
+        wire, keys = pack_task(store, batch)
+        unpacked = unpack_task(SharedPayloadCache(), wire)
+
+        assert all(isinstance(p, SharedDeciderParams) for p in wire.params)
+        assert len({p.resolved_config for p in wire.params}) == 1
+        assert [p.scenario_input.state for p in unpacked.params] == ["p0", "p1", "p2"]
+        assert unpacked.params[0].resolved_config == config
+        assert unpacked.params[0].resolved_config is unpacked.params[2].resolved_config
+        store.release(keys)
+
+    def test_tasks_get_their_own_copies(self, store):
+        params = self.make_params(big_config("a"), "p0")
+        wire, keys = pack_task(store, params)
+        cache = SharedPayloadCache()
+
+        first = unpack_task(cache, wire)
+        first.resolved_config["edited_by_adm"] = True
+        second = unpack_task(cache, wire)
+
+        assert second.resolved_config == big_config("a")
+        assert second.scenario_input is not first.scenario_input
+        store.release(keys)
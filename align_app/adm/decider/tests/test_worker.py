@@ -413,3 +413,119 @@ class TestCleanupOnADMSwitch:
         assert len(load_events) == 1, (
             f"Expected only 1 load event when reusing same config, got {len(load_events)}"
         )
+
+
+class TestDecisionBatch:
+    """Batches run grouped by model, reuse resident models, and keep order."""
+
+    @staticmethod
+    def make_params(config, probe):
+        from align_utils.models import InputData, AlignmentTarget
+
+        return DeciderParams(
+            scenario_input=InputData(
+                scenario_id="scenario",
+                state=probe,
+                choices=[{"unstructured": "A"}, {"unstructured": "B"}],
+            ),
+            alignment_target=AlignmentTarget(id="baseline", kdma_values=[]),
+            resolved_config=config,
+        )
+
+    @staticmethod
+    def make_cache(events, configs):
+        from align_app.adm.decider.model_cache import ModelCache, ModelCacheLimits
+
+        cache = ModelCache(
+            ModelCacheLimits(max_models=len(configs)), release=lambda: None
+        )
+        for name, config in configs.items():
+
+            def loader(name=name):
+                events.append(("load", name))
+
+                def choose_action(params):
+                    events.append(("decide", name, params.scenario_input.state))
+                    if params.scenario_input.state == "fail":
+                        raise ValueError("bad probe")
+                    return f"{name}:{params.scenario_input.state}"
+
+                return choose_action, lambda: None
+
+            cache.load(extract_cache_key(config), loader)
+        return cache
+
+    def test_results_keep_input_order_across_models(self):
+        from align_app.adm.decider.worker import _run_batch
+
+        config_a = {"model": "a"}
+        config_b = {"model": "b"}
+        events = []
+        cache = self.make_cache(events, {"a": config_a, "b": config_b})
+
+        params = [
+            self.make_params(config_a, "p1"),
+            self.make_params(config_b, "p2"),
+            self.make_params(config_a, "p3"),
+        ]
+
+        assert _run_batch(cache, params) == ["a:p1", "b:p2", "a:p3"]
+        decide_events = [e for e in events if e[0] == "decide"]
+        assert decide_events == [
+            ("decide", "a", "p1"),
+            ("decide", "a", "p3"),
+            ("decide", "b", "p2"),
+        ]
+
+    def test_failure_is_isolated_to_its_item(self):
+        from align_app.adm.decider.worker import _run_batch
+
+        config_a = {"model": "a"}
+        cache = self.make_cache([], {"a": config_a})
+
+        results = _run_batch(
+            cache,
+            [self.make_params(config_a, "fail"), self.make_params(config_a, "ok")],
+        )
+
+        assert isinstance(results[0], Exception)
+        assert results[1] == "a:ok"
+
+    def test_shared_config_is_hashed_once(self):
+        from align_app.adm.decider.worker import extract_cache_keys
+
+        config = {"model": "a"}
+        params = [self.make_params(config, f"p{i}") for i in range(3)]
+
+        keys = extract_cache_keys(params)
+
+        assert keys == [extract_cache_key(config)] * 3
+
+
+def test_warm_up_reports_load_progress(monkeypatch):
+    import queue
+
+    from align_app.adm.decider import worker
+    from align_app.adm.decider.multiprocess_worker import Progress
+    from align_app.adm.decider.progress import ProgressKind
+
+    monkeypatch.setattr(
+        worker,
+        "instantiate_adm",
+        lambda config, timer=None: (lambda params: None, lambda: None),
+    )
+    model_cache = worker.ModelCache
+    monkeypatch.setattr(
+        worker, "ModelCache", lambda limits: model_cache(limits, release=lambda: None)
+    )
+    task_queue, result_queue = queue.Queue(), queue.Queue()
+    config = {"structured_inference_engine": {"model_name": "m"}}
+    task_queue.put(worker.WarmUp(config))
+    task_queue.put(None)
+
+    worker.decider_worker_func(task_queue, result_queue)
+
+    results = [result_queue.get_nowait() for _ in range(result_queue.qsize())]
+    kinds = [item.payload.kind for item in results if isinstance(item, Progress)]
+    assert kinds == [ProgressKind.LOAD_START, ProgressKind.LOAD_DONE]
+    assert results[-1] == extract_cache_key(config)
@@ -1,5 +1,5 @@
 from typing import Dict, Any, Optional, Union, Literal
-from enum import Enum
+from enum import Enum, IntEnum
 from pydantic import BaseModel, ConfigDict
 from align_utils.models import InputData, AlignmentTarget
 
@@ -22,6 +22,15 @@ class DeciderParams(BaseModel):
     resolved_config: Dict[str, Any]
 
 
+class RequestPriority(IntEnum):
+    """Worker queue priority, lower values run first."""
+
+    QUERY = -10
+    INTERACTIVE = 0
+    BACKGROUND = 10
+    WARM = 20
+
+
 class RequestType(str, Enum):
     RUN = "run"
     SHUTDOWN = "shutdown"
@@ -1,22 +1,42 @@
-import gc
 import hashlib
 import json
 import logging
 import os
+import time
 import traceback
 from dataclasses import dataclass
-from typing import Dict, Tuple, Callable, Any, Optional
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from multiprocessing import Queue
-from align_utils.models import ADMResult
+from align_utils.models import ADMResult, AlignmentTarget
 from .executor import instantiate_adm
+from .load_timing import DOWNLOAD, INITIALIZE, LOAD_WEIGHTS, PhaseTimer
+from .model_cache import ModelCache, ModelCacheLimits
+from .multiprocess_worker import Progress
+from .progress import ProgressKind, progress_sink, report_progress
+from .shared_payloads import SharedPayload, SharedPayloadCache, SharedPayloadStore
 from .types import DeciderParams
 
 
+logger = logging.getLogger(__name__)
+
+
 def extract_cache_key(resolved_config: Dict[str, Any]) -> str:
     cache_str = json.dumps(resolved_config, sort_keys=True)
     return hashlib.md5(cache_str.encode()).hexdigest()
 
 
+def extract_cache_keys(params_list: List[DeciderParams]) -> List[str]:
+    """Cache keys for many params, hashing each shared config object once."""
+    keys_by_config_id: Dict[int, str] = {}
+    keys = []
+    for params in params_list:
+        config_id = id(params.resolved_config)
+        if config_id not in keys_by_config_id:
+            keys_by_config_id[config_id] = extract_cache_key(params.resolved_config)
+        keys.append(keys_by_config_id[config_id])
+    return keys
+
+
 @dataclass
 class CacheQuery:
     resolved_config: Dict[str, Any]
@@ -28,6 +48,105 @@ class CacheQueryResult:
     is_downloaded: Optional[bool]
 
 
+@dataclass
+class CacheStatusQuery:
+    """Ask the worker which models are resident (answered with ModelCacheStatus)."""
+
+
+@dataclass
+class WarmUp:
+    """Load the model for resolved_config ahead of a decision.
+
+    Answered with the cache key once the model is resident, or an Exception.
+    """
+
+    resolved_config: Dict[str, Any]
+
+
+@dataclass
+class DecisionBatch:
+    """Many decisions in one message, answered with a list in the same order.
+
+    Each list item is an ADMResult or an Exception for that params.
+    """
+
+    params: List[Any]  # DeciderParams, SharedDeciderParams on the wire
+
+
+@dataclass
+class SharedDeciderParams:
+    """DeciderParams on the wire, large fields replaced by SharedPayload handles."""
+
+    scenario_input: Any
+    alignment_target: AlignmentTarget
+    resolved_config: Any
+
+
+def pack_task(store: SharedPayloadStore, task: Any) -> Tuple[Any, List[Optional[str]]]:
+    """Replace configs and scenario inputs in task with shared memory handles.
+
+    Returns the task to send and the keys to release once it is answered.
+    """
+    keys: List[Optional[str]] = []
+
+    def share(obj):
+        value, key = store.share(obj)
+        keys.append(key)
+        return value
+
+    def pack_params(params: DeciderParams) -> SharedDeciderParams:
+        return SharedDeciderParams(
+            scenario_input=share(params.scenario_input),
+            alignment_target=params.alignment_target,
+            resolved_config=share(params.resolved_config),
+        )
+
+    if isinstance(task, DeciderParams):
+        return pack_params(task), keys
+    if isinstance(task, DecisionBatch):
+        return DecisionBatch([pack_params(p) for p in task.params]), keys
+    if isinstance(task, WarmUp):
+        return WarmUp(share(task.resolved_config)), keys
+    return task, keys
+
+
+def unpack_task(cache: SharedPayloadCache, task: Any) -> Any:
+    """Inverse of pack_task, run in the worker.
+
+    Each task gets its own copy of shared payloads; params of one batch that
+    shared a payload keep sharing it, so its config is hashed once.
+    """
+    copies: Dict[str, Any] = {}
+
+    def resolve(value: Any) -> Any:
+        if not isinstance(value, SharedPayload):
+            return value
+        if value.key not in copies:
+            copies[value.key] = cache.resolve(value)
+        return copies[value.key]
+
+    def unpack_params(params: SharedDeciderParams) -> DeciderParams:
+        # Fields were validated when the DeciderParams was built
+        return DeciderParams.model_construct(
+            scenario_input=resolve(params.scenario_input),
+            alignment_target=params.alignment_target,
+            resolved_config=resolve(params.resolved_config),
+        )
+
+    if isinstance(task, SharedDeciderParams):
+        return unpack_params(task)
+    if isinstance(task, DecisionBatch):
+        return DecisionBatch(
+            [
+                unpack_params(p) if isinstance(p, SharedDeciderParams) else p
+                for p in task.params
+            ]
+        )
+    if isinstance(task, WarmUp):
+        return WarmUp(resolve(task.resolved_config))
+    return task
+
+
 def _extract_model_name(resolved_config: Dict[str, Any]) -> Optional[str]:
     if not isinstance(resolved_config, dict):
         return None
@@ -72,16 +191,140 @@ def _is_model_downloaded(model_name: Optional[str]) -> Optional[bool]:
         return False
 
 
-def decider_worker_func(task_queue: Queue, result_queue: Queue):
+def _get_choose_action(
+    model_cache: ModelCache,
+    cache_key: str,
+    resolved_config: Dict[str, Any],
+    load_timings: Optional[Dict[str, Dict[str, float]]] = None,
+) -> Callable:
+    """Resident choose_action for cache_key, loading the model if needed.
+
+    Phase timings of a load are stored in load_timings under cache_key until
+    the first decision made with the model picks them up.
+    """
+    choose_action_func = model_cache.get(cache_key)
+    if choose_action_func is not None:
+        report_progress(ProgressKind.CACHE_HIT)
+    else:
+        model_name = _extract_model_name(resolved_config)
+        report_progress(ProgressKind.LOAD_START, f"Loading {model_name or 'model'}...")
+        timer = PhaseTimer()
+
+        def load():
+            # A retry after running out of memory reports only its own phases
+            timer.reset()
+            return instantiate_adm(resolved_config, timer=timer)
+
+        start = time.perf_counter()
+        choose_action_func = model_cache.load(cache_key, load, model_name=model_name)
+        phases = timer.as_dict()
+        if load_timings is not None:
+            load_timings[cache_key] = phases
+        report_progress(
+            ProgressKind.LOAD_DONE,
+            f"Loaded {model_name or 'model'}{_describe_phases(phases)}",
+            elapsed=time.perf_counter() - start,
+            phases=phases,
+        )
+    return choose_action_func
+
+
+def _describe_phases(phases: Dict[str, float]) -> str:
+    parts = [
+        f"{phase.replace('_', ' ')} {phases[phase]:.1f}s"
+        for phase in (DOWNLOAD, LOAD_WEIGHTS, INITIALIZE)
+        if phases.get(phase)
+    ]
+    return f" ({', '.join(parts)})" if parts else ""
+
+
+def _with_load_timing(
+    result: ADMResult,
+    load_timings: Optional[Dict[str, Dict[str, float]]],
+    cache_key: str,
+) -> ADMResult:
+    """Attach pending load phases for cache_key to the result's choice_info."""
+    phases = load_timings.pop(cache_key, None) if load_timings is not None else None
+    if phases is None:
+        return result
+    choice_info = result.choice_info.model_copy()
+    setattr(choice_info, "model_load_timing", phases)
+    return result.model_copy(update={"choice_info": choice_info})
+
+
+def _timed_choose_action(choose_action_func: Callable, params: DeciderParams):
+    start = time.perf_counter()
+    result = choose_action_func(params)
+    report_progress(ProgressKind.DECIDE_DONE, elapsed=time.perf_counter() - start)
+    return result
+
+
+def _run_batch(
+    model_cache: ModelCache,
+    params_list: List[DeciderParams],
+    load_timings: Optional[Dict[str, Dict[str, float]]] = None,
+) -> List[Any]:
+    """Run a batch grouped by model, loading each model at most once.
+
+    Groups whose model is already resident run first so they are not evicted
+    by the loads the other groups need.
+    """
+    groups: Dict[str, List[int]] = {}
+    for index, cache_key in enumerate(extract_cache_keys(params_list)):
+        groups.setdefault(cache_key, []).append(index)
+
+    results: List[Any] = [None] * len(params_list)
+    ordered_groups = sorted(
+        groups.items(), key=lambda group: group[0] not in model_cache
+    )
+    for cache_key, indices in ordered_groups:
+        try:
+            choose_action_func = _get_choose_action(
+                model_cache,
+                cache_key,
+                params_list[indices[0]].resolved_config,
+                load_timings,
+            )
+        except Exception as e:
+            logger.error("Worker error:\n%s", traceback.format_exc())
+            error = Exception(_format_worker_error(e))
+            for index in indices:
+                results[index] = error
+            continue
+
+        for index in indices:
+            try:
+                results[index] = _with_load_timing(
+                    _timed_choose_action(choose_action_func, params_list[index]),
+                    load_timings,
+                    cache_key,
+                )
+            except Exception as e:
+                logger.error("Worker error:\n%s", traceback.format_exc())
+                results[index] = Exception(_format_worker_error(e))
+    return results
+
+
+def decider_worker_func(
+    task_queue: Queue,
+    result_queue: Queue,
+    cache_limits: Optional[ModelCacheLimits] = None,
+):
     root_logger = logging.getLogger()
     root_logger.setLevel("WARNING")
-    logger = logging.getLogger(__name__)
 
-    model_cache: Dict[str, Tuple[Callable, Callable]] = {}
+    model_cache = ModelCache(cache_limits)
+    payloads = SharedPayloadCache()
+    # Load phases not yet reported with a decision, by cache key
+    load_timings: Dict[str, Dict[str, float]] = {}
+
+    def send_progress(event):
+        result_queue.put(Progress(event))
 
     try:
         for task in iter(task_queue.get, None):
             try:
+                task = unpack_task(payloads, task)
                 if isinstance(task, CacheQuery):
                     cache_key = extract_cache_key(task.resolved_config)
                     is_cached = cache_key in model_cache
@@ -100,31 +343,38 @@ def decider_worker_func(task_queue: Queue, result_queue: Queue):
                     )
                     continue
 
-                params: DeciderParams = task
-                cache_key = extract_cache_key(params.resolved_config)
-
-                if cache_key not in model_cache:
-                    old_cleanups = [cleanup for _, (_, cleanup) in model_cache.items()]
-                    model_cache.clear()
-                    for cleanup in old_cleanups:
-                        cleanup()
-                    del old_cleanups
+                if isinstance(task, CacheStatusQuery):
+                    result_queue.put(model_cache.status())
+                    continue
 
-                    import torch
+                if isinstance(task, WarmUp):
+                    cache_key = extract_cache_key(task.resolved_config)
+                    with progress_sink(send_progress):
+                        _get_choose_action(
+                            model_cache, cache_key, task.resolved_config, load_timings
+                        )
+                    result_queue.put(cache_key)
+                    continue
 
-                    gc.collect()
-                    if torch.cuda.is_available():
-                        torch.cuda.synchronize()
-                        torch.cuda.empty_cache()
+                if isinstance(task, DecisionBatch):
+                    with progress_sink(send_progress):
+                        batch_results = _run_batch(
+                            model_cache, task.params, load_timings
+                        )
+                    result_queue.put(batch_results)
+                    continue
 
-                    choose_action_func, cleanup_func = instantiate_adm(
-                        params.resolved_config
+                params: DeciderParams = task
+                cache_key = extract_cache_key(params.resolved_config)
+                with progress_sink(send_progress):
+                    choose_action_func = _get_choose_action(
+                        model_cache, cache_key, params.resolved_config, load_timings
+                    )
+                    result: ADMResult = _with_load_timing(
+                        _timed_choose_action(choose_action_func, params),
+                        load_timings,
+                        cache_key,
                     )
-                    model_cache[cache_key] = (choose_action_func, cleanup_func)
-                else:
-                    choose_action_func, _ = model_cache[cache_key]
-
-                result: ADMResult = choose_action_func(params)
                 result_queue.put(result)
 
             except (KeyboardInterrupt, SystemExit):
@@ -134,11 +384,7 @@ def decider_worker_func(task_queue: Queue, result_queue: Queue):
                 error_msg = _format_worker_error(e)
                 result_queue.put(Exception(error_msg))
     finally:
-        for _, (_, cleanup_func) in model_cache.items():
-            try:
-                cleanup_func()
-            except Exception:
-                pass
+        model_cache.clear()
 
 
 def _format_worker_error(error: Exception) -> str:
@@ -1,23 +1,39 @@
 """Decider configuration definitions and system prompt generation."""
 
 from pathlib import Path
-from typing import Dict, Any
-import hydra
-from omegaconf import OmegaConf
-import align_system
-from align_system.prompt_engineering.outlines_prompts import (
-    ComparativeKDMASystemPrompt,
-    ComparativeRegressionSystemPromptWithTemplate,
-)
-from align_system.utils import call_with_coerced_args
-from align_system.utils.alignment_utils import attributes_in_alignment_target
+from typing import Any, Dict
 from align_utils.models import AlignmentTarget
-from .config import get_decider_config
+from align_app.utils.frozen import thaw
+from align_app.utils.utils import BoundedCache, package_dir
+from .config import (
+    config_fingerprint,
+    decider_config_fingerprint,
+    get_decider_config,
+    _get_dataset_name,
+)
+
+# Generated prompts per (decider, config fingerprint, alignment target)
+SYSTEM_PROMPT_CACHE_SIZE = 512
+# Instantiated attribute_definitions per decider config
+INSTANTIATED_ATTRIBUTES_CACHE_SIZE = 32
+
+_system_prompts = BoundedCache(SYSTEM_PROMPT_CACHE_SIZE)
+_instantiated_attributes = BoundedCache(INSTANTIATED_ATTRIBUTES_CACHE_SIZE)
+
+
+def _instantiate_attribute_definitions(config):
+    import hydra
+    from omegaconf import OmegaConf
+
+    # To resolve references like `${adm.mu}`, we need to provide the 'adm' context to hydra.
+    # We can wrap the config and then instantiate the 'attribute_definitions' part.
+    config_for_instantiation = OmegaConf.create({"adm": config})
+    return hydra.utils.instantiate(config_for_instantiation.adm.attribute_definitions)
 
 
 def get_icl_data_paths():
     """Get paths to ICL data files from align-system repository"""
-    icl_base_path = Path(align_system.__file__).parent / "resources" / "icl" / "phase2"
+    icl_base_path = package_dir("align_system") / "resources" / "icl" / "phase2"
 
     data_mapping = {
         "medical": "July2025-MU-train_20250804.json",
@@ -41,6 +57,18 @@ LLM_BACKBONES = [
 
 
 def _generate_comparative_regression_pipeline_system_prompt(config, alignment):
+    if not alignment.get("kdma_values"):
+        return ""
+
+    # align_system's prompt templates pull in outlines; import them on first use
+    import hydra
+    from align_system.prompt_engineering.outlines_prompts import (
+        ComparativeKDMASystemPrompt,
+        ComparativeRegressionSystemPromptWithTemplate,
+    )
+    from align_system.utils import call_with_coerced_args
+    from align_system.utils.alignment_utils import attributes_in_alignment_target
+
     system_prompt_template_config = config["step_definitions"][
         "comparative_regression"
     ]["system_prompt_template"]
@@ -60,11 +88,8 @@ def _generate_comparative_regression_pipeline_system_prompt(config, alignment):
         # Fall back to Hydra for unknown classes.  Was slow.
         system_prompt_template = hydra.utils.instantiate(system_prompt_template_config)
 
-    # To resolve references like `${adm.mu}`, we need to provide the 'adm' context to hydra.
-    # We can wrap the config and then instantiate the 'attribute_definitions' part.
-    config_for_instantiation = OmegaConf.create({"adm": config})
-    all_attributes = hydra.utils.instantiate(
-        config_for_instantiation.adm.attribute_definitions
+    all_attributes = _instantiated_attributes.get_or_compute(
+        config_fingerprint(config), lambda: _instantiate_attribute_definitions(config)
     )
 
     target_attribute_names = attributes_in_alignment_target(alignment)
@@ -234,7 +259,11 @@ def get_system_prompt(
     all_deciders: Dict[str, Any],
     datasets: Dict[str, Any],
 ) -> str:
-    """Generate system prompt for a decider with given alignment target."""
+    """Generate system prompt for a decider with given alignment target.
+
+    Prompts are cached by decider, config fingerprint and alignment target,
+    so repeated edits of a run only build the decider config once.
+    """
     decider_main_config = all_deciders.get(decider)
     if not decider_main_config:
         return "Decider configuration not available"
@@ -243,17 +272,23 @@ def get_system_prompt(
     if not generate_sys_prompt:
         return "Unknown"
 
-    probe = None
-    for dataset_info in datasets.values():
-        if probe_id in dataset_info["probes"]:
-            probe = dataset_info["probes"][probe_id]
-            break
-    if probe is None:
-        raise ValueError(f"Probe '{probe_id}' not found in datasets configuration")
-
-    config = get_decider_config(probe.probe_id, all_deciders, datasets, decider)
-
-    if config is None:
-        return ""
-
-    return generate_sys_prompt(config, alignment_target.model_dump())
+    try:
+        dataset_name = _get_dataset_name(probe_id, datasets)
+    except ValueError:
+        raise ValueError(
+            f"Probe '{probe_id}' not found in datasets configuration"
+        ) from None
+
+    def generate():
+        config = get_decider_config(probe_id, all_deciders, datasets, decider)
+        if config is None:
+            return ""
+        # Generators hand the config to OmegaConf, which needs plain containers
+        return generate_sys_prompt(thaw(config), alignment_target.model_dump())
+
+    key = (
+        decider,
+        decider_config_fingerprint(decider_main_config, dataset_name),
+        alignment_target.model_dump_json(),
+    )
+    return _system_prompts.get_or_compute(key, generate)
@@ -7,6 +7,7 @@ from .decider_definitions import (
     _BASE_DECIDERS,
 )
 from .config import get_decider_config, _get_dataset_name
+from .attribute_definitions import get_attribute_definitions
 
 
 def _get_decider_options(
@@ -49,6 +50,7 @@ DeciderRegistry = namedtuple(
         "get_decider_config",
         "get_decider_options",
         "get_system_prompt",
+        "get_attribute_definitions",
         "get_all_deciders",
         "add_edited_decider",
         "add_deciders",
@@ -157,6 +159,11 @@ def create_decider_registry(config_paths, scenario_registry, experiment_deciders
             all_deciders=all_deciders,
             datasets=datasets,
         ),
+        get_attribute_definitions=partial(
+            get_attribute_definitions,
+            all_deciders=all_deciders,
+            datasets=datasets,
+        ),
         get_all_deciders=lambda: all_deciders,
         add_edited_decider=partial(
             _add_edited_decider,
@@ -3,20 +3,47 @@ Unified Hydra configuration loader for ADM configs.
 
 This module provides a single, unified loader that handles both regular ADM configs
 and experiment configs with @package _global_ directives.
+
+Composed configs can also be persisted to an on-disk cache, so a restart skips
+Hydra composition for configs whose files have not changed. The cache is off
+until configure_config_cache sets its directory, which the app does at startup. Each entry records
+the hash of every file the composition read and the align-system and Hydra
+versions; an entry is only reused when all of them still match.
 """
 
 from pathlib import Path
-from typing import Dict, Any, Optional, cast
+from typing import Dict, Any, Iterable, List, Optional, Tuple, cast
 from functools import lru_cache
+from importlib import metadata
+import hashlib
+import json
 import logging
+import os
+import tempfile
+
+import yaml
 
-import align_system
-from hydra import compose, initialize_config_dir
-from hydra.core.global_hydra import GlobalHydra
-from omegaconf import OmegaConf
+from align_app.utils.utils import package_dir
 
 logger = logging.getLogger(__name__)
 
+# Bump when the cache entry layout changes
+CONFIG_CACHE_FORMAT = 1
+
+
+def default_config_cache_path() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "align-app" / "hydra-configs"
+
+
+_config_cache_dir: Optional[Path] = None
+
+
+def configure_config_cache(cache_dir: Optional[str | Path]) -> None:
+    """Set the directory of the on-disk config cache, or None to disable it."""
+    global _config_cache_dir
+    _config_cache_dir = Path(cache_dir) if cache_dir is not None else None
+
 
 def _find_config_file(config_path: str, config_dir_path: Path) -> Path | None:
     config_path_obj = Path(config_path)
@@ -83,6 +110,139 @@ def _flatten_nested_adm_config(result: Dict[str, Any]) -> Dict[str, Any]:
     return result
 
 
+def _distribution_version(name: str) -> str:
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+@lru_cache(maxsize=1)
+def _versions() -> Dict[str, str]:
+    return {
+        "align_system": _distribution_version("align-system"),
+        "hydra": _distribution_version("hydra-core"),
+    }
+
+
+def _file_hash(path: Path) -> Optional[str]:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _plain_defaults(config_file: Path) -> Iterable[str]:
+    """Defaults list entries naming a config directly rather than a group option."""
+    try:
+        config = yaml.safe_load(config_file.read_text())
+    except (OSError, yaml.YAMLError):
+        return []
+    defaults = config.get("defaults") if isinstance(config, dict) else None
+    if not isinstance(defaults, list):
+        return []
+    return [entry for entry in defaults if isinstance(entry, str) and entry != "_self_"]
+
+
+def _composed_files(
+    primary_files: Iterable[Path],
+    choices: Dict[str, Any],
+    config_dir_path: Path,
+) -> set[Path]:
+    """Files read to compose a config, from the primary configs and group choices."""
+    files = set(primary_files)
+    for group, option in choices.items():
+        if option is None or group.startswith("hydra/"):
+            continue
+        group_dir = config_dir_path / group.split("@", 1)[0]
+        for name in option if isinstance(option, list) else [option]:
+            files.add(group_dir / f"{name}.yaml")
+
+    # Plain config names in a defaults list do not show up in the choices
+    pending = list(files)
+    while pending:
+        config_file = pending.pop()
+        for name in _plain_defaults(config_file):
+            base = config_dir_path if name.startswith("/") else config_file.parent
+            included = base / f"{name.lstrip('/')}.yaml"
+            if included not in files:
+                files.add(included)
+                pending.append(included)
+    return files
+
+
+def _cache_entry_path(cache_dir: Path, *identity: str) -> Path:
+    digest = hashlib.sha256(json.dumps(identity).encode()).hexdigest()
+    return cache_dir / f"{digest}.json"
+
+
+def _read_cached_config(entry_path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        entry = json.loads(entry_path.read_text())
+    except (OSError, ValueError):
+        return None
+    if (
+        entry.get("format") != CONFIG_CACHE_FORMAT
+        or entry.get("versions") != _versions()
+    ):
+        return None
+    files = entry.get("files", {})
+    if not files or any(
+        _file_hash(Path(path)) != digest for path, digest in files.items()
+    ):
+        return None
+    return entry.get("config")
+
+
+def _write_cached_config(
+    entry_path: Path, files: Iterable[Path], config: Dict[str, Any]
+) -> None:
+    entry = {
+        "format": CONFIG_CACHE_FORMAT,
+        "versions": _versions(),
+        "files": {str(path): _file_hash(path) for path in sorted(files)},
+        "config": config,
+    }
+    try:
+        if json.loads(json.dumps(config)) != config:
+            return
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=entry_path.parent, suffix=".tmp", delete=False
+        ) as tmp:
+            json.dump(entry, tmp)
+        os.replace(tmp.name, entry_path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Could not write config cache entry {entry_path}: {e}")
+
+
+def _compose(
+    config_dir_path: Path, config_name: str, overrides: List[str]
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Compose a config in a fresh Hydra context; returns it and the group choices.
+
+    Hydra is imported here rather than at module level, so startup and
+    configs served from the on-disk cache never pay for importing it.
+    """
+    from hydra import compose, initialize_config_dir
+    from hydra.core.global_hydra import GlobalHydra
+    from omegaconf import OmegaConf
+
+    hydra_instance = GlobalHydra.instance()
+    if hydra_instance.is_initialized():
+        hydra_instance.clear()
+
+    with initialize_config_dir(str(config_dir_path), version_base=None):
+        cfg = compose(
+            config_name=config_name, overrides=overrides, return_hydra_config=True
+        )
+        choices = OmegaConf.to_container(cfg.hydra.runtime.choices)
+        result = OmegaConf.to_container(cfg)
+    assert isinstance(result, dict), "Config must be a dictionary"
+    result.pop("hydra", None)
+    return cast(Dict[str, Any], result), cast(Dict[str, Any], choices)
+
+
 @lru_cache(maxsize=32)
 def load_adm_config(
     config_path: str,
@@ -92,7 +252,8 @@ def load_adm_config(
     Universal config loader for ADM configs with caching.
 
     Creates a fresh Hydra context for each unique configuration to avoid
-    state pollution. Uses LRU cache to maintain performance for repeated loads.
+    state pollution. Uses LRU cache to maintain performance for repeated loads,
+    backed by the on-disk config cache across restarts.
 
     The config type (experiment vs regular) is determined by the presence of
     '# @package _global_' directive in the YAML file, NOT by the path.
@@ -106,7 +267,7 @@ def load_adm_config(
     """
     if config_dir is None:
         try:
-            config_dir = str(Path(align_system.__file__).parent / "configs")
+            config_dir = str(package_dir("align_system") / "configs")
         except ImportError:
             raise ValueError(
                 "Could not auto-detect config_dir. Please provide it explicitly."
@@ -135,20 +296,34 @@ def load_adm_config(
         f"is_experiment={is_experiment_config}"
     )
 
-    hydra_instance = GlobalHydra.instance()
-    if hydra_instance.is_initialized():
-        hydra_instance.clear()
+    entry_path = None
+    if _config_cache_dir is not None:
+        entry_path = _cache_entry_path(
+            _config_cache_dir,
+            str(config_dir_path.resolve()),
+            str(config_file.resolve()),
+            hydra_config_path,
+            str(is_experiment_config),
+        )
+        cached = _read_cached_config(entry_path)
+        if cached is not None:
+            logger.debug(f"Loaded config from cache: {entry_path}")
+            return cached
 
-    with initialize_config_dir(str(config_dir_path), version_base=None):
-        if is_experiment_config:
-            cfg = compose(
-                config_name="action_based",
-                overrides=[f"+experiment={hydra_config_path}"],
-            )
-        else:
-            cfg = compose(config_name=hydra_config_path)
-
-        result = OmegaConf.to_container(cfg)
-        assert isinstance(result, dict), "Config must be a dictionary"
-        result = _flatten_nested_adm_config(cast(Dict[str, Any], result))
-        return cast(Dict[str, Any], result)
+    if is_experiment_config:
+        primary_name = "action_based"
+        overrides = [f"+experiment={hydra_config_path}"]
+    else:
+        primary_name = hydra_config_path
+        overrides = []
+    result, choices = _compose(config_dir_path.resolve(), primary_name, overrides)
+    result = _flatten_nested_adm_config(result)
+
+    if entry_path is not None:
+        files = _composed_files(
+            [config_file.resolve(), config_dir_path.resolve() / f"{primary_name}.yaml"],
+            choices,
+            config_dir_path.resolve(),
+        )
+        _write_cached_config(entry_path, files, result)
+    return cast(Dict[str, Any], result)
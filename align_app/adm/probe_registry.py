@@ -1,14 +1,14 @@
 import copy
 from collections import namedtuple
 from pathlib import Path
-from typing import List, Dict, Any
-import align_system
+from typing import Callable, List, Dict, Any
 from align_utils.models import (
     InputOutputItem,
     InputData,
 )
 from align_utils.discovery import load_input_output_files
 from align_app.adm.probe import Probe
+from align_app.utils.utils import package_dir
 
 DEFAULT_SCENARIOS_PATH = Path(__file__).parent / "input_output_files" / "phase2_july"
 
@@ -47,6 +47,7 @@ ProbeRegistry = namedtuple(
         "get_attributes",
         "add_edited_probe",
         "add_probes",
+        "on_probes_added",
     ],
 )
 
@@ -61,8 +62,9 @@ def create_probe_registry(scenarios_paths=None):
     If no paths provided, uses default location.
     Can handle a single path or a list of paths.
     """
-    align_system_path = Path(align_system.__file__).parent
-    attribute_descriptions_dir = align_system_path / "configs" / "alignment_target"
+    attribute_descriptions_dir = (
+        package_dir("align_system") / "configs" / "alignment_target"
+    )
 
     if scenarios_paths is None:
         scenarios_paths = DEFAULT_SCENARIOS_PATH
@@ -91,6 +93,17 @@ def create_probe_registry(scenarios_paths=None):
         },
     }
 
+    probes_added_listeners: List[Callable[[Dict[str, Probe]], None]] = []
+
+    def on_probes_added(listener: Callable[[Dict[str, Probe]], None]):
+        """Call listener with {probe_id: probe} whenever new probes are added."""
+        probes_added_listeners.append(listener)
+
+    def _notify_probes_added(added: Dict[str, Probe]):
+        if added:
+            for listener in probes_added_listeners:
+                listener(added)
+
     def get_dataset_name(probe_id):
         for name, dataset_info in datasets.items():
             if probe_id in dataset_info["probes"]:
@@ -173,15 +186,19 @@ def create_probe_registry(scenarios_paths=None):
 
         dataset_name = get_dataset_name(base_probe_id)
         datasets[dataset_name]["probes"][new_probe.probe_id] = new_probe
+        _notify_probes_added({new_probe.probe_id: new_probe})
 
         return new_probe
 
     def add_probes(new_probes: List[Probe]):
         """Add probes to registry, skipping duplicates."""
+        added = {}
         for probe in new_probes:
             if probe.probe_id not in probes:
                 probes[probe.probe_id] = probe
                 datasets["phase2"]["probes"][probe.probe_id] = probe
+                added[probe.probe_id] = probe
+        _notify_probes_added(added)
 
     return ProbeRegistry(
         get_probes=lambda: probes,
@@ -191,4 +208,5 @@ def create_probe_registry(scenarios_paths=None):
         get_attributes=get_attributes,
         add_edited_probe=add_edited_probe,
         add_probes=add_probes,
+        on_probes_added=on_probes_added,
     )
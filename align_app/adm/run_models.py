@@ -1,5 +1,5 @@
-from typing import Dict, Optional, List
-from pydantic import BaseModel
+from typing import Any, Dict, List, Mapping, Optional
+from pydantic import BaseModel, PrivateAttr
 import hashlib
 import json
 from .decider.types import DeciderParams
@@ -59,7 +59,20 @@ class RunDecision(BaseModel):
         )
 
 
+# Run fields that feed hash_run_params
+_CACHE_KEY_FIELDS = frozenset(
+    {"probe_id", "decider_name", "llm_backbone_name", "decider_params"}
+)
+
+
 class Run(BaseModel):
+    """A decision request and, once decided, its result.
+
+    Runs are treated as immutable: edits go through model_copy(update=...).
+    The cache key is computed once per Run and carried over by copies that
+    leave the hashed fields alone.
+    """
+
     model_config = {"arbitrary_types_allowed": True}
 
     id: str
@@ -70,10 +83,33 @@ class Run(BaseModel):
     system_prompt: str
     decision: Optional[RunDecision] = None
 
+    _cache_key: Optional[str] = PrivateAttr(default=None)
+
     def compute_cache_key(self) -> str:
-        return hash_run_params(
-            probe_id=self.probe_id,
-            decider_name=self.decider_name,
-            llm_backbone_name=self.llm_backbone_name,
-            decider_params=self.decider_params,
-        )
+        if self._cache_key is None:
+            self._cache_key = hash_run_params(
+                probe_id=self.probe_id,
+                decider_name=self.decider_name,
+                llm_backbone_name=self.llm_backbone_name,
+                decider_params=self.decider_params,
+            )
+        return self._cache_key
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> "Run":
+        copy = super().model_copy(update=update, deep=deep)
+        if update and not _CACHE_KEY_FIELDS.isdisjoint(update):
+            copy._cache_key = None
+        return copy
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _CACHE_KEY_FIELDS:
+            self._cache_key = None
+        super().__setattr__(name, value)
+
+    def __eq__(self, other: object) -> bool:
+        # BaseModel also compares private attributes; the memo is not state
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__
@@ -2,7 +2,7 @@
 
 from pathlib import Path
 from typing import Dict, List, Any, Set
-import align_system
+from align_app.utils.utils import package_dir
 
 ADM_BLACKLIST: Set[str] = {
     "hybrid_kaleido",
@@ -26,7 +26,7 @@ ADM_BLACKLIST: Set[str] = {
 
 def get_system_adm_configs_dir() -> Path:
     """Get the path to align-system's ADM configs directory."""
-    return Path(align_system.__file__).parent / "configs" / "adm"
+    return package_dir("align_system") / "configs" / "adm"
 
 
 def categorize_adm(name: str) -> str:
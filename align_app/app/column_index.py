@@ -0,0 +1,217 @@
+"""Bitmap index over table rows for fast multi-column filtering.
+
+Each row gets a slot number in insertion order. For every indexed column,
+each distinct value maps to the slots holding it: a Python int bitset once
+the value is common, a plain set of slots while it is rare (so columns with
+thousands of distinct values do not cost one n-bit int each). A filter is an
+OR across the selected values of a column and an AND across columns.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+# Values held by more rows than this get an int bitset instead of a slot set
+SPARSE_LIMIT = 512
+
+Slots = Union[int, Set[int]]
+
+
+def bits_from_slots(slots: Iterable[int], size: int) -> int:
+    buffer = bytearray((size + 7) // 8)
+    for slot in slots:
+        buffer[slot >> 3] |= 1 << (slot & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def slots_from_bits(bits: int) -> List[int]:
+    """Set bit positions, ascending."""
+    binary = bin(bits)[:1:-1]
+    slots = []
+    position = binary.find("1")
+    while position != -1:
+        slots.append(position)
+        position = binary.find("1", position + 1)
+    return slots
+
+
+class ColumnIndex:
+    """Row ids by column value, updated in place as rows change."""
+
+    def __init__(self, columns: Sequence[str]):
+        self.columns = list(columns)
+        self.clear()
+
+    def clear(self):
+        self._slot_by_id: Dict[str, int] = {}
+        self._ids: List[Optional[str]] = []
+        self._row_values: List[Optional[Tuple[Any, ...]]] = []
+        self._postings: Dict[str, Dict[Any, Slots]] = {c: {} for c in self.columns}
+
+    def __len__(self) -> int:
+        return len(self._slot_by_id)
+
+    def __contains__(self, row_id: object) -> bool:
+        return row_id in self._slot_by_id
+
+    def rebuild(self, rows: Iterable[Tuple[str, Dict[str, Any]]]):
+        """Replace the contents with (row_id, row) pairs in one pass."""
+        self.clear()
+        slots: Dict[str, Dict[Any, List[int]]] = {c: {} for c in self.columns}
+        for slot, (row_id, row) in enumerate(rows):
+            values = tuple(row.get(column) for column in self.columns)
+            self._slot_by_id[row_id] = slot
+            self._ids.append(row_id)
+            self._row_values.append(values)
+            for column, value in zip(self.columns, values):
+                slots[column].setdefault(value, []).append(slot)
+        size = len(self._ids)
+        for column, by_value in slots.items():
+            self._postings[column] = {
+                value: (
+                    bits_from_slots(value_slots, size)
+                    if len(value_slots) > SPARSE_LIMIT
+                    else set(value_slots)
+                )
+                for value, value_slots in by_value.items()
+            }
+
+    def add(self, row_id: str, row: Dict[str, Any]):
+        """Insert a row, or re-index it in its existing slot."""
+        slot = self._slot_by_id.get(row_id)
+        if slot is None:
+            slot = len(self._ids)
+            self._slot_by_id[row_id] = slot
+            self._ids.append(row_id)
+            self._row_values.append(None)
+        else:
+            self._unindex(slot)
+        values = tuple(row.get(column) for column in self.columns)
+        self._row_values[slot] = values
+        for column, value in zip(self.columns, values):
+            postings = self._postings[column]
+            current = postings.get(value)
+            if current is None:
+                postings[value] = {slot}
+            elif isinstance(current, int):
+                postings[value] = current | (1 << slot)
+            else:
+                current.add(slot)
+                if len(current) > SPARSE_LIMIT:
+                    postings[value] = bits_from_slots(current, len(self._ids))
+
+    def remove(self, row_id: str):
+        slot = self._slot_by_id.pop(row_id, None)
+        if slot is None:
+            return
+        self._unindex(slot)
+        self._ids[slot] = None
+        self._row_values[slot] = None
+        if len(self._ids) > 4 * SPARSE_LIMIT and 2 * len(self) < len(self._ids):
+            self._compact()
+
+    def _unindex(self, slot: int):
+        values = self._row_values[slot]
+        assert values is not None
+        for column, value in zip(self.columns, values):
+            postings = self._postings[column]
+            current = postings[value]
+            if isinstance(current, int):
+                current &= ~(1 << slot)
+                if current:
+                    postings[value] = current
+                else:
+                    del postings[value]
+            else:
+                current.discard(slot)
+                if not current:
+                    del postings[value]
+
+    def _compact(self):
+        """Drop freed slots so bitsets stop growing with removed rows."""
+        live = [
+            (row_id, dict(zip(self.columns, values)))
+            for row_id, values in zip(self._ids, self._row_values)
+            if row_id is not None and values is not None
+        ]
+        self.rebuild(live)
+
+    def values(self, column: str) -> List[Any]:
+        return list(self._postings[column])
+
+    def has_value(self, column: str, value: Any) -> bool:
+        return value in self._postings[column]
+
+    def counts(self, column: str, within: Optional[int] = None) -> Dict[Any, int]:
+        """Rows per value of column, only counting slots in within when given."""
+        postings = self._postings[column]
+        if within is None:
+            return {
+                value: current.bit_count() if isinstance(current, int) else len(current)
+                for value, current in postings.items()
+            }
+        if not within:
+            return dict.fromkeys(postings, 0)
+        # Byte lookups keep slot-set counts O(1) per slot instead of a big shift
+        mask = within.to_bytes((within.bit_length() + 7) // 8, "little")
+        size = len(mask)
+        counts = {}
+        for value, current in postings.items():
+            if isinstance(current, int):
+                counts[value] = (current & within).bit_count()
+            else:
+                counts[value] = sum(
+                    1
+                    for slot in current
+                    if slot >> 3 < size and mask[slot >> 3] >> (slot & 7) & 1
+                )
+        return counts
+
+    def column_bits(self, column: str, selected: Iterable[Any]) -> Optional[int]:
+        """Bitset of slots holding any selected value, None if none selected."""
+        postings = self._postings[column]
+        bits = 0
+        sparse: List[int] = []
+        any_selected = False
+        for value in selected:
+            any_selected = True
+            current = postings.get(value)
+            if current is None:
+                continue
+            if isinstance(current, int):
+                bits |= current
+            else:
+                sparse.extend(current)
+        if not any_selected:
+            return None
+        if sparse:
+            bits |= bits_from_slots(sparse, len(self._ids))
+        return bits
+
+    def match_bits(self, filters: Iterable[Tuple[str, Iterable[Any]]]) -> Optional[int]:
+        """Bitset of slots matching every (column, selected values) filter.
+
+        Columns with no selected values are ignored; None means no filter
+        applies (every row matches).
+        """
+        result: Optional[int] = None
+        for column, selected in filters:
+            bits = self.column_bits(column, selected)
+            if bits is None:
+                continue
+            result = bits if result is None else result & bits
+            if not result:
+                return 0
+        return result
+
+    def ids(self, bits: Optional[int] = None) -> List[str]:
+        """Row ids in insertion order, only those in bits when given."""
+        if bits is None:
+            return [row_id for row_id in self._ids if row_id is not None]
+        ids = self._ids
+        return [
+            row_id
+            for row_id in (ids[slot] for slot in slots_from_bits(bits))
+            if row_id is not None
+        ]
+
+    def match(self, filters: Iterable[Tuple[str, Iterable[Any]]]) -> List[str]:
+        return self.ids(self.match_bits(filters))
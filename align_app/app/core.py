@@ -1,11 +1,15 @@
 from pathlib import Path
 from trame.app import get_server
 from trame.decorators import TrameApp, controller
-from . import ui
+from . import startup_profile, ui
 from .search import SearchController
+from .decider_metrics import DeciderMetricsController
 from .runs_registry import RunsRegistry
+from .decision_store import DecisionStore, default_decision_cache_path
 from .runs_state_adapter import RunsStateAdapter
+from ..adm.decider import configure_decider, ModelCacheLimits
 from ..adm.decider_registry import create_decider_registry
+from ..adm.hydra_config_loader import configure_config_cache, default_config_cache_path
 from ..adm.probe_registry import create_probe_registry
 from .import_experiments import import_experiments
 
@@ -35,19 +39,101 @@ class AlignApp:
             help="Path to directory containing pre-computed experiment results",
         )
 
+        self.server.cli.add_argument(
+            "--model-cache-size",
+            type=int,
+            default=1,
+            help="Number of instantiated deciders to keep loaded (LRU eviction)",
+        )
+
+        self.server.cli.add_argument(
+            "--model-cache-ram",
+            type=float,
+            default=None,
+            help="RAM budget in GiB for loaded deciders (default: unbounded)",
+        )
+
+        self.server.cli.add_argument(
+            "--model-cache-vram",
+            type=float,
+            default=None,
+            help="GPU memory budget in GiB for loaded deciders (default: unbounded)",
+        )
+
+        self.server.cli.add_argument(
+            "--decider-workers",
+            type=int,
+            default=1,
+            help="Number of decider worker processes (each has its own model cache)",
+        )
+
+        self.server.cli.add_argument(
+            "--decision-cache",
+            nargs="?",
+            const=str(default_decision_cache_path()),
+            default=None,
+            metavar="PATH",
+            help=(
+                "Persist decisions across restarts in a SQLite file, shareable "
+                "by several app processes (default path: %(const)s)"
+            ),
+        )
+
+        self.server.cli.add_argument(
+            "--decision-cache-size",
+            type=float,
+            default=1.0,
+            help="Size budget in GiB for the decision cache file (LRU eviction)",
+        )
+
+        self.server.cli.add_argument(
+            "--config-cache",
+            default=str(default_config_cache_path()),
+            help=(
+                "Directory persisting composed Hydra decider configs across "
+                "restarts (default: %(default)s)"
+            ),
+        )
+
+        self.server.cli.add_argument(
+            "--no-config-cache",
+            action="store_true",
+            help="Compose decider configs with Hydra on every start",
+        )
+
+        self.server.cli.add_argument(
+            startup_profile.PROFILE_FLAG,
+            action="store_true",
+            help="Print import and initialization times once the server is ready",
+        )
+
         args, _ = self.server.cli.parse_known_args()
 
+        configure_config_cache(None if args.no_config_cache else args.config_cache)
+
+        with startup_profile.phase("decider workers"):
+            configure_decider(
+                ModelCacheLimits.from_gib(
+                    max_models=args.model_cache_size,
+                    max_ram_gib=args.model_cache_ram,
+                    max_vram_gib=args.model_cache_vram,
+                ),
+                num_workers=args.decider_workers,
+            )
+
         # Skip default probes if either --scenarios or --experiments is provided
         scenarios_paths = args.scenarios
         if args.experiments and scenarios_paths is None:
             scenarios_paths = []
 
-        self._probe_registry = create_probe_registry(scenarios_paths)
+        with startup_profile.phase("probe registry"):
+            self._probe_registry = create_probe_registry(scenarios_paths)
 
         experiment_result = None
         if args.experiments:
-            experiment_result = import_experiments(Path(args.experiments))
-            self._probe_registry.add_probes(experiment_result.probes)
+            with startup_profile.phase("import experiments"):
+                experiment_result = import_experiments(Path(args.experiments))
+                self._probe_registry.add_probes(experiment_result.probes)
 
         self._cli_decider_paths = args.deciders or []
         self._system_adm_paths: list[str] = []
@@ -55,37 +141,52 @@ class AlignApp:
             experiment_result.deciders if experiment_result else {}
         )
 
-        self._decider_registry = create_decider_registry(
-            self._cli_decider_paths,
-            self._probe_registry,
-            experiment_deciders=self._experiment_deciders,
-        )
-        self._runs_registry = RunsRegistry(
-            self._probe_registry,
-            self._decider_registry,
-        )
-
-        if experiment_result:
-            self._runs_registry.add_experiment_items(experiment_result.items)
-
-        self._runsController = RunsStateAdapter(
-            self.server,
-            self._probe_registry,
-            self._decider_registry,
-            self._runs_registry,
-            self.add_system_adm,
-        )
-        self._search_controller = SearchController(
-            self.server,
-            self._probe_registry,
-            on_search_select=self._handle_search_select,
-        )
+        with startup_profile.phase("decider registry"):
+            self._decider_registry = create_decider_registry(
+                self._cli_decider_paths,
+                self._probe_registry,
+                experiment_deciders=self._experiment_deciders,
+            )
+
+        with startup_profile.phase("runs registry"):
+            decision_store = None
+            if args.decision_cache:
+                decision_store = DecisionStore(
+                    args.decision_cache,
+                    max_bytes=int(args.decision_cache_size * 1024**3),
+                )
+            self._runs_registry = RunsRegistry(
+                self._probe_registry,
+                self._decider_registry,
+                decision_store,
+            )
+
+            if experiment_result:
+                self._runs_registry.add_experiment_items(experiment_result.items)
+
+        with startup_profile.phase("controllers"):
+            self._runsController = RunsStateAdapter(
+                self.server,
+                self._probe_registry,
+                self._decider_registry,
+                self._runs_registry,
+                self.add_system_adm,
+            )
+            self._search_controller = SearchController(
+                self.server,
+                self._probe_registry,
+                on_search_select=self._handle_search_select,
+            )
+
+            self._metrics_controller = DeciderMetricsController(self.server)
 
         if self.server.hot_reload:
             self.server.controller.on_server_reload.add(self._build_ui)
 
-        self._build_ui()
-        self.reset_state()
+        with startup_profile.phase("ui"):
+            self._build_ui()
+        with startup_profile.phase("default run"):
+            self.reset_state()
 
     def _handle_search_select(self, run_id: str, scenario_id: str, scene_id: str):
         new_run_id = self._runsController.update_run_scenario(run_id, scenario_id)
@@ -0,0 +1,40 @@
+from trame.decorators import TrameApp, controller
+from ..adm.decider import get_metrics, render_metrics
+
+METRICS_ROUTE = "/metrics"
+
+
+@TrameApp()
+class DeciderMetricsController:
+    """Serves decider metrics at /metrics and backs the metrics panel."""
+
+    def __init__(self, server):
+        self.server = server
+        self.server.state.decider_metrics_open = False
+        self.server.state.decider_metrics_rows = []
+        self.server.controller.on_server_bind.add(self._bind_routes)
+
+    def _bind_routes(self, wslink_server):
+        wslink_server.app.router.add_get(METRICS_ROUTE, self._handle_metrics)
+
+    async def _handle_metrics(self, _request):
+        from aiohttp import web
+
+        return web.Response(
+            body=render_metrics().encode("utf-8"),
+            headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"},
+        )
+
+    @controller.set("refresh_decider_metrics")
+    def refresh_decider_metrics(self):
+        metrics = get_metrics()
+        self.server.state.decider_metrics_rows = metrics.rows() if metrics else []
+
+    @controller.set("open_decider_metrics")
+    def open_decider_metrics(self):
+        self.refresh_decider_metrics()
+        self.server.state.decider_metrics_open = True
+
+    @controller.set("close_decider_metrics")
+    def close_decider_metrics(self):
+        self.server.state.decider_metrics_open = False
@@ -0,0 +1,263 @@
+"""Persistent decision cache shared across restarts and app processes.
+
+Runs.decision_cache only lives as long as the process. DecisionStore keeps
+every decision in a SQLite database keyed by hash_run_params, so a restarted
+app (or another app on the same host pointed at the same file) reuses
+decisions instead of running inference again.
+
+SQLite handles locking between processes; the database runs in WAL mode so
+readers never wait on a writer. Payloads are zlib-compressed JSON. Once the
+stored payloads exceed max_bytes, the least recently read decisions are
+deleted. Triggers keep a running total of payload sizes, and read times are
+written in batches rather than on every read.
+
+Keys are prefixed with the align-app and align-system versions, so an upgrade
+never serves decisions made by an older ADM; those rows age out by LRU.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from importlib import metadata
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from .. import __version__
+from ..adm.run_models import RunDecision
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 1024**3
+SCHEMA_VERSION = 2
+# Pending read times are written once this many accumulate, or this old
+ACCESS_FLUSH_ITEMS = 64
+ACCESS_FLUSH_SECONDS = 30.0
+# Keys per SELECT in get_many, below SQLite's bound parameter limit
+READ_BATCH_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS decisions (
+    cache_key TEXT PRIMARY KEY,
+    payload BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS decisions_accessed ON decisions (accessed);
+CREATE TABLE IF NOT EXISTS totals (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO totals (id, bytes) VALUES (0, 0);
+CREATE TRIGGER IF NOT EXISTS decisions_inserted AFTER INSERT ON decisions
+BEGIN UPDATE totals SET bytes = bytes + NEW.size; END;
+CREATE TRIGGER IF NOT EXISTS decisions_deleted AFTER DELETE ON decisions
+BEGIN UPDATE totals SET bytes = bytes - OLD.size; END;
+CREATE TRIGGER IF NOT EXISTS decisions_resized AFTER UPDATE OF size ON decisions
+BEGIN UPDATE totals SET bytes = bytes - OLD.size + NEW.size; END;
+"""
+
+
+def default_decision_cache_path() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "align-app" / "decisions.sqlite"
+
+
+def default_namespace() -> str:
+    """Versions stored decisions depend on, prefixed to every key."""
+    try:
+        align_system_version = metadata.version("align-system")
+    except metadata.PackageNotFoundError:
+        align_system_version = "unknown"
+    return f"align-app={__version__};align-system={align_system_version}"
+
+
+class DecisionStore:
+    """SQLite-backed map of cache_key -> RunDecision with size-based eviction.
+
+    Safe to share between threads (one connection behind a lock) and between
+    processes (SQLite file locking). Errors reading or writing the database
+    are logged and treated as cache misses so a broken cache never blocks a
+    decision.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        namespace: Optional[str] = None,
+    ) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.namespace = default_namespace() if namespace is None else namespace
+        # Read times not yet written, by stored key
+        self._accessed: Dict[str, float] = {}
+        self._last_flush = time.monotonic()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, timeout=30.0, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            self._conn.executescript(
+                "DROP TABLE IF EXISTS decisions; DROP TABLE IF EXISTS totals;"
+                f"{_SCHEMA}PRAGMA user_version={SCHEMA_VERSION};"
+            )
+        else:
+            self._conn.executescript(_SCHEMA)
+
+    def _key(self, cache_key: str) -> str:
+        return f"{self.namespace}:{cache_key}"
+
+    def get(self, cache_key: str) -> Optional[RunDecision]:
+        return self.get_many([cache_key]).get(cache_key)
+
+    def get_many(self, cache_keys: Iterable[str]) -> Dict[str, RunDecision]:
+        """Stored decisions for cache_keys in one locked pass; misses are left out."""
+        keys = {self._key(cache_key): cache_key for cache_key in cache_keys}
+        stored = list(keys)
+        rows: List[Tuple[str, bytes]] = []
+        try:
+            with self._lock:
+                for start in range(0, len(stored), READ_BATCH_SIZE):
+                    batch = stored[start : start + READ_BATCH_SIZE]
+                    placeholders = ", ".join("?" * len(batch))
+                    rows += self._conn.execute(
+                        "SELECT cache_key, payload FROM decisions "
+                        f"WHERE cache_key IN ({placeholders})",
+                        batch,
+                    ).fetchall()
+                now = time.time()
+                for key, _ in rows:
+                    self._accessed[key] = now
+                if rows and (
+                    len(self._accessed) >= ACCESS_FLUSH_ITEMS
+                    or time.monotonic() - self._last_flush >= ACCESS_FLUSH_SECONDS
+                ):
+                    self._flush_accessed()
+        except sqlite3.Error:
+            logger.warning("Decision cache read failed", exc_info=True)
+            return {}
+
+        decisions: Dict[str, RunDecision] = {}
+        for key, payload in rows:
+            try:
+                decisions[keys[key]] = RunDecision.model_validate_json(
+                    zlib.decompress(payload)
+                )
+            except Exception:
+                logger.warning("Dropping unreadable cached decision %s", keys[key])
+                self.delete(keys[key])
+        return decisions
+
+    def __contains__(self, cache_key: str) -> bool:
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT 1 FROM decisions WHERE cache_key = ?",
+                    (self._key(cache_key),),
+                ).fetchone()
+        except sqlite3.Error:
+            logger.warning("Decision cache read failed", exc_info=True)
+            return False
+        return row is not None
+
+    def put(self, cache_key: str, decision: RunDecision) -> None:
+        try:
+            payload = zlib.compress(decision.model_dump_json().encode())
+        except Exception:
+            logger.warning("Decision %s is not serializable", cache_key, exc_info=True)
+            return
+
+        now = time.time()
+        try:
+            with self._lock:
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    # Upsert rather than REPLACE, which skips the delete trigger
+                    self._conn.execute(
+                        "INSERT INTO decisions "
+                        "(cache_key, payload, size, created, accessed) "
+                        "VALUES (?, ?, ?, ?, ?) ON CONFLICT (cache_key) DO UPDATE "
+                        "SET payload = excluded.payload, size = excluded.size, "
+                        "created = excluded.created, accessed = excluded.accessed",
+                        (self._key(cache_key), payload, len(payload), now, now),
+                    )
+                    self._write_accessed()
+                    self._evict()
+                    self._conn.execute("COMMIT")
+                except BaseException:
+                    self._conn.execute("ROLLBACK")
+                    raise
+        except sqlite3.Error:
+            logger.warning("Decision cache write failed", exc_info=True)
+
+    def delete(self, cache_key: str) -> None:
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "DELETE FROM decisions WHERE cache_key = ?",
+                    (self._key(cache_key),),
+                )
+        except sqlite3.Error:
+            logger.warning("Decision cache delete failed", exc_info=True)
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._total_bytes()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM decisions").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                self._flush_accessed()
+            except sqlite3.Error:
+                logger.warning("Decision cache write failed", exc_info=True)
+            self._conn.close()
+
+    def _total_bytes(self) -> int:
+        return self._conn.execute("SELECT bytes FROM totals").fetchone()[0]
+
+    def _write_accessed(self) -> None:
+        """Write pending read times (caller holds the lock)."""
+        if self._accessed:
+            self._conn.executemany(
+                "UPDATE decisions SET accessed = ? WHERE cache_key = ?",
+                [(accessed, key) for key, accessed in self._accessed.items()],
+            )
+            self._accessed.clear()
+        self._last_flush = time.monotonic()
+
+    def _flush_accessed(self) -> None:
+        """Write pending read times in their own transaction."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._write_accessed()
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def _evict(self) -> None:
+        """Delete least recently read rows until under max_bytes (in a txn)."""
+        total = self._total_bytes()
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT cache_key, size FROM decisions ORDER BY accessed"
+        )
+        doomed = []
+        for cache_key, size in rows:
+            if total <= self.max_bytes:
+                break
+            doomed.append((cache_key,))
+            total -= size
+        self._conn.executemany("DELETE FROM decisions WHERE cache_key = ?", doomed)
@@ -1,12 +1,17 @@
 import logging
 
-from .core import AlignApp
+from . import startup_profile
 
 logging.getLogger().setLevel(logging.WARNING)
 
 
 def main(server=None, **kwargs):
+    if startup_profile.requested():
+        startup_profile.start()
+    with startup_profile.phase("import app"):
+        from .core import AlignApp
     app = AlignApp(server)
+    startup_profile.report_when_ready(app.server)
     app.server.start(**kwargs)
 
 
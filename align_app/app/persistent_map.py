@@ -0,0 +1,143 @@
+"""Immutable mapping with O(1) updates, backing the runs store.
+
+runs_core treats Runs as an immutable value: every edit returns a new Runs
+and older snapshots stay valid. Copying the whole dict per edit made that
+O(n). PersistentMap keeps the same semantics with a version chain (Baker's
+rerooting): the newest version owns a single shared dict, and each older
+version only records the changes that undo what came after it. Updating the
+newest version is O(1). Reading an old version first replays the undo
+records to move the shared dict back to it (O(changes in between)), which
+makes the old version the owner again.
+
+Writers normally work on the newest version, so the rerooting path is only
+taken by the rare code that holds on to an old snapshot. A key removed and
+later restored by rerooting moves to the end of the iteration order.
+"""
+
+import threading
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+_MISSING: Any = object()
+
+# Rerooting mutates every version sharing the dict, so it must not interleave
+_lock = threading.RLock()
+
+
+class PersistentMap(Mapping[K, V], Generic[K, V]):
+    __slots__ = ("_data", "_undo", "_next")
+
+    def __init__(self, items: Optional[Mapping[K, V]] = None):
+        # Owner: _data is the shared dict. Otherwise _undo lists
+        # (key, value or _MISSING) that, applied in reverse to _next, give
+        # this version.
+        self._data: Optional[Dict[K, V]] = dict(items) if items else {}
+        self._undo: List[Tuple[K, V]] = []
+        self._next: Optional["PersistentMap[K, V]"] = None
+
+    @classmethod
+    def _owning(cls, data: Dict[K, V]) -> "PersistentMap[K, V]":
+        version = cls.__new__(cls)
+        version._data = data
+        version._undo = []
+        version._next = None
+        return version
+
+    def _reroot(self) -> Dict[K, V]:
+        """Make this version the owner of the shared dict and return it."""
+        if self._data is not None:
+            return self._data
+
+        path = []
+        version = self
+        while version._data is None:
+            path.append(version)
+            assert version._next is not None
+            version = version._next
+
+        data = version._data
+        for older in reversed(path):
+            newer = older._next
+            assert newer is not None
+            redo = []
+            for key, value in reversed(older._undo):
+                redo.append((key, data.get(key, _MISSING)))
+                _assign(data, key, value)
+            newer._data, newer._undo, newer._next = None, redo, older
+            older._data, older._undo, older._next = data, [], None
+        return data
+
+    def _with_changes(self, changes: Iterable[Tuple[K, V]]) -> "PersistentMap[K, V]":
+        """New version with (key, value or _MISSING to delete) applied."""
+        with _lock:
+            data = self._reroot()
+            undo = []
+            for key, value in changes:
+                previous = data.get(key, _MISSING)
+                if previous is value:
+                    continue
+                undo.append((key, previous))
+                _assign(data, key, value)
+            if not undo:
+                return self
+            newest = PersistentMap._owning(data)
+            self._data, self._undo, self._next = None, undo, newest
+            return newest
+
+    def set(self, key: K, value: V) -> "PersistentMap[K, V]":
+        return self._with_changes([(key, value)])
+
+    def update(self, items: Iterable[Tuple[K, V]]) -> "PersistentMap[K, V]":
+        return self._with_changes(items)
+
+    def delete(self, key: K) -> "PersistentMap[K, V]":
+        return self._with_changes([(key, _MISSING)])
+
+    def __getitem__(self, key: K) -> V:
+        with _lock:
+            return self._reroot()[key]
+
+    def get(self, key: K, default: Any = None) -> Any:
+        with _lock:
+            return self._reroot().get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        with _lock:
+            return key in self._reroot()
+
+    def __len__(self) -> int:
+        with _lock:
+            return len(self._reroot())
+
+    def __iter__(self) -> Iterator[K]:
+        # Snapshot the keys: a newer version may change the shared dict
+        # while the caller is still iterating.
+        with _lock:
+            return iter(list(self._reroot()))
+
+    def to_dict(self) -> Dict[K, V]:
+        with _lock:
+            return dict(self._reroot())
+
+    def __repr__(self) -> str:
+        return f"PersistentMap({self.to_dict()!r})"
+
+
+def _assign(data: Dict, key: Any, value: Any) -> None:
+    if value is _MISSING:
+        del data[key]
+    else:
+        data[key] = value
@@ -1,21 +1,64 @@
 from dataclasses import dataclass, replace
-from typing import Dict, Optional, List
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
 from ..adm.run_models import Run, RunDecision
-from ..adm.decider import get_decision
+from ..adm.decider import ProgressEvent, get_decision, get_decisions
+from .persistent_map import PersistentMap
 
 
 @dataclass(frozen=True)
 class Runs:
-    runs: Dict[str, Run]
-    decision_cache: Dict[str, RunDecision]
+    """Immutable runs state; each operation returns a new Runs in O(1).
+
+    The maps share structure with earlier snapshots (see PersistentMap).
+    run_ids_by_cache_key indexes runs by cache key, in insertion order.
+    """
+
+    runs: PersistentMap[str, Run]
+    decision_cache: PersistentMap[str, RunDecision]
+    run_ids_by_cache_key: PersistentMap[str, Tuple[str, ...]]
 
     @staticmethod
     def empty():
-        return Runs(runs={}, decision_cache={})
+        return Runs(
+            runs=PersistentMap(),
+            decision_cache=PersistentMap(),
+            run_ids_by_cache_key=PersistentMap(),
+        )
+
+
+def _set_runs(data: Runs, runs: Iterable[Tuple[str, Run]]) -> Runs:
+    """Insert or replace (run_id, run) pairs, keeping the cache key index in sync."""
+    changes = []
+    index_changes: Dict[str, Tuple[str, ...]] = {}
+
+    def ids_for(cache_key: str) -> Tuple[str, ...]:
+        if cache_key in index_changes:
+            return index_changes[cache_key]
+        return data.run_ids_by_cache_key.get(cache_key, ())
+
+    for run_id, run in runs:
+        cache_key = run.compute_cache_key()
+        previous = data.runs.get(run_id)
+        if previous is not None:
+            previous_key = previous.compute_cache_key()
+            if previous_key != cache_key:
+                index_changes[previous_key] = tuple(
+                    rid for rid in ids_for(previous_key) if rid != run_id
+                )
+        ids = ids_for(cache_key)
+        if run_id not in ids:
+            index_changes[cache_key] = (*ids, run_id)
+        changes.append((run_id, run))
+
+    return replace(
+        data,
+        runs=data.runs.update(changes),
+        run_ids_by_cache_key=data.run_ids_by_cache_key.update(index_changes.items()),
+    )
 
 
 def add_run(data: Runs, run: Run) -> Runs:
-    new_data = replace(data, runs={**data.runs, run.id: run})
+    new_data = _set_runs(data, [(run.id, run)])
     if run.decision:
         cache_key = run.compute_cache_key()
         new_data = add_cached_decision(new_data, cache_key, run.decision)
@@ -24,16 +67,11 @@ def add_run(data: Runs, run: Run) -> Runs:
 
 def add_runs_bulk(data: Runs, runs: List[Run]) -> Runs:
     """Add multiple runs efficiently in a single operation."""
-    new_runs = {**data.runs}
-    new_cache = {**data.decision_cache}
-
-    for run in runs:
-        new_runs[run.id] = run
-        if run.decision:
-            cache_key = run.compute_cache_key()
-            new_cache[cache_key] = run.decision
-
-    return Runs(runs=new_runs, decision_cache=new_cache)
+    new_data = _set_runs(data, ((run.id, run) for run in runs))
+    return replace(
+        new_data,
+        decision_cache=data.decision_cache.update(_decisions_by_cache_key(runs)),
+    )
 
 
 def populate_cache_bulk(data: Runs, runs: List[Run]) -> Runs:
@@ -42,26 +80,44 @@ def populate_cache_bulk(data: Runs, runs: List[Run]) -> Runs:
     Use for pre-computed experiment results that should populate cache
     but not appear in UI.
     """
-    new_cache = {**data.decision_cache}
+    return replace(
+        data, decision_cache=data.decision_cache.update(_decisions_by_cache_key(runs))
+    )
 
-    for run in runs:
-        if run.decision:
-            cache_key = run.compute_cache_key()
-            new_cache[cache_key] = run.decision
 
-    return replace(data, decision_cache=new_cache)
+def _decisions_by_cache_key(runs: List[Run]):
+    return ((run.compute_cache_key(), run.decision) for run in runs if run.decision)
 
 
 def remove_run(data: Runs, run_id: str) -> Runs:
-    runs = {rid: run for rid, run in data.runs.items() if rid != run_id}
-    return replace(data, runs=runs)
+    run = data.runs.get(run_id)
+    if run is None:
+        return data
+    cache_key = run.compute_cache_key()
+    ids = tuple(
+        rid for rid in data.run_ids_by_cache_key.get(cache_key, ()) if rid != run_id
+    )
+    index = data.run_ids_by_cache_key
+    return replace(
+        data,
+        runs=data.runs.delete(run_id),
+        run_ids_by_cache_key=index.set(cache_key, ids)
+        if ids
+        else index.delete(cache_key),
+    )
 
 
 def get_run(data: Runs, run_id: str) -> Optional[Run]:
     return data.runs.get(run_id)
 
 
-def get_all_runs(data: Runs) -> Dict[str, Run]:
+def get_run_by_cache_key(data: Runs, cache_key: str) -> Optional[Run]:
+    """First run added with this cache key, in O(1)."""
+    ids = data.run_ids_by_cache_key.get(cache_key)
+    return data.runs.get(ids[0]) if ids else None
+
+
+def get_all_runs(data: Runs) -> Mapping[str, Run]:
     return data.runs
 
 
@@ -94,19 +150,41 @@ def apply_cached_decision(data: Runs, run: Run) -> Run:
 
 
 def add_cached_decision(data: Runs, cache_key: str, decision: RunDecision) -> Runs:
-    return replace(data, decision_cache={**data.decision_cache, cache_key: decision})
+    return replace(data, decision_cache=data.decision_cache.set(cache_key, decision))
 
 
-async def fetch_decision(run: Run, probe_choices: List[Dict]) -> RunDecision:
+async def fetch_decision(
+    run: Run,
+    probe_choices: List[Dict],
+    request_id: Optional[str] = None,
+    on_progress: Optional[Callable[[ProgressEvent], None]] = None,
+) -> RunDecision:
     """Async function that just fetches the decision without modifying data.
 
     This separation is critical for concurrency: the caller should add the
     result to CURRENT data state after awaiting, not to stale data.
     """
-    adm_result = await get_decision(run.decider_params)
+    adm_result = await get_decision(
+        run.decider_params, request_id=request_id, on_progress=on_progress
+    )
     return RunDecision.from_adm_result(adm_result, probe_choices)
 
 
+async def fetch_decisions(
+    runs: List[Run], probe_choices: List[List[Dict]]
+) -> List[RunDecision | Exception]:
+    """Batch counterpart of fetch_decision, one result or error per run in order."""
+    adm_results = await get_decisions(
+        [run.decider_params for run in runs], return_exceptions=True
+    )
+    return [
+        result
+        if isinstance(result, Exception)
+        else RunDecision.from_adm_result(result, choices)
+        for result, choices in zip(adm_results, probe_choices)
+    ]
+
+
 def update_run(data: Runs, run_id: str, updated_run: Run) -> Runs:
     """Generic run updater with cache check.
 
@@ -115,7 +193,7 @@ def update_run(data: Runs, run_id: str, updated_run: Run) -> Runs:
     Pure domain operation - receives already-transformed run.
     """
     updated_run = apply_cached_decision(data, updated_run)
-    return replace(data, runs={**data.runs, run_id: updated_run})
+    return _set_runs(data, [(run_id, updated_run)])
 
 
 def init_runs() -> Runs:
@@ -123,7 +201,7 @@ def init_runs() -> Runs:
 
 
 def clear_runs(data: Runs) -> Runs:
-    return replace(data, runs={})
+    return replace(data, runs=PersistentMap(), run_ids_by_cache_key=PersistentMap())
 
 
 def clear_all(data: Runs) -> Runs:
@@ -1,14 +1,13 @@
 """Transform domain models to UI state dictionaries and export formats."""
 
-from typing import Dict, Any, List
+from collections import OrderedDict
+from typing import Callable, Dict, Any, List, Optional
 from ..adm.run_models import Run, RunDecision, hash_run_params
 from .ui import prep_decision_for_state
 from ..adm.probe import Probe, get_probe_id
 from ..adm.decider.types import DeciderParams
 from ..utils.utils import readable
 from align_utils.models import ExperimentItem
-from ..adm.config import get_decider_config
-from omegaconf import OmegaConf
 import json
 import copy
 import yaml
@@ -189,35 +188,6 @@ def kdma_values_to_alignment_attributes(
     return result
 
 
-def _get_attribute_descriptions(
-    run: Run, probe_registry, decider_registry
-) -> Dict[str, Any]:
-    """Extract attribute_definitions from decider config."""
-    all_deciders = decider_registry.get_all_deciders()
-    datasets = probe_registry.get_datasets()
-    config = get_decider_config(run.probe_id, all_deciders, datasets, run.decider_name)
-    if not config:
-        return {}
-
-    config.pop("instance", None)
-    config.pop("step_definitions", None)
-
-    OmegaConf.register_new_resolver(
-        "ref", lambda path: f"${{ref:{path}}}", replace=True
-    )
-    try:
-        resolved = OmegaConf.to_container(
-            OmegaConf.create({"adm": config}), resolve=True
-        )
-        if isinstance(resolved, dict):
-            return resolved.get("adm", {}).get("attribute_definitions", {})
-    except Exception:
-        pass
-    finally:
-        OmegaConf.clear_resolver("ref")
-    return {}
-
-
 def _compute_possible_alignment_attributes(
     run: Run, all_attrs: Dict, descriptions: Dict
 ) -> List[Dict[str, Any]]:
@@ -235,6 +205,44 @@ def _compute_possible_alignment_attributes(
     ]
 
 
+class PresentationCache:
+    """Memoized lookups shared across run_to_state_dict calls.
+
+    Scene lists depend only on the scenario, so the columns of one comparison
+    mostly share them; the owner calls invalidate() when probes are added.
+    System prompts and attribute descriptions are cached by the decider
+    registry itself. Config YAML is keyed by run cache key and kept in a
+    bounded LRU.
+    """
+
+    def __init__(self, max_yaml_entries: int = 256):
+        self._scenes: Dict[str, List[Dict]] = {}
+        self._max_yaml_entries = max_yaml_entries
+        self._yaml: OrderedDict[str, str] = OrderedDict()
+
+    def invalidate(self, *_):
+        """Forget probe-derived entries (usable as an on_probes_added listener)."""
+        self._scenes.clear()
+
+    def scenes(self, scenario_id: str, compute: Callable[[], List[Dict]]):
+        if scenario_id not in self._scenes:
+            self._scenes[scenario_id] = compute()
+        return self._scenes[scenario_id]
+
+    def config_yaml(
+        self, cache_key: str, resolved_config: Dict[str, Any] | None
+    ) -> str:
+        cached = self._yaml.get(cache_key)
+        if cached is not None:
+            self._yaml.move_to_end(cache_key)
+            return cached
+        text = resolved_config_to_yaml(resolved_config)
+        self._yaml[cache_key] = text
+        if len(self._yaml) > self._max_yaml_entries:
+            self._yaml.popitem(last=False)
+        return text
+
+
 def decision_to_state_dict(decision: RunDecision) -> Dict[str, Any]:
     choice_letter = chr(decision.choice_index + ord("A"))
 
@@ -248,7 +256,10 @@ def decision_to_state_dict(decision: RunDecision) -> Dict[str, Any]:
 
 
 def run_to_state_dict(
-    run: Run, probe_registry=None, decider_registry=None
+    run: Run,
+    probe_registry=None,
+    decider_registry=None,
+    cache: Optional[PresentationCache] = None,
 ) -> Dict[str, Any]:
     scenario_input = run.decider_params.scenario_input
 
@@ -276,8 +287,17 @@ def run_to_state_dict(
 
     scene_items = []
     if probe_registry:
-        probes = probe_registry.get_probes()
-        scene_items = get_scenes_for_base_scenario(probes, scenario_input.scenario_id)
+
+        def compute_scenes():
+            return get_scenes_for_base_scenario(
+                probe_registry.get_probes(), scenario_input.scenario_id
+            )
+
+        scene_items = (
+            compute_scenes()
+            if cache is None
+            else cache.scenes(scenario_input.scenario_id, compute_scenes)
+        )
 
     decider_items = []
     llm_backbone_items = ["N/A"]
@@ -303,8 +323,8 @@ def run_to_state_dict(
 
     if probe_registry and decider_registry:
         all_attrs = probe_registry.get_attributes(run.probe_id)
-        descriptions = _get_attribute_descriptions(
-            run, probe_registry, decider_registry
+        descriptions = decider_registry.get_attribute_definitions(
+            run.probe_id, run.decider_name
         )
 
         alignment_attributes = kdma_values_to_alignment_attributes(
@@ -314,12 +334,7 @@ def run_to_state_dict(
             run, all_attrs, descriptions
         )
 
-    cache_key = hash_run_params(
-        probe_id=run.probe_id,
-        decider_name=run.decider_name,
-        llm_backbone_name=run.llm_backbone_name,
-        decider_params=run.decider_params,
-    )
+    cache_key = run.compute_cache_key()
 
     alignment_summary = (
         ", ".join(f"{a['title']} {a['score']}" for a in alignment_attributes)
@@ -352,8 +367,10 @@ def run_to_state_dict(
             },
             "system_prompt": system_prompt,
             "resolved_config": run.decider_params.resolved_config,
-            "resolved_config_yaml": resolved_config_to_yaml(
-                run.decider_params.resolved_config
+            "resolved_config_yaml": (
+                resolved_config_to_yaml(run.decider_params.resolved_config)
+                if cache is None
+                else cache.config_yaml(cache_key, run.decider_params.resolved_config)
             ),
             "decider": {"name": run.decider_name},
             "llm_backbone": run.llm_backbone_name,
@@ -1,20 +1,84 @@
 """Service layer managing run state and coordinating domain operations."""
 
+import asyncio
 from typing import Optional, Dict, List, Any, Callable
-from ..adm.run_models import Run
+from ..adm.run_models import Run, RunDecision
+from ..adm.decider import ProgressEvent
 from . import runs_core
 from . import runs_edit_logic
 from ..utils.utils import get_id
 from .import_experiments import StoredExperimentItem, run_from_stored_experiment_item
+from .decision_store import DecisionStore
 
 
 class RunsRegistry:
-    def __init__(self, probe_registry, decider_registry):
+    def __init__(
+        self,
+        probe_registry,
+        decider_registry,
+        decision_store: Optional[DecisionStore] = None,
+    ):
         self._probe_registry = probe_registry
         self._decider_registry = decider_registry
+        self._decision_store = decision_store
         self._runs = runs_core.init_runs()
         self._experiment_items: Dict[str, StoredExperimentItem] = {}
 
+    async def _get_cached_decision(self, cache_key: str) -> Optional[RunDecision]:
+        """In-memory cache first, then the persistent store (promoting hits).
+
+        Store reads run in a worker thread to keep SQLite off the event loop.
+        """
+        cached = runs_core.get_cached_decision(self._runs, cache_key)
+        if cached or self._decision_store is None:
+            return cached
+        cached = await asyncio.to_thread(self._decision_store.get, cache_key)
+        if cached:
+            self._runs = runs_core.add_cached_decision(self._runs, cache_key, cached)
+        return cached
+
+    async def _get_cached_decisions(
+        self, cache_keys: List[str]
+    ) -> Dict[str, RunDecision]:
+        """Like _get_cached_decision for many keys, with one store read for all."""
+        found: Dict[str, RunDecision] = {}
+        missing = []
+        for cache_key in cache_keys:
+            cached = runs_core.get_cached_decision(self._runs, cache_key)
+            if cached:
+                found[cache_key] = cached
+            else:
+                missing.append(cache_key)
+        if missing and self._decision_store is not None:
+            stored = await asyncio.to_thread(self._decision_store.get_many, missing)
+            for cache_key, decision in stored.items():
+                self._runs = runs_core.add_cached_decision(
+                    self._runs, cache_key, decision
+                )
+            found.update(stored)
+        return found
+
+    async def _store_decision(self, cache_key: str, decision: RunDecision) -> None:
+        self._runs = runs_core.add_cached_decision(self._runs, cache_key, decision)
+        if self._decision_store is not None:
+            await asyncio.to_thread(self._decision_store.put, cache_key, decision)
+
+    def _get_probe(self, probe_id: str):
+        """Probe of a run, or None if the registry no longer has it."""
+        try:
+            return self._probe_registry.get_probe(probe_id)
+        except ValueError:
+            return None
+
+    def _apply_cached_decision(self, run: Run) -> Run:
+        """Attach an in-memory cached decision; the store is read on execute."""
+        if run.decision is not None:
+            return run
+        cached = runs_core.get_cached_decision(self._runs, run.compute_cache_key())
+        if cached:
+            return run.model_copy(update={"decision": cached})
+        return run
+
     def _create_update_method(
         self,
         prepare_fn: Callable[..., Optional[Run]],
@@ -47,7 +111,7 @@ class RunsRegistry:
                     "system_prompt": system_prompt,
                 }
             )
-            new_run = runs_core.apply_cached_decision(self._runs, new_run)
+            new_run = self._apply_cached_decision(new_run)
 
             self._runs = runs_core.add_run(self._runs, new_run)
 
@@ -74,41 +138,110 @@ class RunsRegistry:
     def populate_cache_bulk(self, runs: List[Run]) -> None:
         self._runs = runs_core.populate_cache_bulk(self._runs, runs)
 
-    async def _execute_with_cache(self, run: Run, probe_choices: List[Dict]) -> Run:
+    async def _execute_with_cache(
+        self,
+        run: Run,
+        probe_choices: List[Dict],
+        request_id: Optional[str] = None,
+        on_progress: Optional[Callable[[ProgressEvent], None]] = None,
+    ) -> Run:
         cache_key = run.compute_cache_key()
 
-        cached = runs_core.get_cached_decision(self._runs, cache_key)
+        cached = await self._get_cached_decision(cache_key)
         if cached:
             updated_run = run.model_copy(update={"decision": cached})
             self._runs = runs_core.add_run(self._runs, updated_run)
             return updated_run
 
-        decision = await runs_core.fetch_decision(run, probe_choices)
+        decision = await runs_core.fetch_decision(
+            run, probe_choices, request_id, on_progress
+        )
         updated_run = run.model_copy(update={"decision": decision})
         self._runs = runs_core.add_run(self._runs, updated_run)
-        self._runs = runs_core.add_cached_decision(self._runs, cache_key, decision)
+        await self._store_decision(cache_key, decision)
         return updated_run
 
     async def execute_decision(self, run: Run, probe_choices: List[Dict]) -> Run:
         return await self._execute_with_cache(run, probe_choices)
 
-    async def execute_run_decision(self, run_id: str) -> Optional[Run]:
+    async def execute_run_decision(
+        self,
+        run_id: str,
+        request_id: Optional[str] = None,
+        on_progress: Optional[Callable[[ProgressEvent], None]] = None,
+    ) -> Optional[Run]:
         run = runs_core.get_run(self._runs, run_id)
         if not run:
             return None
 
-        probe = self._probe_registry.get_probe(run.probe_id)
+        probe = self._get_probe(run.probe_id)
         if not probe:
             return None
 
-        return await self._execute_with_cache(run, probe.choices or [])
+        return await self._execute_with_cache(
+            run, probe.choices or [], request_id, on_progress
+        )
+
+    async def execute_run_decisions(self, run_ids: List[str]) -> List[Run]:
+        """Decide many runs in one batch, skipping cached and duplicate work.
+
+        Unknown runs and runs whose probe is gone are skipped, as in
+        execute_run_decision. Successful decisions are stored even if others
+        fail; the first failure is raised afterwards.
+        """
+        runs: List[Run] = []
+        probe_choices: Dict[str, List[Dict]] = {}
+        for run_id in run_ids:
+            run = runs_core.get_run(self._runs, run_id)
+            probe = self._get_probe(run.probe_id) if run else None
+            if run and probe:
+                runs.append(run)
+                probe_choices[run.id] = probe.choices or []
+
+        cache_keys = [run.compute_cache_key() for run in runs]
+        found = await self._get_cached_decisions(cache_keys)
+        decided: Dict[str, Run] = {}
+        to_fetch: Dict[str, Run] = {}
+        for run, cache_key in zip(runs, cache_keys):
+            if cache_key in found:
+                decided[run.id] = run.model_copy(update={"decision": found[cache_key]})
+            elif cache_key not in to_fetch:
+                to_fetch[cache_key] = run
+
+        fetch_runs = list(to_fetch.values())
+        decisions = await runs_core.fetch_decisions(
+            fetch_runs, [probe_choices[run.id] for run in fetch_runs]
+        )
 
-    def has_cached_decision(self, run_id: str) -> bool:
+        first_error: Optional[Exception] = None
+        for cache_key, decision in zip(to_fetch, decisions):
+            if isinstance(decision, Exception):
+                first_error = first_error or decision
+                continue
+            await self._store_decision(cache_key, decision)
+
+        for run, cache_key in zip(runs, cache_keys):
+            if run.id not in decided:
+                cached = runs_core.get_cached_decision(self._runs, cache_key)
+                if not cached:
+                    continue
+                decided[run.id] = run.model_copy(update={"decision": cached})
+            self._runs = runs_core.add_run(self._runs, decided[run.id])
+
+        if first_error:
+            raise first_error
+        return [decided[run.id] for run in runs if run.id in decided]
+
+    async def has_cached_decision(self, run_id: str) -> bool:
         run = runs_core.get_run(self._runs, run_id)
         if not run:
             return False
         cache_key = run.compute_cache_key()
-        return runs_core.get_cached_decision(self._runs, cache_key) is not None
+        if runs_core.get_cached_decision(self._runs, cache_key) is not None:
+            return True
+        if self._decision_store is None:
+            return False
+        return await asyncio.to_thread(self._decision_store.__contains__, cache_key)
 
     def get_run(self, run_id: str) -> Optional[Run]:
         run = runs_core.get_run(self._runs, run_id)
@@ -213,10 +346,10 @@ class RunsRegistry:
 
     def get_run_by_cache_key(self, cache_key: str) -> Optional[Run]:
         """Find run by cache_key."""
-        for run in self._runs.runs.values():
-            if run.compute_cache_key() == cache_key:
-                return runs_core.apply_cached_decision(self._runs, run)
-        return None
+        run = runs_core.get_run_by_cache_key(self._runs, cache_key)
+        if run:
+            run = runs_core.apply_cached_decision(self._runs, run)
+        return run
 
     def update_decider_registry(self, new_registry):
         """Update the decider registry reference."""
@@ -1,5 +1,5 @@
 import logging
-from typing import Optional, Callable
+from typing import Any, Callable, Dict, Iterable, List, Optional
 from trame.app import asynchronous
 from trame.app.file_upload import ClientFile
 from trame.decorators import TrameApp, controller, change, trigger
@@ -8,7 +8,14 @@ from ..adm.run_models import Run
 from .runs_registry import RunsRegistry
 from .runs_table_filter import RunsTableFilter
 from ..adm.decider.types import DeciderParams
-from ..adm.decider import get_model_cache_status
+from ..adm.decider import (
+    DecisionCancelled,
+    ProgressEvent,
+    ProgressKind,
+    cancel_decision,
+    get_model_cache_status,
+    warm_up,
+)
 from ..adm.system_adm_discovery import discover_system_adms
 from ..utils.utils import get_id
 from .runs_presentation import extract_base_scenarios
@@ -19,6 +26,9 @@ from align_utils.models import AlignmentTarget
 
 logger = logging.getLogger(__name__)
 
+# Generated text shown while deciding is trimmed to its most recent characters
+PROGRESS_TEXT_LIMIT = 4000
+
 
 @TrameApp()
 class RunsStateAdapter:
@@ -37,6 +47,10 @@ class RunsStateAdapter:
         self._add_system_adm_callback = add_system_adm_callback
         self._alerts = get_alerts_service(server)
         self.server.state.pending_cache_keys = []
+        self.server.state.decision_progress = {}
+        self._decision_requests: Dict[str, str] = {}
+        self._presentation_cache = runs_presentation.PresentationCache()
+        probe_registry.on_probes_added(self._presentation_cache.invalidate)
         self.server.state.table_collapsed = False
         self.server.state.comparison_collapsed = False
         self.server.state.runs_table_modal_open = False
@@ -73,12 +87,15 @@ class RunsStateAdapter:
     def state(self):
         return self.server.state
 
+    def _run_to_state_dict(self, run: Run) -> Dict[str, Any]:
+        return runs_presentation.run_to_state_dict(
+            run, self.probe_registry, self.decider_registry, self._presentation_cache
+        )
+
     def _add_run_to_comparison(self, run: Run):
         """Add single run to state.runs."""
         if run.id not in self.state.runs:
-            run_dict = runs_presentation.run_to_state_dict(
-                run, self.probe_registry, self.decider_registry
-            )
+            run_dict = self._run_to_state_dict(run)
             self.state.runs = {**self.state.runs, run.id: run_dict}
 
     def _remove_run_from_comparison(self, run_id: str):
@@ -92,13 +109,43 @@ class RunsStateAdapter:
         for run_id in self.state.runs_to_compare:
             run = self.runs_registry.get_run(run_id)
             if run:
-                new_runs[run_id] = runs_presentation.run_to_state_dict(
-                    run, self.probe_registry, self.decider_registry
-                )
+                new_runs[run_id] = self._run_to_state_dict(run)
         self.state.runs = new_runs
 
-    def _update_table_rows(self):
-        """Update table rows without touching state.runs."""
+    def _update_table_rows(self, cache_keys: Optional[Iterable[str]] = None):
+        """Refresh table rows: all of them, or only those for cache_keys.
+
+        A cache key shows its decided run if there is one, else its stored
+        experiment item, else no row.
+        """
+        if cache_keys is None:
+            self._rebuild_table_rows()
+            return
+
+        upserts = []
+        removed = []
+        for cache_key in cache_keys:
+            row = self._table_row(cache_key)
+            if row is None:
+                removed.append(cache_key)
+            else:
+                upserts.append(row)
+        self.table_filter.update_rows(upserts, removed)
+
+    def _table_row(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        run = self.runs_registry.get_run_by_cache_key(cache_key)
+        if run and run.decision is not None:
+            return runs_presentation.run_to_table_row_direct(
+                run, self.probe_registry.get_probe(run.probe_id)
+            )
+        stored = self.runs_registry.get_experiment_item(cache_key)
+        if stored:
+            return runs_presentation.experiment_item_to_table_row(
+                stored.item, stored.cache_key, stored.decider_batch
+            )
+        return None
+
+    def _rebuild_table_rows(self):
         all_runs = self.runs_registry.get_all_runs()
         decided_runs = [run for run in all_runs.values() if run.decision is not None]
         run_table_rows = [
@@ -122,7 +169,9 @@ class RunsStateAdapter:
         self.table_filter.set_all_rows(
             list(run_table_rows_by_id.values()) + experiment_table_rows
         )
+        self._update_base_scenarios()
 
+    def _update_base_scenarios(self):
         probes = self.probe_registry.get_probes()
         self.state.base_scenarios = extract_base_scenarios(probes)
 
@@ -237,9 +286,7 @@ class RunsStateAdapter:
         self.state.runs_to_compare = [run.id, *self.state.runs_to_compare]
 
         if run.id not in self.state.runs:
-            run_dict = runs_presentation.run_to_state_dict(
-                run, self.probe_registry, self.decider_registry
-            )
+            run_dict = self._run_to_state_dict(run)
             self.state.runs = {**self.state.runs, run.id: run_dict}
 
     @controller.set("copy_run")
@@ -254,9 +301,7 @@ class RunsStateAdapter:
         self._sync_run_to_state(new_run, insert_at_index=column_index + 1)
 
     def _sync_run_to_state(self, run: Run, insert_at_index=None):
-        run_dict = runs_presentation.run_to_state_dict(
-            run, self.probe_registry, self.decider_registry
-        )
+        run_dict = self._run_to_state_dict(run)
 
         with self.state:
             self.state.runs = {
@@ -272,7 +317,7 @@ class RunsStateAdapter:
                     runs_to_compare.insert(insert_at_index, run.id)
                 self.state.runs_to_compare = runs_to_compare
             if run.decision is not None:
-                self._update_table_rows()
+                self._update_table_rows([run.compute_cache_key()])
 
     def _handle_run_update(self, old_run_id: str, new_run: Optional[Run]):
         if new_run:
@@ -283,7 +328,7 @@ class RunsStateAdapter:
             self._remove_run_from_comparison(old_run_id)
             self._add_run_to_comparison(new_run)
             if new_run.decision is not None:
-                self._update_table_rows()
+                self._update_table_rows([new_run.compute_cache_key()])
 
     @controller.set("update_run_scene")
     def update_run_scene(self, run_id: str, scene_id: str):
@@ -316,6 +361,7 @@ class RunsStateAdapter:
         """
         new_run = self.runs_registry.update_run_decider(run_id, decider_name)
         self._handle_run_update(run_id, new_run)
+        self._warm_up_model(new_run)
 
     @controller.set("update_run_llm_backbone")
     def update_run_llm_backbone(self, run_id: str, llm_backbone: str):
@@ -326,6 +372,31 @@ class RunsStateAdapter:
         """
         new_run = self.runs_registry.update_run_llm_backbone(run_id, llm_backbone)
         self._handle_run_update(run_id, new_run)
+        self._warm_up_model(new_run)
+
+    def _warm_up_model(self, run: Optional[Run]):
+        """Start loading the run's model while the user keeps editing.
+
+        Models of other undecided runs in the comparison are kept resident.
+        """
+        if run is None or run.decision is not None:
+            return
+        resolved_config = run.decider_params.resolved_config
+        if not resolved_config:
+            return
+        needed = []
+        for run_id in self.state.runs:
+            other = self.runs_registry.get_run(run_id)
+            if other and other.id != run.id and other.decision is None:
+                if other.decider_params.resolved_config:
+                    needed.append(other.decider_params.resolved_config)
+        asynchronous.create_task(self._warm_up(resolved_config, needed))
+
+    async def _warm_up(self, resolved_config: dict, needed: List[dict]):
+        try:
+            await warm_up(resolved_config, owner=self.server.name, needed=needed)
+        except Exception:
+            logger.exception("Model warm-up failed")
 
     @controller.set("add_run_alignment_attribute")
     def add_run_alignment_attribute(self, run_id: str):
@@ -593,38 +664,73 @@ class RunsStateAdapter:
                 k for k in self.state.pending_cache_keys if k != cache_key
             ]
 
-    async def _execute_run_decision(self, run_id: str):
+    def _set_decision_progress(self, cache_key: str, progress: Optional[dict]):
+        decision_progress = {
+            k: v for k, v in self.state.decision_progress.items() if k != cache_key
+        }
+        if progress is not None:
+            decision_progress[cache_key] = progress
+        self.state.decision_progress = decision_progress
+
+    def _on_decision_progress(self, cache_key: str, event: ProgressEvent):
+        progress = self.state.decision_progress.get(cache_key) or {
+            "message": "",
+            "text": "",
+        }
+        if event.kind == ProgressKind.TEXT:
+            text = f"{progress['text']}\n{event.text}".strip()
+            progress = {**progress, "text": text[-PROGRESS_TEXT_LIMIT:]}
+        elif event.message:
+            progress = {**progress, "message": event.message}
+        with self.state:
+            self._set_decision_progress(cache_key, progress)
+
+    def _apply_probe_edits(self, run_id: str) -> Optional[str]:
+        """Move a run with unsaved probe text edits onto an edited probe.
+
+        Returns the ID of the run to decide, or None if it cannot be decided.
+        """
         ui_run = self.state.runs.get(run_id, {})
         current_text = (
             ui_run.get("prompt", {}).get("probe", {}).get("display_state", "")
         )
         current_choices = ui_run.get("prompt", {}).get("probe", {}).get("choices", [])
 
-        if self._is_probe_edited(run_id, current_text, current_choices):
-            new_probe_id = self._create_edited_probe_for_run(
-                run_id, current_text, current_choices
-            )
-            if not new_probe_id:
-                return
-            run = self.runs_registry.get_run(run_id)
-            if not run:
-                return
-            updated_run = run.model_copy(update={"probe_id": new_probe_id})
-            self.runs_registry.add_run(updated_run)
-            self._sync_run_to_state(updated_run)
-            self.state.runs_to_compare = [
-                updated_run.id if rid == run_id else rid
-                for rid in self.state.runs_to_compare
-            ]
-            run_id = updated_run.id
+        if not self._is_probe_edited(run_id, current_text, current_choices):
+            return run_id
+        new_probe_id = self._create_edited_probe_for_run(
+            run_id, current_text, current_choices
+        )
+        if not new_probe_id:
+            return None
+        run = self.runs_registry.get_run(run_id)
+        if not run:
+            return None
+        updated_run = run.model_copy(update={"probe_id": new_probe_id})
+        self.runs_registry.add_run(updated_run)
+        self._sync_run_to_state(updated_run)
+        self.state.runs_to_compare = [
+            updated_run.id if rid == run_id else rid
+            for rid in self.state.runs_to_compare
+        ]
+        return updated_run.id
+
+    async def _execute_run_decision(self, run_id: str):
+        edited_run_id = self._apply_probe_edits(run_id)
+        if not edited_run_id:
+            return
+        run_id = edited_run_id
 
         cache_key = self.state.runs.get(run_id, {}).get("cache_key")
 
+        request_id = get_id()
+        if cache_key:
+            self._decision_requests[cache_key] = request_id
         with self.state:
             self._add_pending_cache_key(cache_key)
 
         run = self.runs_registry.get_run(run_id)
-        is_cached_decision = self.runs_registry.has_cached_decision(run_id)
+        is_cached_decision = await self.runs_registry.has_cached_decision(run_id)
         status = None
         if run:
             status = await get_model_cache_status(run.decider_params.resolved_config)
@@ -640,9 +746,16 @@ class RunsStateAdapter:
         await self.server.network_completion
 
         try:
-            await self.runs_registry.execute_run_decision(run_id)
+            await self.runs_registry.execute_run_decision(
+                run_id,
+                request_id,
+                on_progress=lambda event: self._on_decision_progress(cache_key, event),
+            )
             self._alerts.remove_alert(alert_id)
             self._alerts.create_info_alert(title="Decision complete", timeout=3000)
+        except DecisionCancelled:
+            self._alerts.remove_alert(alert_id)
+            self._alerts.create_info_alert(title="Decision cancelled", timeout=3000)
         except Exception as e:
             self._alerts.remove_alert(alert_id)
             error_text = str(e)
@@ -657,13 +770,70 @@ class RunsStateAdapter:
 
         with self.state:
             self._rebuild_comparison_runs()
-            self._update_table_rows()
+            self._update_table_rows([cache_key] if cache_key else None)
             self._remove_pending_cache_key(cache_key)
+            self._set_decision_progress(cache_key, None)
+        if self._decision_requests.get(cache_key) == request_id:
+            del self._decision_requests[cache_key]
 
     @controller.set("execute_run_decision")
     def execute_run_decision(self, run_id: str):
         asynchronous.create_task(self._execute_run_decision(run_id))
 
+    async def _execute_compared_run_decisions(self):
+        """Decide every undecided run in the comparison as one batch."""
+        run_ids = []
+        for run_id in list(self.state.runs_to_compare):
+            if (self.state.runs.get(run_id) or {}).get("decision"):
+                continue
+            edited_run_id = self._apply_probe_edits(run_id)
+            if edited_run_id:
+                run_ids.append(edited_run_id)
+        if not run_ids:
+            return
+
+        cache_keys = [
+            key
+            for key in (
+                self.state.runs.get(rid, {}).get("cache_key") for rid in run_ids
+            )
+            if key
+        ]
+        with self.state:
+            for cache_key in cache_keys:
+                self._add_pending_cache_key(cache_key)
+        alert_id = self._alerts.create_info_alert(
+            title=f"Deciding {len(run_ids)} runs...", timeout=0
+        )
+        await self.server.network_completion
+
+        try:
+            await self.runs_registry.execute_run_decisions(run_ids)
+            self._alerts.remove_alert(alert_id)
+            self._alerts.create_info_alert(title="Decisions complete", timeout=3000)
+        except Exception as e:
+            self._alerts.remove_alert(alert_id)
+            self._alerts.create_info_alert(
+                title=f"Some decisions failed: {e}", timeout=8000
+            )
+
+        with self.state:
+            self._rebuild_comparison_runs()
+            self._update_table_rows(cache_keys)
+            for cache_key in cache_keys:
+                self._remove_pending_cache_key(cache_key)
+
+    @controller.set("execute_compared_run_decisions")
+    def execute_compared_run_decisions(self):
+        asynchronous.create_task(self._execute_compared_run_decisions())
+
+    @controller.set("cancel_run_decision")
+    def cancel_run_decision(self, cache_key: str):
+        """Cancel a pending decision if the worker has not started it yet."""
+        request_id = self._decision_requests.get(cache_key)
+        if request_id:
+            cancel_decision(request_id)
+
     def export_runs_to_json(self) -> str:
         return runs_presentation.export_runs_to_json(self.state.runs)
 
@@ -677,9 +847,7 @@ class RunsStateAdapter:
         if not selected:
             all_runs = self.runs_registry.get_all_runs()
             runs_to_export = {
-                rid: runs_presentation.run_to_state_dict(
-                    r, self.probe_registry, self.decider_registry
-                )
+                rid: self._run_to_state_dict(r)
                 for rid, r in all_runs.items()
                 if r.decision
             }
@@ -692,9 +860,7 @@ class RunsStateAdapter:
             if not run:
                 run = self.runs_registry.materialize_experiment_item(cache_key)
             if run:
-                run_dict = runs_presentation.run_to_state_dict(
-                    run, self.probe_registry, self.decider_registry
-                )
+                run_dict = self._run_to_state_dict(run)
                 selected_runs[run.id] = run_dict
 
         return export_runs_to_zip(selected_runs)
@@ -703,6 +869,13 @@ class RunsStateAdapter:
     def update_runs_table_selected(self, selected):
         self.state.runs_table_selected = selected if selected else []
 
+    @controller.set("select_all_runs_table_rows")
+    def select_all_runs_table_rows(self, selected: bool):
+        """Header checkbox: select every filtered run, not only the visible page."""
+        self.state.runs_table_selected = (
+            self.table_filter.filtered_ids() if selected else []
+        )
+
     @controller.set("open_runs_table_modal")
     def open_runs_table_modal(self):
         self.state.runs_table_modal_open = True
@@ -718,8 +891,7 @@ class RunsStateAdapter:
         if not selected:
             return
 
-        new_runs_to_compare = []
-        runs_to_add = []
+        runs_to_add: Dict[str, Run] = {}
 
         for item in selected:
             cache_key = item["id"] if isinstance(item, dict) else item
@@ -729,18 +901,17 @@ class RunsStateAdapter:
             if not run:
                 run = self.runs_registry.materialize_experiment_item(cache_key)
 
-            if run and run.id not in new_runs_to_compare:
-                new_runs_to_compare.append(run.id)
-                runs_to_add.append(run)
+            if run and run.id not in runs_to_add:
+                runs_to_add[run.id] = run
 
-        self.state.runs = {}
-        for run in runs_to_add:
-            self._add_run_to_comparison(run)
+        self.state.runs = {
+            run_id: self._run_to_state_dict(run) for run_id, run in runs_to_add.items()
+        }
 
-        self.state.runs_to_compare = new_runs_to_compare
+        self.state.runs_to_compare = list(runs_to_add)
         self.state.runs_table_modal_open = False
         self.state.runs_table_selected = []
-        self._update_table_rows()
+        self._update_table_rows(run.compute_cache_key() for run in runs_to_add.values())
 
     @controller.set("on_table_row_click")
     def on_table_row_click(self, _event, item):
@@ -756,7 +927,7 @@ class RunsStateAdapter:
         if run and run.id not in self.state.runs_to_compare:
             self.state.runs_to_compare = [run.id, *self.state.runs_to_compare]
             self._add_run_to_comparison(run)
-            self._update_table_rows()
+            self._update_table_rows([cache_key])
 
     @change("runs")
     def update_runs_json(self, **_):
@@ -787,7 +958,8 @@ class RunsStateAdapter:
         self.decider_registry.add_deciders(result.deciders)
         self.runs_registry.add_experiment_items(result.items)
 
-        self._update_table_rows()
+        self._update_table_rows(result.items.keys())
+        self._update_base_scenarios()
 
         self.state.import_experiment_file = None
         self._alerts.remove_alert(alert_id)
@@ -1,6 +1,8 @@
 import re
-from typing import List, Dict, Any, Tuple
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
 from trame.decorators import TrameApp, change
+from .column_index import ColumnIndex
 
 
 def natural_sort_key(s: str) -> list:
@@ -17,57 +19,135 @@ FILTER_COLUMNS = [
 ]
 
 
-def compute_filter_options(
-    rows: List[Dict[str, Any]],
-) -> Dict[str, List[str]]:
-    return {
-        "runs_table_scenario_options": sorted(
-            set(r["scenario_id"] for r in rows if r.get("scenario_id")),
-            key=natural_sort_key,
-        ),
-        "runs_table_scene_options": sorted(
-            set(r["scene_id"] for r in rows if r.get("scene_id")),
-            key=natural_sort_key,
-        ),
-        "runs_table_decider_options": sorted(
-            set(r["decider_name"] for r in rows if r.get("decider_name")),
-            key=natural_sort_key,
-        ),
-        "runs_table_llm_options": sorted(
-            set(r["llm_backbone_name"] for r in rows if r.get("llm_backbone_name")),
-            key=natural_sort_key,
-        ),
-        "runs_table_alignment_options": sorted(
-            set(r["alignment_summary"] for r in rows if r.get("alignment_summary")),
-            key=natural_sort_key,
-        ),
-        "runs_table_decision_options": sorted(
-            set(r["decision_text"] for r in rows if r.get("decision_text")),
-            key=natural_sort_key,
-        ),
-    }
-
-
-def filter_rows(
-    rows: List[Dict[str, Any]],
-    filters: List[Tuple[List[str], str]],
-) -> List[Dict[str, Any]]:
-    def row_matches(row: Dict[str, Any]) -> bool:
-        for filter_values, key in filters:
-            if filter_values and row.get(key) not in filter_values:
-                return False
-        return True
+FILTER_OPTIONS = {
+    "scenario_id": "runs_table_scenario_options",
+    "scene_id": "runs_table_scene_options",
+    "decider_name": "runs_table_decider_options",
+    "llm_backbone_name": "runs_table_llm_options",
+    "alignment_summary": "runs_table_alignment_options",
+    "decision_text": "runs_table_decision_options",
+}
+
+
+class NaturalSortedValues:
+    """Distinct non-empty values in natural sort order, kept sorted on insert."""
+
+    def __init__(self, values: Iterable[Any] = ()):
+        self._entries = sorted(
+            (natural_sort_key(str(value)), value) for value in set(values) if value
+        )
+
+    def __iter__(self):
+        return (value for _, value in self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
 
-    return [r for r in rows if row_matches(r)]
+    def add(self, value: Any):
+        if not value:
+            return
+        entry = (natural_sort_key(str(value)), value)
+        position = bisect_left(self._entries, entry)
+        if position == len(self._entries) or self._entries[position] != entry:
+            self._entries.insert(position, entry)
+
+    def discard(self, value: Any):
+        if not value:
+            return
+        entry = (natural_sort_key(str(value)), value)
+        position = bisect_left(self._entries, entry)
+        if position < len(self._entries) and self._entries[position] == entry:
+            del self._entries[position]
+
+
+def facet_option(value: Any, count: int) -> Dict[str, Any]:
+    return {"title": f"{value} ({count})", "value": value, "count": count}
+
+
+SEARCH_COLUMNS = [
+    "scenario_id",
+    "scene_id",
+    "probe_text",
+    "decider_name",
+    "llm_backbone_name",
+    "alignment_summary",
+    "decision_text",
+    "searchable_text",
+]
+
+
+class TableView(NamedTuple):
+    """State keys of one server-side table."""
+
+    items: str
+    items_length: str
+    page: str
+    page_size: int
+
+
+TABLE_VIEWS = {
+    "panel": TableView(
+        "runs_table_items", "runs_table_items_length", "runs_table_page", 50
+    ),
+    "modal": TableView(
+        "runs_table_modal_items",
+        "runs_table_modal_items_length",
+        "runs_table_modal_page",
+        100,
+    ),
+}
+
+
+def search_text(row: Dict[str, Any]) -> str:
+    return "\n".join(str(row.get(key) or "") for key in SEARCH_COLUMNS).lower()
+
+
+def sort_rows(
+    rows: List[Dict[str, Any]], sort_by: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Natural sort by vuetify sortBy entries ({"key", "order"}), first key wins."""
+    rows = list(rows)
+    for sort in reversed(sort_by):
+        key = sort["key"]
+        rows.sort(
+            key=lambda row: natural_sort_key(str(row.get(key) or "")),
+            reverse=sort.get("order") == "desc",
+        )
+    return rows
 
 
 @TrameApp()
 class RunsTableFilter:
+    """Keeps runs table rows on the server and sends each table only its page.
+
+    Filters, the search box and sorting are applied here; each table view
+    (see TABLE_VIEWS) gets its current page and the filtered row count.
+    """
+
     def __init__(self, server):
         self.server = server
-        self._all_rows: List[Dict[str, Any]] = []
+        self._all_rows: Dict[str, Dict[str, Any]] = {}
+        self._index = ColumnIndex([column for _, column in FILTER_COLUMNS])
+        self._search_texts: Dict[str, str] = {}
+        self._facet_values = {
+            column: NaturalSortedValues() for column in FILTER_OPTIONS
+        }
+        # Filter selection the current options were counted for
+        self._options_key: Optional[Tuple[Tuple[Any, ...], ...]] = None
+        # Filtered ids in row order, then per sort spec; reset on any change
+        self._filtered_ids: Optional[List[str]] = None
+        self._sorted_ids: Dict[str, List[str]] = {}
+        self._view_options: Dict[str, Dict[str, Any]] = {
+            name: {"page": 1, "itemsPerPage": view.page_size, "sortBy": []}
+            for name, view in TABLE_VIEWS.items()
+        }
         self.controller = server.controller
 
+        for view in TABLE_VIEWS.values():
+            self.state[view.items] = []
+            self.state[view.items_length] = 0
+            self.state[view.page] = 1
+
         self.state.runs_table_filter_scenario = []
         self.state.runs_table_filter_scene = []
         self.state.runs_table_filter_decider = []
@@ -76,27 +156,89 @@ class RunsTableFilter:
         self.state.runs_table_filter_decision = []
 
         self.controller.set("clear_all_table_filters")(self.clear_all_filters)
+        self.controller.set("update_runs_table_options")(self.update_options)
 
-        self.state.runs_table_scenario_options = []
-        self.state.runs_table_scene_options = []
-        self.state.runs_table_decider_options = []
-        self.state.runs_table_llm_options = []
-        self.state.runs_table_alignment_options = []
-        self.state.runs_table_decision_options = []
+        for options_key in FILTER_OPTIONS.values():
+            self.state[options_key] = []
 
     @property
     def state(self):
         return self.server.state
 
     def set_all_rows(self, rows: List[Dict[str, Any]]):
-        self._all_rows = rows
+        self._all_rows = {row["id"]: row for row in rows}
+        self._index.rebuild(self._all_rows.items())
+        self._search_texts = {row["id"]: search_text(row) for row in rows}
+        self._facet_values = {
+            column: NaturalSortedValues(self._index.values(column))
+            for column in FILTER_OPTIONS
+        }
+        self._options_key = None
+        self._update_filter_options()
+        self._apply_filters()
+
+    def update_rows(
+        self, upserts: List[Dict[str, Any]], removed_ids: Iterable[str] = ()
+    ):
+        """Add or replace rows by id and drop removed ids."""
+        removed = [row_id for row_id in removed_ids if row_id in self._all_rows]
+        if not upserts and not removed:
+            return
+        replaced = [
+            self._all_rows[row["id"]] for row in upserts if row["id"] in self._all_rows
+        ]
+        replaced.extend(self._all_rows[row_id] for row_id in removed)
+        for row_id in removed:
+            del self._all_rows[row_id]
+            del self._search_texts[row_id]
+            self._index.remove(row_id)
+        for row in upserts:
+            self._all_rows[row["id"]] = row
+            self._search_texts[row["id"]] = search_text(row)
+            self._index.add(row["id"], row)
+        for column, values in self._facet_values.items():
+            for row in replaced:
+                if not self._index.has_value(column, row.get(column)):
+                    values.discard(row.get(column))
+            for row in upserts:
+                values.add(row.get(column))
+        self._options_key = None
         self._update_filter_options()
         self._apply_filters()
 
+    def get_row(self, row_id: str) -> Optional[Dict[str, Any]]:
+        return self._all_rows.get(row_id)
+
     def _update_filter_options(self):
-        options = compute_filter_options(self._all_rows)
-        for key, value in options.items():
-            setattr(self.state, key, value)
+        """Options per filter column with row counts under the other filters.
+
+        A value is listed when some row matching every other column's filter
+        holds it, or when it is selected, so the dropdowns only offer
+        combinations that exist.
+        """
+        selected = {column: values for values, column in self._active_filters()}
+        options_key = tuple(tuple(selected[column]) for column in FILTER_OPTIONS)
+        if options_key == self._options_key:
+            return
+        self._options_key = options_key
+        bits = {
+            column: self._index.column_bits(column, values)
+            for column, values in selected.items()
+        }
+        for column, state_key in FILTER_OPTIONS.items():
+            within = None
+            for other, other_bits in bits.items():
+                if other != column and other_bits is not None:
+                    within = other_bits if within is None else within & other_bits
+            counts = self._index.counts(column, within)
+            chosen = set(selected[column])
+            options = [
+                facet_option(value, counts.get(value, 0))
+                for value in self._facet_values[column]
+                if counts.get(value) or value in chosen
+            ]
+            if options != self.state[state_key]:
+                self.state[state_key] = options
 
     @change(
         "runs_table_filter_scenario",
@@ -105,16 +247,78 @@ class RunsTableFilter:
         "runs_table_filter_llm",
         "runs_table_filter_alignment",
         "runs_table_filter_decision",
+        "runs_table_search",
     )
     def _on_filter_change(self, **kwargs):
+        for name, view in TABLE_VIEWS.items():
+            self._view_options[name]["page"] = 1
+            self.state[view.page] = 1
+        self._update_filter_options()
         self._apply_filters()
 
-    def _apply_filters(self):
-        filters = [
+    def update_options(self, name: str, options: Dict[str, Any]):
+        """Vuetify update:options handler (page, itemsPerPage, sortBy)."""
+        if name not in TABLE_VIEWS:
+            return
+        current = self._view_options[name]
+        for key in ("page", "itemsPerPage", "sortBy"):
+            if key in options:
+                current[key] = options[key]
+        self._send_page(name)
+
+    def _active_filters(self) -> List[Tuple[List[str], str]]:
+        return [
             (getattr(self.state, state_key) or [], col_key)
             for state_key, col_key in FILTER_COLUMNS
         ]
-        self.state.runs_table_items = filter_rows(self._all_rows, filters)
+
+    def _apply_filters(self):
+        self._filtered_ids = None
+        self._sorted_ids = {}
+        for name in TABLE_VIEWS:
+            self._send_page(name)
+
+    def _filtered(self) -> List[str]:
+        if self._filtered_ids is None:
+            ids = self._index.match(
+                (column, values) for values, column in self._active_filters()
+            )
+            query = (self.state.runs_table_search or "").strip().lower()
+            if query:
+                texts = self._search_texts
+                ids = [row_id for row_id in ids if query in texts[row_id]]
+            self._filtered_ids = ids
+        return self._filtered_ids
+
+    def _sorted(self, sort_by: List[Dict[str, Any]]) -> List[str]:
+        ids = self._filtered()
+        if not sort_by:
+            return ids
+        spec = repr([(sort["key"], sort.get("order")) for sort in sort_by])
+        if spec not in self._sorted_ids:
+            rows = sort_rows([self._all_rows[row_id] for row_id in ids], sort_by)
+            self._sorted_ids[spec] = [row["id"] for row in rows]
+        return self._sorted_ids[spec]
+
+    def filtered_ids(self) -> List[str]:
+        """IDs of every row matching the filters and search, across all pages."""
+        return list(self._filtered())
+
+    def page_rows(self, name: str) -> List[Dict[str, Any]]:
+        options = self._view_options[name]
+        ids = self._sorted(options["sortBy"] or [])
+        per_page = options["itemsPerPage"]
+        if per_page is None or per_page < 0:
+            page_ids = ids
+        else:
+            start = (max(options["page"], 1) - 1) * per_page
+            page_ids = ids[start : start + per_page]
+        return [self._all_rows[row_id] for row_id in page_ids]
+
+    def _send_page(self, name: str):
+        view = TABLE_VIEWS[name]
+        self.state[view.items] = self.page_rows(name)
+        self.state[view.items_length] = len(self._filtered())
 
     def clear_all_filters(self):
         self.state.runs_table_filter_scenario = []
@@ -1,8 +1,23 @@
-from typing import Optional, Tuple
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 from trame.decorators import TrameApp, controller
 from rapidfuzz import fuzz, process, utils
 from ..adm.probe import Probe
 from ..utils.utils import debounce
+from .search_index import SearchIndex
+
+# Recent processed queries whose results are kept until probes change
+QUERY_CACHE_SIZE = 64
+
+
+def searchable_text(probe: Probe) -> str:
+    """Probe text matched by the search box, run through default_process."""
+    choices = " ".join(
+        choice.get("unstructured", "") for choice in (probe.choices or [])
+    )
+    return utils.default_process(
+        f"{probe.scenario_id} {probe.scene_id} {probe.display_state or ''} {choices}"
+    )
 
 
 @TrameApp()
@@ -13,6 +28,12 @@ class SearchController:
         self.server = server
         self.probe_registry = probe_registry
         self._on_search_select = on_search_select
+        # Preprocessed search text per probe, extended as probes are added
+        self._corpus: Dict[str, str] = {}
+        self._index = SearchIndex()
+        self._results_cache: OrderedDict[str, List[Dict[str, Any]]] = OrderedDict()
+        self._add_to_corpus(probe_registry.get_probes())
+        probe_registry.on_probes_added(self._add_to_corpus)
         self.server.state.search_query = ""
         self.server.state.search_results = []
         self.server.state.search_menu_open = False
@@ -21,6 +42,13 @@ class SearchController:
             debounce(0.2, self.server.state)(self.update_search_results)
         )
 
+    def _add_to_corpus(self, probes: Dict[str, Probe]):
+        for probe_id, probe in probes.items():
+            text = searchable_text(probe)
+            self._corpus[probe_id] = text
+            self._index.add(probe_id, text)
+        self._results_cache.clear()
+
     def _create_search_result(self, probe_id, probe: Probe):
         display_state = probe.display_state or ""
         display_text = display_state.split("\n")[0] if display_state else ""
@@ -32,38 +60,44 @@ class SearchController:
             "display_text": display_text,
         }
 
-    def update_search_results(self, search_query, **_):
-        if not search_query:
-            self.server.state.search_results = []
-            self.server.state.search_menu_open = False
-            return
-
-        probes = self.probe_registry.get_probes()
-
-        searchable_items = {
-            probe_id: (
-                f"{probe.scenario_id} "
-                f"{probe.scene_id} "
-                f"{probe.display_state or ''} "
-                f"{' '.join(choice.get('unstructured', '') for choice in (probe.choices or []))}"
-            )
-            for probe_id, probe in probes.items()
+    def _search(self, query: str) -> List[Dict[str, Any]]:
+        """Score only the probes the index returns for a processed query."""
+        corpus = self._corpus
+        candidates = {
+            probe_id: corpus[probe_id]
+            for probe_id in self._index.candidates(query.split())
         }
-
+        # The corpus is already processed, so no processor is needed here
         matches = process.extract(
-            search_query,
-            searchable_items,
+            query,
+            candidates,
             scorer=fuzz.token_set_ratio,
-            processor=utils.default_process,
+            processor=None,
             limit=200,
             score_cutoff=80,
         )
-
-        results = [
+        probes = self.probe_registry.get_probes()
+        return [
             self._create_search_result(probe_id, probes[probe_id])
             for _, _, probe_id in matches
         ]
 
+    def update_search_results(self, search_query, **_):
+        if not search_query:
+            self.server.state.search_results = []
+            self.server.state.search_menu_open = False
+            return
+
+        query = utils.default_process(search_query)
+        results = self._results_cache.get(query)
+        if results is None:
+            results = self._search(query)
+            self._results_cache[query] = results
+            if len(self._results_cache) > QUERY_CACHE_SIZE:
+                self._results_cache.popitem(last=False)
+        else:
+            self._results_cache.move_to_end(query)
+
         self.server.state.search_results = results or [
             {
                 "id": None,
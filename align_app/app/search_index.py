@@ -0,0 +1,81 @@
+"""Inverted index that narrows probe search to texts sharing a query token.
+
+token_set_ratio only scores a text highly when the query's tokens, or close
+misspellings of them, appear in it. Each text's tokens are indexed, and the
+distinct tokens are indexed again by trigram, so a query token expands to
+the similar vocabulary tokens and from there to the texts holding them.
+Only those candidates are handed to rapidfuzz for scoring.
+"""
+
+import math
+from collections import Counter, OrderedDict
+from typing import Dict, FrozenSet, Iterable, List, Set
+
+# Query tokens whose candidate texts are remembered, so extending a query
+# only looks up its new tokens
+TOKEN_CACHE_SIZE = 512
+
+# Share of a query token's trigrams a vocabulary token must also have
+TOKEN_SIMILARITY = 0.5
+
+
+def trigrams(token: str) -> Set[str]:
+    padded = f"  {token} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex:
+    """Token and trigram postings over preprocessed (default_process) texts."""
+
+    def __init__(self):
+        self._order: Dict[str, int] = {}
+        self._tokens_by_doc: Dict[str, FrozenSet[str]] = {}
+        self._docs_by_token: Dict[str, Set[str]] = {}
+        self._tokens_by_trigram: Dict[str, Set[str]] = {}
+        self._token_cache: OrderedDict[str, FrozenSet[str]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._tokens_by_doc)
+
+    def add(self, doc_id: str, text: str):
+        """Index text under doc_id, replacing any earlier text for it."""
+        self._token_cache.clear()
+        for token in self._tokens_by_doc.get(doc_id, ()):
+            self._docs_by_token[token].discard(doc_id)
+        self._order.setdefault(doc_id, len(self._order))
+        tokens = frozenset(text.split())
+        self._tokens_by_doc[doc_id] = tokens
+        for token in tokens:
+            docs = self._docs_by_token.get(token)
+            if docs is None:
+                docs = self._docs_by_token[token] = set()
+                for gram in trigrams(token):
+                    self._tokens_by_trigram.setdefault(gram, set()).add(token)
+            docs.add(doc_id)
+
+    def _token_docs(self, token: str) -> FrozenSet[str]:
+        cached = self._token_cache.get(token)
+        if cached is not None:
+            self._token_cache.move_to_end(token)
+            return cached
+        grams = trigrams(token)
+        needed = max(1, math.ceil(len(grams) * TOKEN_SIMILARITY))
+        shared: Counter = Counter()
+        for gram in grams:
+            shared.update(self._tokens_by_trigram.get(gram, ()))
+        docs: Set[str] = set()
+        for similar, count in shared.items():
+            if count >= needed:
+                docs |= self._docs_by_token[similar]
+        result = frozenset(docs)
+        self._token_cache[token] = result
+        if len(self._token_cache) > TOKEN_CACHE_SIZE:
+            self._token_cache.popitem(last=False)
+        return result
+
+    def candidates(self, query_tokens: Iterable[str]) -> List[str]:
+        """Doc ids holding a token similar to any query token, in add order."""
+        docs: Set[str] = set()
+        for token in set(query_tokens):
+            docs |= self._token_docs(token)
+        return sorted(docs, key=self._order.__getitem__)
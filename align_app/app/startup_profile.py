@@ -0,0 +1,159 @@
+"""Startup profile for ``align-app --profile-startup``.
+
+Times every module imported after profiling starts, by wrapping the loader
+of each module found through a meta path hook, and named initialization
+phases of the app. The report is printed to stderr once the server is ready
+to accept connections, and the hook and wrapped loaders are removed then:
+
+- phases: wall time of each initialization step, in order
+- packages: import time per top-level package (time in its own modules)
+- slowest imports: modules by cumulative import time (children included)
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+PROFILE_FLAG = "--profile-startup"
+# Rows shown in the slowest imports and packages tables
+REPORT_LIMIT = 20
+
+
+class StartupProfile:
+    def __init__(self):
+        self.started = time.perf_counter()
+        # module name -> (self seconds, cumulative seconds)
+        self.imports: Dict[str, Tuple[float, float]] = {}
+        self.phases: List[Tuple[str, float]] = []
+        self._children: List[float] = []
+        # id(loader) -> (loader, exec_module it had as an instance attribute)
+        self._wrapped: Dict[int, Tuple[Any, Optional[Any]]] = {}
+
+    def find_spec(self, name, path, target=None):
+        for finder in sys.meta_path:
+            find_spec = getattr(finder, "find_spec", None)
+            if finder is self or find_spec is None:
+                continue
+            spec = find_spec(name, path, target)
+            if spec is not None:
+                self._time_loader(spec)
+                return spec
+        return None
+
+    def _time_loader(self, spec):
+        loader = spec.loader
+        exec_module = getattr(loader, "exec_module", None)
+        # Builtin and frozen importers are classes shared by every module
+        if exec_module is None or isinstance(loader, type):
+            return
+        if id(loader) in self._wrapped:
+            return
+
+        def timed_exec_module(module):
+            start = time.perf_counter()
+            self._children.append(0.0)
+            try:
+                exec_module(module)
+            finally:
+                total = time.perf_counter() - start
+                children = self._children.pop()
+                if self._children:
+                    self._children[-1] += total
+                self.imports[spec.name] = (total - children, total)
+
+        own = getattr(loader, "__dict__", {}).get("exec_module")
+        try:
+            loader.exec_module = timed_exec_module
+        except AttributeError:
+            return
+        self._wrapped[id(loader)] = (loader, own)
+
+    def stop(self) -> None:
+        """Stop timing: leave sys.meta_path and give loaders their exec_module back."""
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+        for loader, own in self._wrapped.values():
+            if own is None:
+                del loader.exec_module
+            else:
+                loader.exec_module = own
+        self._wrapped.clear()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    def format(self, limit: int = REPORT_LIMIT) -> str:
+        elapsed = time.perf_counter() - self.started
+        lines = [f"Startup profile: ready after {elapsed:.2f} s", "", "Phases:"]
+        lines += [f"  {name:<40} {seconds:8.3f} s" for name, seconds in self.phases]
+
+        packages: Dict[str, List[float]] = {}
+        for name, (own, _) in self.imports.items():
+            package = packages.setdefault(name.partition(".")[0], [0.0, 0])
+            package[0] += own
+            package[1] += 1
+        lines += ["", "Import time by package:"]
+        lines += [
+            f"  {name:<40} {seconds:8.3f} s  ({count} modules)"
+            for name, (seconds, count) in sorted(
+                packages.items(), key=lambda item: -item[1][0]
+            )[:limit]
+        ]
+
+        lines += ["", "Slowest imports (cumulative, self):"]
+        lines += [
+            f"  {name:<40} {total:8.3f} s {own:8.3f} s"
+            for name, (own, total) in sorted(
+                self.imports.items(), key=lambda item: -item[1][1]
+            )[:limit]
+        ]
+        return "\n".join(lines)
+
+
+_profile: Optional[StartupProfile] = None
+
+
+def requested(argv: Optional[List[str]] = None) -> bool:
+    """Whether the command line asks for a startup profile."""
+    return PROFILE_FLAG in (sys.argv[1:] if argv is None else argv)
+
+
+def start() -> None:
+    """Start timing imports and phases; call before importing the app."""
+    global _profile
+    if _profile is None:
+        _profile = StartupProfile()
+        sys.meta_path.insert(0, _profile)
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Time an initialization step; does nothing unless profiling."""
+    if _profile is None:
+        yield
+        return
+    with _profile.phase(name):
+        yield
+
+
+def report_when_ready(server) -> None:
+    """Print the profile to stderr once the server accepts connections."""
+    profile = _profile
+    if profile is None:
+        return
+    start_server = time.perf_counter()
+
+    def report(**_):
+        global _profile
+        profile.phases.append(("server start", time.perf_counter() - start_server))
+        profile.stop()
+        _profile = None
+        print(profile.format(), file=sys.stderr, flush=True)
+
+    server.controller.on_server_ready.add(report)
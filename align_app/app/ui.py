@@ -36,6 +36,10 @@ CHOICE_INFO_DESCRIPTIONS = {
         "per-KDMA midpoints, relevance weights, and voting decisions"
     ),
     "Per step timing stats": "Seconds each pipeline ADM step in the took to execute",
+    "Model load timing": (
+        "Seconds spent loading the model before this decision: downloading, "
+        "loading weights and initializing the pipeline"
+    ),
 }
 
 DROP_HANDLER_JS = """
@@ -708,11 +712,23 @@ class Decision:
                     style=TITLE_TRUNCATE_STYLE,
                 )
                 with html.Template(v_else=True):
-                    vuetify3.VProgressCircular(
+                    with html.Div(
                         v_if=(PENDING_SPINNER_CONDITION,),
-                        indeterminate=True,
-                        size=20,
-                    )
+                        classes="d-flex align-center ga-1",
+                    ):
+                        vuetify3.VProgressCircular(indeterminate=True, size=20)
+                        with vuetify3.VBtn(
+                            icon=True,
+                            size="x-small",
+                            variant="text",
+                            title="Cancel if not started",
+                            click=(
+                                self.server.controller.cancel_run_decision,
+                                "[runs[id].cache_key]",
+                            ),
+                            raw_attrs=["@click.stop"],
+                        ):
+                            vuetify3.VIcon("mdi-close")
                     with vuetify3.VBtn(
                         v_else=True,
                         click=(self.server.controller.execute_run_decision, "[id]"),
@@ -733,6 +749,21 @@ class Decision:
                 with html.Template(v_if=("runs[id].decision",)):
                     html.Div("Justification", classes="text-h6")
                     html.P("{{runs[id].decision.justification}}")
+                with html.Div(
+                    v_else_if=(
+                        f"{PENDING_SPINNER_CONDITION} && "
+                        "decision_progress[runs[id].cache_key]",
+                    ),
+                    classes="text-medium-emphasis",
+                ):
+                    html.Div(
+                        "{{ decision_progress[runs[id].cache_key].message }}",
+                        classes="text-caption",
+                    )
+                    html.P(
+                        "{{ decision_progress[runs[id].cache_key].text }}",
+                        style="white-space: pre-wrap;",
+                    )
 
             RowWithLabel(
                 run_content=render_run_decision_text, compare_expr=Decision.COMPARE_EXPR
@@ -794,7 +825,9 @@ class ChoiceInfo:
                             with html.Template(v_else_if=("key === 'Alignment info'",)):
                                 AlignmentInfoRenderer("value")
                             with html.Template(
-                                v_else_if=("key === 'Per step timing stats'",)
+                                v_else_if=(
+                                    "key === 'Per step timing stats' || key === 'Model load timing'",
+                                )
                             ):
                                 PlainUnorderedObject("value")
                             with html.Template(v_else=True):
@@ -973,13 +1006,18 @@ class RunsTablePanel(html.Div):
                         html.Span("Clear")
 
                 with html.Div(style="flex: 1; overflow: hidden; display: flex;"):
-                    with vuetify3.VDataTable(
+                    with vuetify3.VDataTableServer(
                         items=("runs_table_items",),
+                        items_length=("runs_table_items_length",),
+                        v_model_page=("runs_table_page",),
+                        update_options=(
+                            ctrl.update_runs_table_options,
+                            "['panel', $event]",
+                        ),
                         headers=("runs_table_headers",),
                         item_value="id",
                         hover=True,
                         density="compact",
-                        search=("runs_table_search",),
                         items_per_page=(50,),
                         click_row=(ctrl.on_table_row_click, "[$event, item]"),
                         fixed_header=True,
@@ -1229,8 +1267,14 @@ class RunsTableModal(html.Div):
                         classes="pa-0",
                         style="height: calc(100vh - 64px); overflow: auto;",
                     ):
-                        with vuetify3.VDataTable(
-                            items=("runs_table_items",),
+                        with vuetify3.VDataTableServer(
+                            items=("runs_table_modal_items",),
+                            items_length=("runs_table_modal_items_length",),
+                            v_model_page=("runs_table_modal_page",),
+                            update_options=(
+                                self.server.controller.update_runs_table_options,
+                                "['modal', $event]",
+                            ),
                             headers=("runs_table_headers",),
                             model_value=("runs_table_selected",),
                             update_modelValue=(
@@ -1240,13 +1284,32 @@ class RunsTableModal(html.Div):
                             item_value="id",
                             show_select=True,
                             hover=True,
-                            search=("runs_table_search",),
                             items_per_page=(100,),
                             click_row=(
                                 self.server.controller.on_table_row_click,
                                 "[$event, item]",
                             ),
                         ):
+                            # The default header checkbox only selects the page
+                            with html.Template(
+                                raw_attrs=["v-slot:header.data-table-select"]
+                            ):
+                                vuetify3.VCheckboxBtn(
+                                    model_value=(
+                                        "runs_table_modal_items_length > 0 && "
+                                        "runs_table_selected.length >= "
+                                        "runs_table_modal_items_length",
+                                    ),
+                                    indeterminate=(
+                                        "runs_table_selected.length > 0 && "
+                                        "runs_table_selected.length < "
+                                        "runs_table_modal_items_length",
+                                    ),
+                                    update_modelValue=(
+                                        self.server.controller.select_all_runs_table_rows,
+                                        "[$event]",
+                                    ),
+                                )
                             with html.Template(
                                 raw_attrs=['v-slot:item.in_comparison="{ item }"']
                             ):
@@ -1378,6 +1441,50 @@ class AdmBrowserModal(html.Div):
                                         )
 
 
+class DeciderMetricsModal(html.Div):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        with self:
+            with vuetify3.VDialog(
+                v_model=("decider_metrics_open",),
+                max_width="800px",
+            ):
+                with vuetify3.VCard():
+                    with vuetify3.VToolbar(density="compact"):
+                        vuetify3.VToolbarTitle("Decider Metrics")
+                        vuetify3.VSpacer()
+                        with vuetify3.VBtn(
+                            icon=True,
+                            click=self.server.controller.refresh_decider_metrics,
+                        ):
+                            vuetify3.VIcon("mdi-refresh")
+                        with vuetify3.VBtn(
+                            icon=True,
+                            click=self.server.controller.close_decider_metrics,
+                        ):
+                            vuetify3.VIcon("mdi-close")
+                    with vuetify3.VCardText(
+                        style="max-height: 70vh; overflow-y: auto;",
+                    ):
+                        html.Div(
+                            "No decisions yet. Prometheus text is served at /metrics.",
+                            v_if=("decider_metrics_rows.length === 0",),
+                            classes="text-medium-emphasis",
+                        )
+                        vuetify3.VDataTable(
+                            v_else=True,
+                            items=("decider_metrics_rows",),
+                            headers=(
+                                "[{title: 'Metric', key: 'name'},"
+                                " {title: 'Labels', key: 'labels'},"
+                                " {title: 'Value', key: 'value'}]",
+                            ),
+                            density="compact",
+                            items_per_page=-1,
+                            hide_default_footer=True,
+                        )
+
+
 class ResultsComparison(html.Div):
     def __init__(self, **kwargs):
         super().__init__(classes="d-inline-flex flex-wrap ga-4", **kwargs)
@@ -1501,6 +1608,12 @@ class AlignLayout(SinglePageLayout):
                         ),
                     ],
                 )
+                with vuetify3.VBtn(
+                    icon=True,
+                    title="Decider metrics",
+                    click=server.controller.open_decider_metrics,
+                ):
+                    vuetify3.VIcon("mdi-chart-box-outline")
                 with vuetify3.VMenu():
                     with vuetify3.Template(v_slot_activator="{ props }"):
                         with vuetify3.VBtn(v_bind="props", prepend_icon="mdi-upload"):
@@ -1516,6 +1629,14 @@ class AlignLayout(SinglePageLayout):
                             prepend_icon="mdi-folder-open",
                             click="trame.refs.dirInput.click()",
                         )
+                with vuetify3.VBtn(
+                    click=self.server.controller.execute_compared_run_decisions,
+                    disabled=(
+                        "!runs_to_compare.some((id) => runs[id] && !runs[id].decision)",
+                    ),
+                    prepend_icon="mdi-send",
+                ):
+                    html.Span("Choose All")
                 with vuetify3.VBtn(
                     click="utils.download('align-app-experiments.zip', trigger('export_runs_zip'), 'application/zip')",
                     disabled=("Object.keys(runs).length === 0",),
@@ -1612,3 +1733,4 @@ class AlignLayout(SinglePageLayout):
                     ComparisonPanel()
                 RunsTableModal()
                 AdmBrowserModal()
+                DeciderMetricsModal()
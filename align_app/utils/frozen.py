@@ -0,0 +1,65 @@
+"""Read-only dict and list views for sharing cached configs.
+
+FrozenDict and FrozenList subclass dict and list, so reads, json, yaml and
+pydantic treat them as the plain containers they wrap. Mutating methods
+raise instead. ``copy.deepcopy`` and pickling hand back plain, mutable
+containers, so a caller that needs to edit a shared value, or send it to a
+decider worker, gets its own copy only at that point.
+"""
+
+import copy
+from typing import Any
+
+import yaml
+from yaml.representer import SafeRepresenter
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(
+        f"{type(self).__name__} is read-only; copy.deepcopy() it to make changes"
+    )
+
+
+def thaw(value: Any, memo=None) -> Any:
+    """Plain, mutable deep copy of a (possibly frozen) value."""
+    if isinstance(value, dict):
+        return {key: thaw(item, memo) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item, memo) for item in value]
+    return copy.deepcopy(value, memo)
+
+
+class FrozenDict(dict):
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __deepcopy__(self, memo):
+        return thaw(self, memo)
+
+    def __reduce__(self):
+        return (thaw, (dict(self),))
+
+
+class FrozenList(list):
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __deepcopy__(self, memo):
+        return thaw(self, memo)
+
+    def __reduce__(self):
+        return (thaw, (list(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Recursively wrap dicts and lists of value in read-only views."""
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+for _dumper in (yaml.Dumper, yaml.SafeDumper):
+    yaml.add_representer(FrozenDict, SafeRepresenter.represent_dict, Dumper=_dumper)
+    yaml.add_representer(FrozenList, SafeRepresenter.represent_list, Dumper=_dumper)
@@ -1,6 +1,11 @@
 import asyncio
-from functools import wraps
+from collections import OrderedDict
+from functools import lru_cache, wraps
+from importlib.util import find_spec
+from pathlib import Path
 import copy
+import threading
+from typing import Any, Callable, Hashable
 from trame.app import asynchronous
 import re
 
@@ -124,25 +129,59 @@ def debounce(wait, state=None):
     return decorator
 
 
-def merge_dicts(base_dict, override_dict):
+def merge_dicts(base_dict, *override_dicts):
     """
-    Recursively merge two dictionaries, with the override_dict values taking precedence.
+    Recursively merge dictionaries, with later override_dicts values taking precedence.
+
+    base_dict is deep-copied once and neither input is modified.
     """
     result = copy.deepcopy(base_dict)
+    for override_dict in override_dicts:
+        _merge_into(result, override_dict)
+    return result
 
-    for key, override_value in override_dict.items():
-        if key not in result:
-            result[key] = copy.deepcopy(override_value)
-            continue
-
-        base_value = result[key]
 
+def _merge_into(target, override_dict):
+    for key, override_value in override_dict.items():
+        base_value = target.get(key)
         if isinstance(base_value, dict) and isinstance(override_value, dict):
-            result[key] = merge_dicts(base_value, override_value)
+            _merge_into(base_value, override_value)
         else:
-            result[key] = copy.deepcopy(override_value)
-
-    return result
+            target[key] = copy.deepcopy(override_value)
+
+
+class BoundedCache:
+    """Thread-safe LRU; values are computed outside the lock."""
+
+    def __init__(self, max_items: int):
+        self.max_items = max_items
+        self._items: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                return self._items[key]
+        value = compute()
+        with self._lock:
+            self._items[key] = value
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+@lru_cache(maxsize=None)
+def package_dir(name: str) -> Path:
+    """Directory of an installed package, found without importing it."""
+    spec = find_spec(name)
+    if spec is None or not spec.submodule_search_locations:
+        raise ImportError(f"Package {name!r} is not installed")
+    return Path(next(iter(spec.submodule_search_locations)))
 
 
 def create_nested_dict_from_path(path_keys, value):
@@ -0,0 +1,115 @@
+"""Benchmark runs_core operations on a large runs store.
+
+Builds a store with N runs plus N cached decisions, then times the single
+edits the UI performs (add, update, remove, cache a decision) against it.
+Every edit should stay well under a frame budget regardless of N.
+
+    python benchmarks/runs_store.py --runs 100000
+"""
+
+import argparse
+import statistics
+import time
+
+from align_utils.models import (
+    ADMResult,
+    AlignmentTarget,
+    ChoiceInfo,
+    Decision,
+    InputData,
+)
+
+from align_app.adm.decider.types import DeciderParams
+from align_app.adm.run_models import Run, RunDecision
+from align_app.app import runs_core
+
+
+def make_run(index: int, decided: bool) -> Run:
+    decision = None
+    if decided:
+        decision = RunDecision.model_construct(
+            adm_result=ADMResult.model_construct(
+                decision=Decision(unstructured="A", justification="benchmark"),
+                choice_info=ChoiceInfo(),
+            ),
+            choice_index=0,
+        )
+    return Run.model_construct(
+        id=f"run-{index}",
+        probe_id=f"scenario.scene.probe-{index}",
+        decider_name="pipeline_baseline",
+        llm_backbone_name="mistral",
+        system_prompt="",
+        decider_params=DeciderParams.model_construct(
+            scenario_input=InputData.model_construct(
+                scenario_id="scenario",
+                state=f"state {index}",
+                choices=[{"unstructured": "A"}, {"unstructured": "B"}],
+            ),
+            alignment_target=AlignmentTarget.model_construct(
+                id="baseline", kdma_values=[]
+            ),
+            resolved_config={"model": "m", "seed": index},
+        ),
+        decision=decision,
+    )
+
+
+def timed(label: str, func, repeat: int):
+    samples = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        func(i)
+        samples.append(time.perf_counter() - start)
+    median_ms = statistics.median(samples) * 1000
+    worst_ms = max(samples) * 1000
+    print(f"{label:<28} median {median_ms:8.3f} ms   max {worst_ms:8.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    runs = [make_run(i, decided=True) for i in range(args.runs)]
+    start = time.perf_counter()
+    data = runs_core.add_runs_bulk(runs_core.init_runs(), runs)
+    build_s = time.perf_counter() - start
+    print(
+        f"{len(data.runs)} runs, {len(data.decision_cache)} cached decisions "
+        f"built in {build_s:.2f} s"
+    )
+
+    state = {"data": data}
+    extra = [make_run(args.runs + i, decided=False) for i in range(args.repeat)]
+    decision = runs[0].decision
+    assert decision is not None
+
+    def add(i):
+        state["data"] = runs_core.add_run(state["data"], extra[i])
+
+    def update(i):
+        state["data"] = runs_core.update_run(state["data"], extra[i].id, extra[i])
+
+    def cache(i):
+        state["data"] = runs_core.add_cached_decision(
+            state["data"], f"key-{i}", decision
+        )
+
+    def remove(i):
+        state["data"] = runs_core.remove_run(state["data"], extra[i].id)
+
+    timed("add_run", add, args.repeat)
+    timed("update_run", update, args.repeat)
+    timed("add_cached_decision", cache, args.repeat)
+    timed("remove_run", remove, args.repeat)
+
+    snapshot = state["data"]
+    state["data"] = runs_core.add_run(snapshot, extra[0])
+    timed("read old snapshot", lambda i: runs_core.get_run(snapshot, "run-0"), 1)
+    timed("read newest", lambda i: runs_core.get_run(state["data"], "run-0"), 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Benchmark runs table filtering with the column bitmap index.
+
+Indexes N synthetic table rows, then times filter queries of increasing
+selectivity and incremental row updates against the list scan it replaces.
+
+    python benchmarks/runs_table_filter.py --rows 100000
+"""
+
+import argparse
+import random
+import time
+
+from align_app.app.column_index import ColumnIndex
+from align_app.app.runs_table_filter import FILTER_COLUMNS
+
+COLUMNS = [column for _, column in FILTER_COLUMNS]
+
+
+def make_rows(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"row-{i}",
+            "scenario_id": f"scenario-{rng.randrange(40)}",
+            "scene_id": f"scene-{rng.randrange(12)}",
+            "decider_name": f"decider-{rng.randrange(8)}",
+            "llm_backbone_name": f"llm-{rng.randrange(5)}",
+            "alignment_summary": f"Affiliation {rng.randrange(11) / 10}",
+            "decision_text": f"{rng.choice('AB')}. action {rng.randrange(2000)}",
+        }
+        for i in range(count)
+    ]
+
+
+def scan(rows, filters):
+    """The list scan the index replaced: every row against every filter."""
+    return [
+        row
+        for row in rows
+        if all(not values or row.get(column) in values for column, values in filters)
+    ]
+
+
+def timed_ms(func, repeat: int = 20) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    index = ColumnIndex(COLUMNS)
+    start = time.perf_counter()
+    index.rebuild((row["id"], row) for row in rows)
+    print(f"indexed {len(index)} rows in {time.perf_counter() - start:.2f} s")
+
+    queries = {
+        "one decider": [("decider_name", ["decider-1"])],
+        "decider x llm": [
+            ("decider_name", ["decider-1", "decider-2"]),
+            ("llm_backbone_name", ["llm-3"]),
+        ],
+        "three columns": [
+            ("scenario_id", ["scenario-4"]),
+            ("decider_name", ["decider-1"]),
+            ("alignment_summary", ["Affiliation 0.5"]),
+        ],
+        "rare decision": [("decision_text", ["A. action 17", "B. action 17"])],
+    }
+    for label, filters in queries.items():
+        matched = len(index.match(filters))
+        index_ms = timed_ms(lambda: index.match(filters))
+        scan_ms = timed_ms(lambda: scan(rows, filters), repeat=3)
+        print(
+            f"{label:<16} {matched:>7} rows   index {index_ms:7.2f} ms   "
+            f"scan {scan_ms:7.2f} ms"
+        )
+
+    updates = make_rows(1000, seed=1)
+    start = time.perf_counter()
+    for row, old in zip(updates, rows):
+        index.add(old["id"], row)
+    update_us = (time.perf_counter() - start) * 1e6 / len(updates)
+    print(f"incremental update   {update_us:7.1f} us per row")
+
+
+if __name__ == "__main__":
+    main()
@@ -34,7 +34,7 @@ def test_load_experiments_from_zip(page, align_app_server, experiments_fixtures_
     expect(table_panel).to_be_visible()
 
     def get_table_items_count():
-        return page.evaluate("window.trame.state.state.runs_table_items?.length || 0")
+        return page.evaluate("window.trame.state.state.runs_table_items_length || 0")
 
     initial_count = get_table_items_count()
 
@@ -0,0 +1,97 @@
+"""Tests for resolving attribute definitions from decider configs."""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from omegaconf import OmegaConf
+
+from align_app.adm import attribute_definitions
+from align_app.adm.attribute_definitions import (
+    get_attribute_definitions,
+    resolve_attribute_definitions,
+)
+
+CONFIG = {
+    "mu": 0.3,
+    "instance": {"_target_": "${ref:adm.step_definitions.missing}"},
+    "broken": "${does.not.exist}",
+    "attribute_definitions": {
+        "merit": {
+            "name": "merit",
+            "description": "Merit focus",
+            "mu": "${adm.mu}",
+            "score_examples": "${ref:adm.examples}",
+        }
+    },
+}
+
+
+def test_resolves_adm_references_and_keeps_ref_strings():
+    assert resolve_attribute_definitions(CONFIG) == {
+        "merit": {
+            "name": "merit",
+            "description": "Merit focus",
+            "mu": 0.3,
+            "score_examples": "${ref:adm.examples}",
+        }
+    }
+    assert not OmegaConf.has_resolver("ref")
+
+
+def test_adm_references_resolve_without_omegaconf(monkeypatch):
+    monkeypatch.setitem(sys.modules, "omegaconf", None)
+
+    resolved = resolve_attribute_definitions(CONFIG)
+
+    assert resolved["merit"]["mu"] == 0.3
+    assert resolved["merit"]["score_examples"] == "${ref:adm.examples}"
+
+
+def test_other_interpolations_are_left_to_omegaconf():
+    config = {
+        "mu": 0.3,
+        "attribute_definitions": {"merit": {"description": "mu is ${adm.mu}"}},
+    }
+
+    assert resolve_attribute_definitions(config) == {
+        "merit": {"description": "mu is 0.3"}
+    }
+
+
+def test_configs_without_definitions_resolve_to_empty():
+    assert resolve_attribute_definitions(None) == {}
+    assert resolve_attribute_definitions({"mu": 0.3}) == {}
+
+
+def test_definitions_are_resolved_once_per_decider_config(monkeypatch):
+    attribute_definitions._resolved.clear()
+    calls = []
+
+    def fake_get_decider_config(probe_id, all_deciders, datasets, decider):
+        calls.append(decider)
+        return all_deciders[decider]["resolved_config"]
+
+    monkeypatch.setattr(
+        attribute_definitions, "get_decider_config", fake_get_decider_config
+    )
+    deciders = {"edited": {"edited_config": True, "resolved_config": CONFIG}}
+    datasets = {"phase2": {"probes": {"scenario.scene": object()}}}
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(
+            pool.map(
+                lambda _: get_attribute_definitions(
+                    "scenario.scene", "edited", deciders, datasets
+                ),
+                range(8),
+            )
+        )
+
+    assert all(result["merit"]["mu"] == 0.3 for result in results)
+    assert 1 <= len(calls) <= 4
+    get_attribute_definitions("scenario.scene", "edited", deciders, datasets)
+    assert (
+        get_attribute_definitions("scenario.scene", "missing", deciders, datasets) == {}
+    )
+    assert len(calls) <= 4
+    attribute_definitions._resolved.clear()
@@ -77,3 +77,68 @@ def test_hash_run_params_different_for_changed_params():
     )
 
     assert hash1 != hash2
+
+
+def make_run(run_id="run-1", state="scenario text"):
+    from align_app.adm.run_models import Run
+    from align_app.adm.decider.types import DeciderParams
+
+    return Run(
+        id=run_id,
+        probe_id="test.scene.probe",
+        decider_name="adept-icl-template",
+        llm_backbone_name="gpt-4o",
+        system_prompt="",
+        decider_params=DeciderParams(
+            scenario_input=InputData(
+                scenario_id="test_scenario",
+                state=state,
+                choices=[{"unstructured": "A"}, {"unstructured": "B"}],
+            ),
+            alignment_target=AlignmentTarget(id="test_target", kdma_values=[]),
+            resolved_config={},
+        ),
+    )
+
+
+def test_cache_key_is_memoized_until_hashed_fields_change():
+    from unittest.mock import patch
+
+    run = make_run()
+    key = run.compute_cache_key()
+
+    with patch("align_app.adm.run_models.hash_run_params") as mock_hash:
+        assert run.compute_cache_key() == key
+        assert run.model_copy(update={"id": "run-2"}).compute_cache_key() == key
+        mock_hash.assert_not_called()
+
+    changed = run.model_copy(update={"probe_id": "other.scene.probe"})
+    assert changed.compute_cache_key() != key
+
+
+def test_runs_index_finds_runs_by_cache_key():
+    from align_app.app import runs_core
+
+    first = make_run("run-1")
+    duplicate = make_run("run-2")
+    other = make_run("run-3", state="other text")
+
+    data = runs_core.add_runs_bulk(runs_core.init_runs(), [first, duplicate])
+    data = runs_core.add_run(data, other)
+    key = first.compute_cache_key()
+
+    assert runs_core.get_run_by_cache_key(data, key) == first
+    assert runs_core.get_run_by_cache_key(data, other.compute_cache_key()) == other
+
+    data = runs_core.remove_run(data, "run-1")
+    assert runs_core.get_run_by_cache_key(data, key) == duplicate
+
+    data = runs_core.remove_run(data, "run-2")
+    assert runs_core.get_run_by_cache_key(data, key) is None
+
+
+def test_memoized_cache_key_does_not_affect_equality():
+    run = make_run()
+    run.compute_cache_key()
+
+    assert run == make_run()
@@ -0,0 +1,95 @@
+"""Tests for the bitmap index behind runs table filtering."""
+
+import random
+
+import pytest
+
+from align_app.app import column_index
+from align_app.app.column_index import ColumnIndex, bits_from_slots, slots_from_bits
+
+COLUMNS = ["decider_name", "llm_backbone_name", "decision_text"]
+
+
+@pytest.fixture(autouse=True)
+def small_sparse_limit(monkeypatch):
+    # Exercise both the slot-set and the bitset representations
+    monkeypatch.setattr(column_index, "SPARSE_LIMIT", 3)
+
+
+def make_rows(count, seed=0):
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"row-{i}",
+            "decider_name": rng.choice(["a", "b", "c"]),
+            "llm_backbone_name": rng.choice(["x", "y"]),
+            "decision_text": f"choice {rng.randrange(20)}",
+        }
+        for i in range(count)
+    ]
+
+
+def expected_ids(rows, filters):
+    """Ids of rows matching every non-empty filter, by scanning the rows."""
+    return [
+        row["id"]
+        for row in rows
+        if all(not values or row.get(column) in values for column, values in filters)
+    ]
+
+
+def test_bit_helpers_round_trip():
+    assert slots_from_bits(bits_from_slots([0, 5, 9, 64], 70)) == [0, 5, 9, 64]
+    assert slots_from_bits(0) == []
+
+
+def test_match_agrees_with_a_brute_force_filter():
+    rows = make_rows(200)
+    index = ColumnIndex(COLUMNS)
+    index.rebuild((row["id"], row) for row in rows)
+
+    for filters in [
+        [],
+        [("decider_name", ["a"])],
+        [("decider_name", ["a", "c"]), ("llm_backbone_name", ["y"])],
+        [("decision_text", ["choice 3", "choice 7"]), ("decider_name", [])],
+        [("decider_name", ["missing"])],
+    ]:
+        assert index.match(filters) == expected_ids(rows, filters)
+
+
+def test_rows_missing_a_filtered_key_do_not_match_it():
+    rows = [
+        {"id": "no-llm", "decider_name": "a"},
+        {"id": "with-llm", "decider_name": "a", "llm_backbone_name": "x"},
+    ]
+    index = ColumnIndex(COLUMNS)
+    index.rebuild((row["id"], row) for row in rows)
+
+    assert index.match([("llm_backbone_name", ["x"])]) == ["with-llm"]
+    assert index.match([("decider_name", ["a"]), ("llm_backbone_name", [])]) == [
+        "no-llm",
+        "with-llm",
+    ]
+
+
+def test_incremental_updates_match_a_rebuild():
+    rows = {row["id"]: row for row in make_rows(100)}
+    index = ColumnIndex(COLUMNS)
+    for row_id, row in rows.items():
+        index.add(row_id, row)
+
+    rng = random.Random(1)
+    for i in range(300):
+        row_id = f"row-{rng.randrange(120)}"
+        if rng.random() < 0.3:
+            rows.pop(row_id, None)
+            index.remove(row_id)
+        else:
+            row = {**make_rows(1, seed=i)[0], "id": row_id}
+            rows[row_id] = row
+            index.add(row_id, row)
+
+    filters = [("decider_name", ["b"]), ("llm_backbone_name", ["x"])]
+    assert index.match(filters) == expected_ids(list(rows.values()), filters)
+    assert len(index) == len(rows)
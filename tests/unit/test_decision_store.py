@@ -0,0 +1,181 @@
+"""Tests for the persistent decision cache."""
+
+import asyncio
+
+from align_utils.models import (
+    ADMResult,
+    AlignmentTarget,
+    ChoiceInfo,
+    Decision,
+    InputData,
+)
+
+from align_app.adm.decider.types import DeciderParams
+from align_app.adm.run_models import Run, RunDecision
+from align_app.app import runs_core
+from align_app.app import decision_store
+from align_app.app.decision_store import DecisionStore
+from align_app.app.runs_registry import RunsRegistry
+
+
+def make_decision(choice: str, justification: str = "because") -> RunDecision:
+    return RunDecision(
+        adm_result=ADMResult(
+            decision=Decision(unstructured=choice, justification=justification),
+            choice_info=ChoiceInfo(choice_id=choice),
+        ),
+        choice_index=0,
+    )
+
+
+def make_run(run_id: str = "run-1") -> Run:
+    return Run(
+        id=run_id,
+        probe_id="scenario.scene.probe",
+        decider_name="pipeline_baseline",
+        llm_backbone_name="mistral",
+        system_prompt="",
+        decider_params=DeciderParams(
+            scenario_input=InputData(
+                scenario_id="scenario",
+                state="text",
+                choices=[{"unstructured": "A"}, {"unstructured": "B"}],
+            ),
+            alignment_target=AlignmentTarget(id="baseline", kdma_values=[]),
+            resolved_config={"model": "m"},
+        ),
+    )
+
+
+class MockProbeRegistry:
+    def get_probe(self, probe_id):
+        return None
+
+
+class MockDeciderRegistry:
+    def get_system_prompt(self, **kwargs):
+        return ""
+
+
+def test_decision_survives_reopening(tmp_path):
+    path = tmp_path / "decisions.sqlite"
+    store = DecisionStore(path)
+    store.put("key", make_decision("A"))
+    store.close()
+
+    reopened = DecisionStore(path)
+
+    assert "key" in reopened
+    assert reopened.get("key") == make_decision("A")
+    assert reopened.get("missing") is None
+
+
+def test_stores_in_two_handles_see_each_others_writes(tmp_path):
+    path = tmp_path / "decisions.sqlite"
+    first = DecisionStore(path)
+    second = DecisionStore(path)
+
+    first.put("key", make_decision("B"))
+
+    assert second.get("key") == make_decision("B")
+
+
+def test_least_recently_read_decisions_are_evicted(tmp_path):
+    store = DecisionStore(tmp_path / "decisions.sqlite")
+    store.put("old", make_decision("A", "x" * 50))
+    store.put("read", make_decision("B", "y" * 50))
+    store.get("read")
+    store.max_bytes = store.total_bytes()
+
+    store.put("new", make_decision("C", "z" * 50))
+
+    assert "old" not in store
+    assert "read" in store
+    assert "new" in store
+
+
+def test_get_many_returns_only_stored_decisions(tmp_path, monkeypatch):
+    monkeypatch.setattr(decision_store, "READ_BATCH_SIZE", 2)
+    store = DecisionStore(tmp_path / "decisions.sqlite")
+    for key in "abc":
+        store.put(key, make_decision(key.upper()))
+
+    found = store.get_many(["a", "b", "c", "missing"])
+
+    assert found == {key: make_decision(key.upper()) for key in "abc"}
+    assert store.get_many([]) == {}
+
+
+def test_running_total_tracks_puts_replacements_and_deletes(tmp_path):
+    store = DecisionStore(tmp_path / "decisions.sqlite")
+    store.put("a", make_decision("A", "x" * 50))
+    store.put("b", make_decision("B"))
+    store.put("a", make_decision("A"))
+    store._conn.execute("DELETE FROM decisions WHERE cache_key LIKE '%:b'")
+
+    assert (
+        store.total_bytes()
+        == store._conn.execute("SELECT SUM(size) FROM decisions").fetchone()[0]
+    )
+
+
+def test_read_times_are_written_in_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(decision_store, "ACCESS_FLUSH_ITEMS", 2)
+    store = DecisionStore(tmp_path / "decisions.sqlite")
+    other = DecisionStore(tmp_path / "decisions.sqlite")
+    store.put("a", make_decision("A"))
+    store.put("b", make_decision("B"))
+
+    def accessed():
+        return dict(other._conn.execute("SELECT cache_key, accessed FROM decisions"))
+
+    written = accessed()
+    store.get("a")
+    assert accessed() == written
+    store.get("b")
+    assert accessed() != written
+
+
+def test_other_versions_do_not_share_decisions(tmp_path):
+    path = tmp_path / "decisions.sqlite"
+    DecisionStore(path, namespace="align-system=1").put("key", make_decision("A"))
+
+    upgraded = DecisionStore(path, namespace="align-system=2")
+
+    assert upgraded.get("key") is None
+    assert "key" not in upgraded
+
+
+def test_registry_reuses_decision_after_restart(tmp_path, monkeypatch):
+    path = tmp_path / "decisions.sqlite"
+    fetched = []
+
+    async def fake_fetch_decision(run, probe_choices, *args):
+        fetched.append(run.id)
+        return make_decision("A")
+
+    monkeypatch.setattr(runs_core, "fetch_decision", fake_fetch_decision)
+
+    registry = RunsRegistry(
+        MockProbeRegistry(), MockDeciderRegistry(), DecisionStore(path)
+    )
+    asyncio.run(registry._execute_with_cache(make_run("first"), []))
+
+    restarted = RunsRegistry(
+        MockProbeRegistry(), MockDeciderRegistry(), DecisionStore(path)
+    )
+    restarted.add_run(make_run("second"))
+    assert asyncio.run(restarted.has_cached_decision("second"))
+    result = asyncio.run(restarted._execute_with_cache(make_run("second"), []))
+
+    assert fetched == ["first"]
+    assert result.decision == make_decision("A")
+
+
+def test_unreadable_rows_are_dropped(tmp_path):
+    store = DecisionStore(tmp_path / "decisions.sqlite")
+    store.put("key", make_decision("A"))
+    store._conn.execute("UPDATE decisions SET payload = ?", (b"not zlib",))
+
+    assert store.get("key") is None
+    assert "key" not in store
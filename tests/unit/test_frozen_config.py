@@ -0,0 +1,84 @@
+"""Tests for memoized, read-only decider configs."""
+
+import copy
+import json
+import pickle
+
+import pytest
+import yaml
+
+from align_app.adm.config import get_decider_config
+from align_app.utils.frozen import FrozenDict, FrozenList, freeze
+from align_app.utils.utils import merge_dicts
+
+DATASETS = {"phase2": {"probes": {"scenario.scene": object()}}}
+
+
+def test_frozen_views_reject_changes():
+    config = freeze({"engine": {"model_name": "m"}, "steps": [{"name": "a"}]})
+
+    with pytest.raises(TypeError):
+        config["engine"]["model_name"] = "other"
+    with pytest.raises(TypeError):
+        config["steps"].append({"name": "b"})
+    with pytest.raises(TypeError):
+        config.update(extra=1)
+
+
+def test_frozen_views_serialize_and_thaw_like_plain_containers():
+    plain = {"engine": {"model_name": "m"}, "steps": [{"name": "a"}]}
+    config = freeze(plain)
+
+    assert config == plain
+    assert json.loads(json.dumps(config)) == plain
+    assert yaml.safe_load(yaml.dump(config)) == plain
+    assert "!!python" not in yaml.dump(config)
+
+    for thawed in (copy.deepcopy(config), pickle.loads(pickle.dumps(config))):
+        assert thawed == plain
+        assert type(thawed) is dict
+        assert type(thawed["steps"]) is list
+        thawed["engine"]["model_name"] = "edited"
+    assert config["engine"]["model_name"] == "m"
+
+
+def test_merge_dicts_merges_overrides_in_order_without_touching_inputs():
+    base = {"a": {"x": 1, "y": [1]}, "b": 1}
+    first = {"a": {"y": [2]}, "c": {"z": 1}}
+    second = {"a": {"x": 3}, "c": 2}
+
+    merged = merge_dicts(base, first, second)
+
+    assert merged == {"a": {"x": 3, "y": [2]}, "b": 1, "c": 2}
+    assert base == {"a": {"x": 1, "y": [1]}, "b": 1}
+    assert first == {"a": {"y": [2]}, "c": {"z": 1}}
+    merged["a"]["y"].append(3)
+    assert first["a"]["y"] == [2]
+
+
+def test_decider_configs_are_memoized_per_llm_backbone():
+    deciders = {
+        "edited": {
+            "edited_config": True,
+            "resolved_config": {"structured_inference_engine": {"model_name": "m"}},
+        }
+    }
+
+    config = get_decider_config("scenario.scene", deciders, DATASETS, "edited")
+    other_llm = get_decider_config(
+        "scenario.scene", deciders, DATASETS, "edited", llm_backbone="llm-2"
+    )
+
+    assert isinstance(config, FrozenDict)
+    assert get_decider_config("scenario.scene", deciders, DATASETS, "edited") is config
+    assert other_llm["structured_inference_engine"]["model_name"] == "llm-2"
+    assert config["structured_inference_engine"]["model_name"] == "m"
+    assert deciders["edited"]["resolved_config"] == {
+        "structured_inference_engine": {"model_name": "m"}
+    }
+    assert get_decider_config("scenario.scene", deciders, DATASETS, "missing") is None
+
+
+def test_frozen_list_is_a_list():
+    assert isinstance(freeze([1, [2]])[1], FrozenList)
+    assert freeze([1, [2]]) == [1, [2]]
@@ -0,0 +1,94 @@
+"""Tests for the on-disk cache of composed Hydra configs."""
+
+import pytest
+
+from align_app.adm import hydra_config_loader
+from align_app.adm.hydra_config_loader import configure_config_cache, load_adm_config
+
+ADM = """defaults:
+  - /engine@structured_inference_engine: fast
+  - _self_
+instance:
+  _target_: align_system.Adm
+  temperature: ${adm.temperature}
+temperature: 0.5
+"""
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    root = tmp_path / "configs"
+    (root / "adm").mkdir(parents=True)
+    (root / "engine").mkdir()
+    (root / "adm" / "baseline.yaml").write_text(ADM)
+    (root / "engine" / "fast.yaml").write_text("model_name: small\n")
+    return root
+
+
+@pytest.fixture
+def composes(tmp_path, monkeypatch):
+    """Count Hydra compositions while the cache lives in a temporary directory."""
+    calls = []
+    compose = hydra_config_loader._compose
+
+    def counting_compose(config_dir_path, config_name, overrides):
+        calls.append(config_name)
+        return compose(config_dir_path, config_name, overrides)
+
+    monkeypatch.setattr(hydra_config_loader, "_compose", counting_compose)
+    configure_config_cache(tmp_path / "cache")
+    load_adm_config.cache_clear()
+    yield calls
+    load_adm_config.cache_clear()
+    configure_config_cache(None)
+
+
+def load(config_dir):
+    load_adm_config.cache_clear()  # as after a restart
+    return load_adm_config("adm/baseline.yaml", str(config_dir))
+
+
+def test_restart_reuses_composed_config(config_dir, composes):
+    first = load(config_dir)
+    second = load(config_dir)
+
+    assert second == first
+    assert first["adm"]["structured_inference_engine"] == {"model_name": "small"}
+    assert first["adm"]["instance"]["temperature"] == "${adm.temperature}"
+    assert "hydra" not in first
+    assert composes == ["adm/baseline"]
+
+
+@pytest.mark.parametrize("edited", ["adm/baseline.yaml", "engine/fast.yaml"])
+def test_editing_an_included_file_composes_again(config_dir, composes, edited):
+    load(config_dir)
+    path = config_dir / edited
+    path.write_text(path.read_text().replace("small", "large").replace("0.5", "0.7"))
+
+    config = load(config_dir)
+
+    assert len(composes) == 2
+    assert config == load(config_dir)
+    assert len(composes) == 2
+
+
+def test_new_align_system_version_composes_again(config_dir, composes, monkeypatch):
+    load(config_dir)
+    monkeypatch.setattr(
+        hydra_config_loader,
+        "_versions",
+        lambda: {"align_system": "next", "hydra": "same"},
+    )
+
+    load(config_dir)
+
+    assert len(composes) == 2
+
+
+def test_disabled_cache_always_composes(config_dir, composes):
+    configure_config_cache(None)
+
+    load(config_dir)
+    load(config_dir)
+
+    assert len(composes) == 2
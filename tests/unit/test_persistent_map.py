@@ -0,0 +1,58 @@
+"""Tests for the structurally shared map behind Runs."""
+
+from align_app.app.persistent_map import PersistentMap
+
+
+def test_updates_leave_earlier_versions_unchanged():
+    empty = PersistentMap()
+    one = empty.set("a", 1)
+    two = one.set("b", 2)
+    changed = two.set("a", 10)
+    removed = changed.delete("b")
+
+    assert dict(empty) == {}
+    assert dict(one) == {"a": 1}
+    assert dict(two) == {"a": 1, "b": 2}
+    assert dict(changed) == {"a": 10, "b": 2}
+    assert dict(removed) == {"a": 10}
+    # Reading old versions out of order moves the shared dict back and forth
+    assert dict(two) == {"a": 1, "b": 2}
+    assert dict(removed) == {"a": 10}
+
+
+def test_branching_from_an_old_version():
+    base = PersistentMap({"a": 1})
+    left = base.set("b", 2)
+    right = base.set("c", 3)
+
+    assert dict(left) == {"a": 1, "b": 2}
+    assert dict(right) == {"a": 1, "c": 3}
+    assert dict(base) == {"a": 1}
+
+
+def test_bulk_update_with_repeated_keys():
+    base = PersistentMap({"a": 1})
+    updated = base.update([("a", 2), ("b", 3), ("a", 4)])
+
+    assert dict(updated) == {"a": 4, "b": 3}
+    assert dict(base) == {"a": 1}
+
+
+def test_no_op_changes_return_same_version():
+    value = object()
+    base = PersistentMap({"a": value})
+
+    assert base.set("a", value) is base
+    assert base.delete("missing") is base
+
+
+def test_iteration_is_stable_while_newer_versions_change():
+    base = PersistentMap({"a": 1, "b": 2})
+    latest = base
+    seen = []
+    for key, value in base.items():
+        seen.append((key, value))
+        latest = latest.set(f"{key}-copy", value)
+
+    assert seen == [("a", 1), ("b", 2)]
+    assert len(latest) == 4
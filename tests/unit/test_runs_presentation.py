@@ -1,13 +1,11 @@
 from unittest.mock import MagicMock, patch
-from align_app.app.runs_presentation import run_to_state_dict
+from align_app.app.runs_presentation import PresentationCache, run_to_state_dict
 from align_app.adm.run_models import Run
 
 
-@patch("align_app.app.runs_presentation.get_decider_config")
 @patch("align_app.app.runs_presentation.hash_run_params")
-def test_run_to_state_dict_creates_comparison_label(mock_hash, mock_get_config):
+def test_run_to_state_dict_creates_comparison_label(mock_hash):
     mock_hash.return_value = "mock_hash"
-    mock_get_config.return_value = {}
 
     # Setup mocks
     mock_run = MagicMock(spec=Run)
@@ -36,6 +34,7 @@ def test_run_to_state_dict_creates_comparison_label(mock_hash, mock_get_config):
     mock_run.system_prompt = "Test System Prompt"
     mock_decider_registry.get_all_deciders.return_value = {"test-decider": {}}
     mock_decider_registry.get_system_prompt.return_value = "Test System Prompt"
+    mock_decider_registry.get_attribute_definitions.return_value = {}
     mock_decider_registry.get_decider_options.return_value = {
         "llm_backbones": ["gpt-4"],
         "max_alignment_attributes": 3,
@@ -56,13 +55,9 @@ def test_run_to_state_dict_creates_comparison_label(mock_hash, mock_get_config):
     assert result["comparison_label"] == expected_label
 
 
-@patch("align_app.app.runs_presentation.get_decider_config")
 @patch("align_app.app.runs_presentation.hash_run_params")
-def test_run_to_state_dict_creates_comparison_label_no_alignment(
-    mock_hash, mock_get_config
-):
+def test_run_to_state_dict_creates_comparison_label_no_alignment(mock_hash):
     mock_hash.return_value = "mock_hash"
-    mock_get_config.return_value = {}
 
     # Setup mocks
     mock_run = MagicMock(spec=Run)
@@ -85,6 +80,7 @@ def test_run_to_state_dict_creates_comparison_label_no_alignment(
     mock_decider_registry.get_all_deciders.return_value = {"test-decider": {}}
     mock_decider_registry.get_decider_options.return_value = {}
     mock_decider_registry.get_system_prompt.return_value = "Test System Prompt"
+    mock_decider_registry.get_attribute_definitions.return_value = {}
     mock_probe_registry.get_attributes.return_value = {}
     mock_probe_registry.get_probes.return_value = {}  # Return empty dict of probes
 
@@ -96,3 +92,56 @@ def test_run_to_state_dict_creates_comparison_label_no_alignment(
     # Verify
     expected_label = "test-scenario - test-scene - No Alignment - test-decider - gpt-4"
     assert result["comparison_label"] == expected_label
+
+
+def make_mock_run(run_id):
+    mock_run = MagicMock(spec=Run)
+    mock_run.id = run_id
+    mock_run.probe_id = "test-probe"
+    mock_run.decider_name = "test-decider"
+    mock_run.llm_backbone_name = "gpt-4"
+    mock_run.decision = None
+    mock_run.system_prompt = "Unknown"
+    mock_run.compute_cache_key.return_value = f"key-{run_id}"
+    mock_params = MagicMock()
+    mock_params.scenario_input.scenario_id = "test-scenario"
+    mock_params.scenario_input.full_state = {"meta_info": {"scene_id": "test-scene"}}
+    mock_params.resolved_config = {"seed": 1}
+    mock_params.alignment_target.kdma_values = []
+    mock_run.decider_params = mock_params
+    return mock_run
+
+
+def test_run_to_state_dict_reuses_scene_lists_until_probes_are_added():
+    probes = {}
+    mock_probe_registry = MagicMock()
+    mock_probe_registry.get_probes.return_value = probes
+    mock_probe_registry.get_attributes.return_value = {}
+    mock_decider_registry = MagicMock()
+    mock_decider_registry.get_all_deciders.return_value = {"test-decider": {}}
+    mock_decider_registry.get_decider_options.return_value = {}
+    mock_decider_registry.get_system_prompt.return_value = "Generated Prompt"
+    mock_decider_registry.get_attribute_definitions.return_value = {}
+    cache = PresentationCache()
+
+    results = [
+        run_to_state_dict(
+            make_mock_run(f"run-{i}"), mock_probe_registry, mock_decider_registry, cache
+        )
+        for i in range(3)
+    ]
+
+    assert [r["prompt"]["system_prompt"] for r in results] == ["Generated Prompt"] * 3
+    assert results[0]["prompt"]["resolved_config_yaml"] == "seed: 1\n"
+    assert mock_probe_registry.get_probes.call_count == 1
+
+    # Probes added to the scenario change its scene list, even at the same count
+    probe = MagicMock(scenario_id="test-scenario", scene_id="new-scene")
+    probe.display_state = "New scene"
+    probes["new-probe"] = probe
+    cache.invalidate({"new-probe": probe})
+    result = run_to_state_dict(
+        make_mock_run("run-0"), mock_probe_registry, mock_decider_registry, cache
+    )
+
+    assert [item["value"] for item in result["scene_items"]] == ["new-scene"]
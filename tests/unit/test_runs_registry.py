@@ -0,0 +1,118 @@
+"""Tests for batched run decisions in RunsRegistry."""
+
+import asyncio
+
+from align_utils.models import (
+    ADMResult,
+    AlignmentTarget,
+    ChoiceInfo,
+    Decision,
+    InputData,
+)
+
+from align_app.adm.decider.types import DeciderParams
+from align_app.adm.run_models import Run, RunDecision
+from align_app.app import runs_core
+from align_app.app.decision_store import DecisionStore
+from align_app.app.runs_registry import RunsRegistry
+
+
+def make_decision(choice: str) -> RunDecision:
+    return RunDecision(
+        adm_result=ADMResult(
+            decision=Decision(unstructured=choice, justification="because"),
+            choice_info=ChoiceInfo(choice_id=choice),
+        ),
+        choice_index=0,
+    )
+
+
+def make_run(run_id: str, probe_id: str = "scenario.scene", seed: int = 0) -> Run:
+    return Run(
+        id=run_id,
+        probe_id=probe_id,
+        decider_name="pipeline_baseline",
+        llm_backbone_name="mistral",
+        system_prompt="",
+        decider_params=DeciderParams(
+            scenario_input=InputData(
+                scenario_id="scenario",
+                state="text",
+                choices=[{"unstructured": "A"}, {"unstructured": "B"}],
+            ),
+            alignment_target=AlignmentTarget(id="baseline", kdma_values=[]),
+            resolved_config={"model": "m", "seed": seed},
+        ),
+    )
+
+
+class Probe:
+    choices = [{"unstructured": "A"}, {"unstructured": "B"}]
+
+
+class MockProbeRegistry:
+    def get_probe(self, probe_id):
+        if probe_id != "scenario.scene":
+            raise ValueError(f"Probe ID {probe_id} not found.")
+        return Probe()
+
+
+def test_batch_skips_missing_runs_and_probes_and_shared_work(monkeypatch):
+    fetched = []
+
+    async def fake_fetch_decisions(runs, probe_choices):
+        fetched.append([run.id for run in runs])
+        return [make_decision("A") for _ in runs]
+
+    monkeypatch.setattr(runs_core, "fetch_decisions", fake_fetch_decisions)
+    registry = RunsRegistry(MockProbeRegistry(), None)
+    for run in (
+        make_run("a"),
+        make_run("same-as-a"),
+        make_run("b", seed=1),
+        make_run("orphan", probe_id="deleted.scene"),
+    ):
+        registry.add_run(run)
+
+    decided = asyncio.run(
+        registry.execute_run_decisions(["a", "same-as-a", "b", "orphan", "missing"])
+    )
+
+    assert fetched == [["a", "b"]]
+    assert [run.id for run in decided] == ["a", "same-as-a", "b"]
+    assert all(run.decision == make_decision("A") for run in decided)
+    assert asyncio.run(registry.execute_run_decision("orphan")) is None
+
+
+def test_batch_reads_the_store_once_for_uncached_runs(tmp_path, monkeypatch):
+    fetched = []
+
+    async def fake_fetch_decisions(runs, probe_choices):
+        fetched.append([run.id for run in runs])
+        return [make_decision("B") for _ in runs]
+
+    monkeypatch.setattr(runs_core, "fetch_decisions", fake_fetch_decisions)
+    store = DecisionStore(tmp_path / "decisions.sqlite")
+    stored = make_run("stored")
+    store.put(stored.compute_cache_key(), make_decision("A"))
+    reads = []
+    get_many = store.get_many
+
+    def counting_get_many(keys):
+        reads.append(keys)
+        return get_many(keys)
+
+    monkeypatch.setattr(store, "get_many", counting_get_many)
+    registry = RunsRegistry(MockProbeRegistry(), None, store)
+    for run in (stored, make_run("new", seed=1), make_run("other", seed=2)):
+        registry.add_run(run)
+
+    decided = asyncio.run(registry.execute_run_decisions(["stored", "new", "other"]))
+
+    assert len(reads) == 1 and len(reads[0]) == 3
+    assert fetched == [["new", "other"]]
+    assert [run.decision for run in decided] == [
+        make_decision("A"),
+        make_decision("B"),
+        make_decision("B"),
+    ]
@@ -1,7 +1,32 @@
-from align_app.app.runs_table_filter import compute_filter_options, filter_rows
+from align_app.app.runs_table_filter import NaturalSortedValues
 
 
-def test_compute_filter_options_extracts_unique_values():
+def make_table_filter():
+    from trame.app import get_server
+    from align_app.app.runs_table_filter import RunsTableFilter
+
+    server = get_server(f"table-filter-{id(object())}", client_type="vue3")
+    return RunsTableFilter(server), server.state
+
+
+def filter_options(rows):
+    table_filter, state = make_table_filter()
+    table_filter.set_all_rows([{"id": str(i), **row} for i, row in enumerate(rows)])
+    return state
+
+
+def option_values(state, name):
+    return [option["value"] for option in state[f"runs_table_{name}_options"]]
+
+
+def option_counts(state, name):
+    return {
+        option["value"]: option["count"]
+        for option in state[f"runs_table_{name}_options"]
+    }
+
+
+def test_filter_options_extracts_unique_values():
     rows = [
         {
             "scenario_id": "scenario_a",
@@ -21,17 +46,17 @@ def test_compute_filter_options_extracts_unique_values():
         },
     ]
 
-    options = compute_filter_options(rows)
+    state = filter_options(rows)
 
-    assert options["runs_table_scenario_options"] == ["scenario_a", "scenario_b"]
-    assert options["runs_table_scene_options"] == ["scene_1", "scene_2"]
-    assert options["runs_table_decider_options"] == ["decider_x", "decider_y"]
-    assert options["runs_table_llm_options"] == ["llm_1", "llm_2"]
-    assert options["runs_table_alignment_options"] == ["aligned", "not aligned"]
-    assert options["runs_table_decision_options"] == ["choice A", "choice B"]
+    assert option_values(state, "scenario") == ["scenario_a", "scenario_b"]
+    assert option_values(state, "scene") == ["scene_1", "scene_2"]
+    assert option_values(state, "decider") == ["decider_x", "decider_y"]
+    assert option_values(state, "llm") == ["llm_1", "llm_2"]
+    assert option_values(state, "alignment") == ["aligned", "not aligned"]
+    assert option_values(state, "decision") == ["choice A", "choice B"]
 
 
-def test_compute_filter_options_sorts_values():
+def test_filter_options_sorts_values():
     rows = [
         {
             "scenario_id": "zebra",
@@ -51,12 +76,12 @@ def test_compute_filter_options_sorts_values():
         },
     ]
 
-    options = compute_filter_options(rows)
+    state = filter_options(rows)
 
-    assert options["runs_table_scenario_options"] == ["alpha", "zebra"]
+    assert option_values(state, "scenario") == ["alpha", "zebra"]
 
 
-def test_compute_filter_options_deduplicates_values():
+def test_filter_options_deduplicates_values():
     rows = [
         {
             "scenario_id": "same",
@@ -76,87 +101,132 @@ def test_compute_filter_options_deduplicates_values():
         },
     ]
 
-    options = compute_filter_options(rows)
+    state = filter_options(rows)
 
-    assert options["runs_table_scenario_options"] == ["same"]
+    assert state.runs_table_scenario_options == [
+        {"title": "same (2)", "value": "same", "count": 2}
+    ]
 
 
-def test_filter_rows_empty_filters_returns_all():
-    rows = [
-        {"scenario_id": "a", "scene_id": "1"},
-        {"scenario_id": "b", "scene_id": "2"},
-    ]
+def table_row(row_id, decider="decider_x"):
+    return {"id": row_id, "scenario_id": "s", "decider_name": decider}
 
-    filters = [([], "scenario_id"), ([], "scene_id")]
-    result = filter_rows(rows, filters)
 
-    assert len(result) == 2
+def test_update_rows_refreshes_the_visible_page():
+    table_filter, state = make_table_filter()
+    table_filter.set_all_rows([table_row("a"), table_row("b")])
 
+    table_filter.update_rows([table_row("c"), table_row("a", "decider_y")], ["b"])
 
-def test_filter_rows_single_filter():
-    rows = [
-        {"scenario_id": "a", "scene_id": "1"},
-        {"scenario_id": "b", "scene_id": "2"},
-        {"scenario_id": "a", "scene_id": "3"},
-    ]
+    assert state.runs_table_items == [table_row("a", "decider_y"), table_row("c")]
+    assert state.runs_table_items_length == 2
+    assert option_values(state, "decider") == ["decider_x", "decider_y"]
+
+
+def test_filters_apply_to_updated_rows():
+    table_filter, state = make_table_filter()
+    table_filter.set_all_rows([table_row("a"), table_row("b")])
+    state.runs_table_filter_decider = ["decider_x"]
+    table_filter._on_filter_change()
 
-    filters = [(["a"], "scenario_id")]
-    result = filter_rows(rows, filters)
+    table_filter.update_rows([table_row("a", "decider_y"), table_row("c", "other")])
 
-    assert len(result) == 2
-    assert all(r["scenario_id"] == "a" for r in result)
+    assert state.runs_table_items == [table_row("b")]
 
 
-def test_filter_rows_multiple_values_in_filter():
+def test_pages_are_sorted_and_searched_on_the_server():
+    table_filter, state = make_table_filter()
     rows = [
-        {"scenario_id": "a", "scene_id": "1"},
-        {"scenario_id": "b", "scene_id": "2"},
-        {"scenario_id": "c", "scene_id": "3"},
+        {**table_row(f"run{i}"), "scenario_id": f"scenario-{i}", "probe_text": "x"}
+        for i in range(1, 13)
     ]
+    rows[4]["probe_text"] = "Patient is BLEEDING"
+    table_filter.set_all_rows(rows)
 
-    filters = [(["a", "b"], "scenario_id")]
-    result = filter_rows(rows, filters)
+    table_filter.update_options(
+        "panel",
+        {
+            "page": 2,
+            "itemsPerPage": 5,
+            "sortBy": [{"key": "scenario_id", "order": "desc"}],
+        },
+    )
+
+    assert [row["id"] for row in state.runs_table_items] == [
+        "run7",
+        "run6",
+        "run5",
+        "run4",
+        "run3",
+    ]
+    assert state.runs_table_items_length == 12
 
-    assert len(result) == 2
-    scenarios = {r["scenario_id"] for r in result}
-    assert scenarios == {"a", "b"}
+    state.runs_table_search = "bleeding"
+    table_filter._on_filter_change()
 
+    assert [row["id"] for row in state.runs_table_items] == ["run5"]
+    assert state.runs_table_page == 1
 
-def test_filter_rows_multiple_filters_combine_with_and():
-    rows = [
-        {"scenario_id": "a", "scene_id": "1"},
-        {"scenario_id": "a", "scene_id": "2"},
-        {"scenario_id": "b", "scene_id": "1"},
-    ]
 
-    filters = [(["a"], "scenario_id"), (["1"], "scene_id")]
-    result = filter_rows(rows, filters)
+def test_filtered_ids_span_every_page():
+    table_filter, state = make_table_filter()
+    table_filter.set_all_rows(
+        [table_row(f"x{i}") for i in range(60)] + [table_row("y", "decider_y")]
+    )
+    state.runs_table_filter_decider = ["decider_x"]
+    table_filter._on_filter_change()
 
-    assert len(result) == 1
-    assert result[0]["scenario_id"] == "a"
-    assert result[0]["scene_id"] == "1"
+    assert len(state.runs_table_items) == 50
+    assert table_filter.filtered_ids() == [f"x{i}" for i in range(60)]
 
 
-def test_filter_rows_no_matches_returns_empty():
-    rows = [
-        {"scenario_id": "a", "scene_id": "1"},
-        {"scenario_id": "b", "scene_id": "2"},
-    ]
+def test_filter_options_are_counted_under_the_other_filters():
+    table_filter, state = make_table_filter()
+    table_filter.set_all_rows(
+        [
+            {**table_row("a", "decider_x"), "llm_backbone_name": "llm_1"},
+            {**table_row("b", "decider_x"), "llm_backbone_name": "llm_2"},
+            {**table_row("c", "decider_y"), "llm_backbone_name": "llm_1"},
+            {**table_row("d", "decider_y"), "llm_backbone_name": "llm_1"},
+        ]
+    )
+    assert option_counts(state, "llm") == {"llm_1": 3, "llm_2": 1}
 
-    filters = [(["nonexistent"], "scenario_id")]
-    result = filter_rows(rows, filters)
+    state.runs_table_filter_decider = ["decider_y"]
+    table_filter._on_filter_change()
 
-    assert len(result) == 0
+    # A column's own selection does not narrow its options
+    assert option_counts(state, "decider") == {"decider_x": 2, "decider_y": 2}
+    assert option_counts(state, "llm") == {"llm_1": 2}
 
+    state.runs_table_filter_llm = ["llm_2"]
+    table_filter._on_filter_change()
+
+    assert option_counts(state, "decider") == {"decider_x": 1, "decider_y": 0}
+    # Selected values stay listed even when nothing else matches them
+    assert option_counts(state, "llm") == {"llm_1": 2, "llm_2": 0}
+
+
+def test_filter_options_follow_row_updates():
+    table_filter, state = make_table_filter()
+    table_filter.set_all_rows(
+        [table_row("a", "decider_2"), table_row("b", "decider_10")]
+    )
+
+    table_filter.update_rows([table_row("c", "decider_1")], ["b"])
+
+    assert option_counts(state, "decider") == {"decider_1": 1, "decider_2": 1}
+
+    table_filter.update_rows([table_row("c", "decider_2")])
+
+    assert option_counts(state, "decider") == {"decider_2": 2}
 
-def test_filter_rows_handles_missing_keys():
-    rows = [
-        {"scenario_id": "a"},
-        {"scenario_id": "b", "scene_id": "1"},
-    ]
 
-    filters = [(["1"], "scene_id")]
-    result = filter_rows(rows, filters)
+def test_natural_sorted_values_insert_in_order():
+    values = NaturalSortedValues(["item10", "item2", ""])
+    values.add("item1")
+    values.add("Item1")
+    values.add("item2")
+    values.discard("item10")
 
-    assert len(result) == 1
-    assert result[0]["scenario_id"] == "b"
+    assert list(values) == ["Item1", "item1", "item2"]
@@ -0,0 +1,100 @@
+"""Tests for the scenario search box."""
+
+from align_utils.models import InputData, InputOutputItem
+from trame.app import get_server
+
+from align_app.adm.probe import Probe
+from align_app.app.search import SearchController
+from align_app.app.search_index import SearchIndex
+
+
+def make_probe(scenario_id, scene_id, text, choices=()):
+    item = InputOutputItem(
+        input=InputData(
+            scenario_id=scenario_id,
+            full_state={"meta_info": {"scene_id": scene_id}, "unstructured": text},
+            choices=[{"unstructured": choice} for choice in choices],
+        )
+    )
+    return Probe.from_input_output_item(item)
+
+
+class FakeProbeRegistry:
+    def __init__(self, probes):
+        self.probes = {probe.probe_id: probe for probe in probes}
+        self.listeners = []
+
+    def get_probes(self):
+        return self.probes
+
+    def on_probes_added(self, listener):
+        self.listeners.append(listener)
+
+    def add_probes(self, probes):
+        added = {probe.probe_id: probe for probe in probes}
+        self.probes.update(added)
+        for listener in self.listeners:
+            listener(added)
+
+
+def make_search(probes):
+    server = get_server(f"search-{id(object())}", client_type="vue3")
+    registry = FakeProbeRegistry(probes)
+    return SearchController(server, registry), registry, server.state
+
+
+def result_ids(state):
+    return [result["id"] for result in state.search_results]
+
+
+def test_search_matches_scene_text_and_choices():
+    search, _, state = make_search(
+        [
+            make_probe("desert", "1", "Patient is BLEEDING heavily"),
+            make_probe("jungle", "2", "Quiet night", ["Apply tourniquet"]),
+        ]
+    )
+
+    search.update_search_results("bleeding")
+    assert result_ids(state) == ["desert.1"]
+
+    search.update_search_results("Tourniquet!")
+    assert result_ids(state) == ["jungle.2"]
+
+
+def test_added_probes_become_searchable():
+    search, registry, state = make_search([make_probe("desert", "1", "Quiet")])
+
+    search.update_search_results("evacuation")
+    assert result_ids(state) == [None]
+
+    registry.add_probes([make_probe("desert", "2", "Helicopter evacuation")])
+    search.update_search_results("evacuation")
+
+    assert result_ids(state) == ["desert.2"]
+
+
+def test_index_candidates_include_misspelled_tokens():
+    index = SearchIndex()
+    index.add("a", "patient bleeding from leg")
+    index.add("b", "apply tourniquet above wound")
+    index.add("c", "quiet night")
+
+    assert index.candidates(["tourniqet"]) == ["b"]
+    assert index.candidates(["night", "bleeding"]) == ["a", "c"]
+    assert index.candidates(["helicopter"]) == []
+
+    index.add("c", "helicopter arrives")
+    assert index.candidates(["helicopter"]) == ["c"]
+    assert index.candidates(["night"]) == []
+
+
+def test_repeated_queries_are_served_from_cache():
+    search, _, state = make_search([make_probe("desert", "1", "Patient is bleeding")])
+    search.update_search_results("bleeding")
+    first = state.search_results
+
+    search._corpus.clear()
+    search.update_search_results("  BLEEDING ")
+
+    assert state.search_results == first
@@ -0,0 +1,68 @@
+"""Tests for the startup profile and lazily imported dependencies."""
+
+import subprocess
+import sys
+import time
+
+from align_app.app import startup_profile
+from align_app.app.startup_profile import StartupProfile
+
+
+def test_imports_and_phases_are_timed(tmp_path, monkeypatch):
+    (tmp_path / "slow_startup_pkg").mkdir()
+    (tmp_path / "slow_startup_pkg" / "__init__.py").write_text(
+        "import time\ntime.sleep(0.02)\nfrom . import child\n"
+    )
+    (tmp_path / "slow_startup_pkg" / "child.py").write_text(
+        "import time\ntime.sleep(0.03)\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    profile = StartupProfile()
+    monkeypatch.setattr(sys, "meta_path", [profile, *sys.meta_path])
+
+    with profile.phase("load"):
+        import slow_startup_pkg  # noqa: F401
+    with profile.phase("idle"):
+        time.sleep(0.01)
+
+    own, total = profile.imports["slow_startup_pkg"]
+    child_own, child_total = profile.imports["slow_startup_pkg.child"]
+    assert child_own == child_total >= 0.03
+    assert total >= own + child_total >= 0.05
+    assert [name for name, _ in profile.phases] == ["load", "idle"]
+    report = profile.format()
+    assert "slow_startup_pkg" in report
+    assert "(2 modules)" in report
+
+    loader = sys.modules["slow_startup_pkg"].__spec__.loader
+    assert "exec_module" in vars(loader)
+    profile.stop()
+    assert "exec_module" not in vars(loader)
+    assert profile not in sys.meta_path
+    sys.modules.pop("slow_startup_pkg.child")
+    sys.modules.pop("slow_startup_pkg")
+
+
+def test_phases_are_free_without_profiling():
+    with startup_profile.phase("anything"):
+        pass
+
+    assert startup_profile.requested(["--port", "8080"]) is False
+    assert startup_profile.requested(["--profile-startup"]) is True
+
+
+def test_app_import_defers_hydra_and_align_system():
+    heavy = ["hydra", "omegaconf", "align_system"]
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, align_app.app.core; "
+            f"print([m for m in {heavy!r} if m in sys.modules])",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "[]"
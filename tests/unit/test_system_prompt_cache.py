@@ -0,0 +1,73 @@
+"""Tests for cached system prompt generation."""
+
+import pytest
+from align_utils.models import AlignmentTarget, KDMAValue
+
+from align_app.adm import decider_definitions
+from align_app.adm.decider_definitions import get_system_prompt
+
+DATASETS = {"phase2": {"probes": {"scenario.scene": object()}}}
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    decider_definitions._system_prompts.clear()
+    yield
+    decider_definitions._system_prompts.clear()
+
+
+def make_deciders(calls, **resolved_config):
+    def generate(config, alignment):
+        calls.append((config, alignment))
+        return f"prompt for {alignment['id']} with {config}"
+
+    return {
+        "edited": {
+            "edited_config": True,
+            "resolved_config": resolved_config,
+            "system_prompt_generator": generate,
+        }
+    }
+
+
+def target(value):
+    return AlignmentTarget(
+        id=f"affiliation-{value}",
+        kdma_values=[KDMAValue(kdma="affiliation", value=value)],
+    )
+
+
+def prompt(deciders, alignment_target, probe_id="scenario.scene"):
+    return get_system_prompt(
+        decider="edited",
+        alignment_target=alignment_target,
+        probe_id=probe_id,
+        all_deciders=deciders,
+        datasets=DATASETS,
+    )
+
+
+def test_prompts_are_generated_once_per_alignment_target():
+    calls = []
+    deciders = make_deciders(calls, seed=1)
+
+    first = prompt(deciders, target(0.5))
+    assert prompt(deciders, target(0.5)) == first
+    assert len(calls) == 1
+
+    assert prompt(deciders, target(0.7)) != first
+    assert len(calls) == 2
+
+
+def test_decider_settings_are_part_of_the_key():
+    calls = []
+
+    prompt(make_deciders(calls, seed=1), target(0.5))
+    prompt(make_deciders(calls, seed=2), target(0.5))
+
+    assert [config for config, _ in calls] == [{"seed": 1}, {"seed": 2}]
+
+
+def test_unknown_probe_is_an_error():
+    with pytest.raises(ValueError, match="not found in datasets"):
+        prompt(make_deciders([], seed=1), target(0.5), probe_id="missing")